@@ -13,10 +13,24 @@ def create_app(settings: ApiSettings, router: APIRouter) -> FastAPI:
     @asynccontextmanager
     async def _lifespan(_app: FastAPI):
         # Qualquer ação necessária na inicialização
-        ...
+        container = getattr(_app, "container", None)
+        if container is not None:
+            container.queued_logging().start()
+            # Escuta as invalidações do cache local publicadas pelos outros processos
+            container.cache_invalidation_bus().start()
+            # Carrega a descoberta e as chaves do OpenID antes da primeira requisição autenticada
+            keycloak_adapter = container.keycloak_adapter()
+            await keycloak_adapter.prewarm()
+            # Mantém as chaves públicas do OpenID atualizadas (rotação de chaves no Keycloak)
+            keycloak_adapter.start_background_refresh()
         yield
         # Limpando a bagunça antes de terminar
-        ...
+        if container is not None:
+            await container.cache_invalidation_bus().stop()
+            await container.keycloak_adapter().aclose()
+            await container.keycloak_http_client().aclose()
+            # Por último, para que os logs do encerramento também sejam escritos
+            container.queued_logging().stop()
 
 
     app = FastAPI(
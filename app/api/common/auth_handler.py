@@ -18,7 +18,6 @@ if TYPE_CHECKING:
 
 from app.models.base import BaseModel, UserModel
 
-import traceback
 from logging import getLogger
 
 logger = getLogger(__name__)
@@ -51,14 +50,11 @@ async def do_auth(
     """
 
     try:
-        # Log da requisição
-        logger.info(f"Tentando autenticar: {request.url}")
-        logger.info(f"Headers: {dict(request.headers)}")
-
+        # O log de acesso (AccessLogMiddleware) já registra a requisição, com os headers sensíveis ofuscados
         info_token = await openid_adapter.validate_token(token)
     except OAuthException as exception:
-        logger.error(f"Erro na autenticação: {type(exception).__name__}: {str(exception)}")
-        logger.error(f"Traceback: {traceback.format_exc()}")
+        logger.warning("Erro na autenticação: %s: %s", type(exception).__name__, exception)
+        logger.debug("Detalhes do erro na autenticação", exc_info=True)
         # XXX Poderíamos especializar as exceções
         raise UnauthorizedException from exception
 
@@ -1,12 +1,13 @@
 from typing import TYPE_CHECKING
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, FastAPI
+from fastapi import APIRouter, Depends, FastAPI, Response
 from starlette import status
 
 from app.container import Container
 
 if TYPE_CHECKING:
+    from app.common.metrics import MetricsRegistry
     from app.services.health_check import HealthCheckService
 
 
@@ -47,4 +48,18 @@ def add_health_check_router(app: FastAPI, prefix: str = "/api") -> None:
         # XXX Fixado.
         return {"version": "0.0.2"}
 
+    @health_router.get(
+        path="/metrics",
+        include_in_schema=False,
+        operation_id="get_metrics",
+        name="Métricas da aplicação",
+        description="Métricas do processo (acertos e faltas dos caches, latências) no formato texto do Prometheus",
+        status_code=200,
+    )
+    @inject
+    async def metrics(
+        registry: "MetricsRegistry" = Depends(Provide[Container.metrics_registry]),
+    ):
+        return Response(content=registry.render(), media_type=registry.CONTENT_TYPE)
+
     app.include_router(health_router)
@@ -24,12 +24,22 @@ class NavigationLinks(BaseModel):
         has_next: bool = False,
         filters: str | None = None,
         sorting: str | None = None,
+        cursor: str | None = None,
+        next_cursor: str | None = None,
     ):
         filters = f"&{filters}" if filters else ""
         sorting = f"&_sort={sorting}" if sorting else ""
         query_params = f"{filters}{sorting}"
         request_path = request_path or ""
         prev_offset = offset - limit if offset - limit >= 0 else 0
+        if cursor is not None or next_cursor is not None:
+            # Paginação por cursor (keyset): só avança, a página anterior volta ao início da listagem
+            current = f"{request_path}?_cursor={cursor}" if cursor else f"{request_path}?_offset={offset}"
+            return cls(
+                previous=f"{request_path}?_offset=0&_limit={limit}{query_params}",
+                next=(f"{request_path}?_cursor={next_cursor}&_limit={limit}{query_params}" if has_next else None),
+                current=f"{current}&_limit={limit}{query_params}",
+            )
         return cls(
             previous=(f"{request_path}?_offset={prev_offset}&_limit={limit}{query_params}"),
             next=(f"{request_path}?_offset={offset + limit}&_limit={limit}{query_params}" if has_next else None),
@@ -1,6 +1,9 @@
-from typing import Sequence
+import base64
+import binascii
+from typing import Any, Callable, Sequence
 from urllib.parse import urlencode
 
+from bson import json_util
 from fastapi import Query
 from pydantic import BaseModel, Field
 from starlette.requests import Request
@@ -14,6 +17,35 @@ PAGE_DEFAULT_LIMIT = api_settings.pagination.default_limit
 PAGE_MAX_LIMIT = api_settings.pagination.max_limit
 
 
+def encode_cursor(values: dict) -> str:
+    """
+    Gera o cursor opaco com os valores da chave de ordenação do último item da página.
+    """
+    raw = json_util.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Recupera os valores da chave de ordenação gravados no cursor.
+
+    :raises BadRequestException: Se o cursor não foi gerado pela API.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json_util.loads(raw)
+    except (binascii.Error, ValueError, TypeError):
+        values = None
+    if not isinstance(values, dict) or not values:
+        # Import local para evitar import circular entre exceções e schemas
+        from app.common.exceptions import BadRequestException
+
+        raise BadRequestException(
+            details=[{"message": "Cursor de paginação inválido", "location": "query", "field": "_cursor"}]
+        )
+    return values
+
+
 class Paginator(BaseModel):
     request_path: str = Field(...)
     limit: int = Field(
@@ -23,6 +55,7 @@ class Paginator(BaseModel):
     )
     offset: int = Field(default=0, ge=0)
     sort: str | None = None
+    cursor: str | None = None
 
     def get_sort_order(self) -> dict[str, int] | None:
         if not self.sort:
@@ -39,18 +72,28 @@ class Paginator(BaseModel):
 
     def paginate(
         self,
-        results: Sequence[BaseModel] | None = None,
+        results: Sequence[BaseModel | dict] | None = None,
         filters: dict | None = None,
+        cursor_builder: Callable[[Any], str] | None = None,
+        total: int | None = None,
     ) -> ListResponse:
+        """
+        Monta a resposta paginada. `results` deve vir com até limit + 1 itens, o excedente indica a próxima página.
+
+        :param cursor_builder: Gera o cursor a partir do último item da página. Quando informado,
+            o link da próxima página usa _cursor (keyset) no lugar de _offset.
+        :param total: Quantidade total de registros, quando conhecida.
+        """
         count = len(results) if results else 0
         results = results[: self.limit] if results else []
         has_next = count > self.limit
+        next_cursor = cursor_builder(results[-1]) if cursor_builder and has_next else None
         filters_str = (
             urlencode(
                 {
                     attr: value
                     for attr, value in filters.items()
-                    if attr not in ("limit", "offset") and value is not None
+                    if attr not in ("limit", "offset", "cursor") and value is not None
                 }
             )
             if filters
@@ -63,6 +106,7 @@ class Paginator(BaseModel):
                 limit=self.limit,
                 offset=self.offset,
                 count=count - 1 if has_next else count,
+                total=total,
             ),
             links=NavigationLinks.build(
                 request_path=self.request_path,
@@ -71,6 +115,8 @@ class Paginator(BaseModel):
                 has_next=has_next,
                 filters=filters_str,
                 sorting=self.sort,
+                cursor=self.cursor,
+                next_cursor=next_cursor,
             ),
         )
 
@@ -97,5 +143,12 @@ def get_request_pagination(
             " Ex: name:asc,email:desc."
         ),
     ),
+    _cursor: str | None = Query(
+        default=None,
+        description=(
+            "Cursor opaco retornado no link next. Quando informado, a página é buscada a partir"
+            " do último item da página anterior e o _offset é ignorado."
+        ),
+    ),
 ):
-    return Paginator(request_path=request.url.path, limit=_limit, offset=_offset, sort=_sort)
+    return Paginator(request_path=request.url.path, limit=_limit, offset=_offset, sort=_sort, cursor=_cursor)
@@ -28,6 +28,7 @@ class PageResponse(BaseModel):
         description=("Posição do registro de referência, a partir dele serão retornados os próximos N registros."),
     )
     count: int | None = Field(default=0, description="Quantidade de registros que foi retornada nessa página.")
+    total: int | None = Field(default=None, description="Quantidade total de registros, quando solicitada (_count).")
     max_limit: int | None = Field(
         default=PAGE_MAX_LIMIT,
         description="Refere-se ao valor máximo que pode ser utilizado no campo limit.",
@@ -0,0 +1,113 @@
+import logging
+import random
+import time
+from typing import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.access")
+
+OBFUSCATED_VALUE = "***"
+
+# Usados quando access_log_headers_to_obfuscate não é configurado
+DEFAULT_HEADERS_TO_OBFUSCATE = {"authorization", "cookie", "set-cookie", "proxy-authorization", "x-api-key"}
+
+
+class AccessLogMiddleware:
+    """
+    Middleware ASGI que emite uma linha de log estruturada por requisição amostrada.
+
+    A amostragem é decidida antes de montar o registro. Respostas 5xx são sempre registradas, em WARNING,
+    mesmo com o nível INFO desligado; as demais só são amostradas quando INFO está habilitado.
+    Só entram os headers de `headers_to_log`, com os de `headers_to_obfuscate` mascarados.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        ignored_urls: Iterable[str] | None = None,
+        headers_to_log: Iterable[str] | None = None,
+        headers_to_obfuscate: Iterable[str] | None = None,
+        sample_rate: float = 1.0,
+        route_sample_rates: dict[str, float] | None = None,
+    ):
+        self.app = app
+        self.ignored_urls = set(ignored_urls or ())
+        self.headers_to_log = {header.lower() for header in headers_to_log or ()}
+        self.headers_to_obfuscate = (
+            {header.lower() for header in headers_to_obfuscate}
+            if headers_to_obfuscate is not None
+            else DEFAULT_HEADERS_TO_OBFUSCATE
+        )
+        self.sample_rate = sample_rate
+        # Prefixos mais longos primeiro: a regra mais específica vence
+        self.route_sample_rates = sorted(
+            (route_sample_rates or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.ignored_urls or not logger.isEnabledFor(logging.WARNING):
+            await self.app(scope, receive, send)
+            return
+
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # O nível só é conhecido depois do status: 5xx nunca passa pela amostragem
+            level = logging.WARNING if status_code >= 500 else logging.INFO
+            if level == logging.WARNING or (logger.isEnabledFor(logging.INFO) and self.is_sampled(scope["path"])):
+                self._log(scope, status_code, time.perf_counter() - started_at, level)
+
+    def sample_rate_for(self, path: str) -> float:
+        for prefix, rate in self.route_sample_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.sample_rate
+
+    def is_sampled(self, path: str) -> bool:
+        rate = self.sample_rate_for(path)
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        return random.random() < rate
+
+    def filter_headers(self, raw_headers: Iterable[tuple[bytes, bytes]]) -> dict[str, str]:
+        headers = {}
+        for raw_name, raw_value in raw_headers:
+            name = raw_name.decode("latin-1").lower()
+            if name not in self.headers_to_log:
+                continue
+            headers[name] = OBFUSCATED_VALUE if name in self.headers_to_obfuscate else raw_value.decode("latin-1")
+        return headers
+
+    def _log(self, scope: Scope, status_code: int, elapsed_seconds: float, level: int = logging.INFO) -> None:
+        duration_ms = round(elapsed_seconds * 1000, 1)
+        access_log = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "query": scope.get("query_string", b"").decode("latin-1"),
+            "status": status_code,
+            "duration_ms": duration_ms,
+        }
+        if self.headers_to_log:
+            access_log["headers"] = self.filter_headers(scope["headers"])
+        # Mensagem com argumentos: a formatação só acontece no handler
+        logger.log(
+            level,
+            "%s %s %s %.1fms",
+            scope["method"],
+            scope["path"],
+            status_code,
+            duration_ms,
+            extra={"access_log": access_log},
+        )
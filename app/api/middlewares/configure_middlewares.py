@@ -4,6 +4,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 
 from app.api.common.trace import get_trace_id
+from app.api.middlewares.access_log import AccessLogMiddleware
 
 from ...settings import ApiSettings
 
@@ -44,4 +45,14 @@ def configure_middlewares(app: FastAPI, settings: ApiSettings) -> None:
 
     app.add_middleware(GZipMiddleware, minimum_size=1000)
 
-    app.add_middleware(TraceIdMiddleware)
\ No newline at end of file
+    app.add_middleware(TraceIdMiddleware)
+
+    # Mais externo: mede a requisição inteira
+    app.add_middleware(
+        AccessLogMiddleware,
+        ignored_urls=settings.access_log_ignored_urls,
+        headers_to_log=settings.access_log_headers_to_log,
+        headers_to_obfuscate=settings.access_log_headers_to_obfuscate,
+        sample_rate=settings.access_log_sample_rate,
+        route_sample_rates=settings.access_log_route_sample_rates,
+    )
\ No newline at end of file
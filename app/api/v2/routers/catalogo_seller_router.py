@@ -1,42 +1,63 @@
 from typing import TYPE_CHECKING
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, Header, status
-
-from app.api.common.auth_handler import do_auth
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from pydantic import ValidationError
 
 from app.api.common.schemas import ListResponse, Paginator, get_request_pagination
 
-from ..schemas.catalogo_schema import CatalogoCreate, CatalogoResponse, CatalogoUpdate
+from ..schemas.catalogo_schema import (
+    CatalogoBatchGetItem,
+    CatalogoBatchGetResponse,
+    CatalogoBulkItemResponse,
+    CatalogoBulkResponse,
+    CatalogoCreate,
+    CatalogoResponse,
+    CatalogoUpdate,
+)
 from . import CATALOGO_PREFIX
 
 from app.api.common.auth_handler import UserAuthInfo, do_auth, get_current_user
+from app.common.exceptions import ForbiddenException
 
-from app.models import CatalogoModel
+from app.models import CatalogoBulkItemResult, CatalogoModel, CountMode, NameSearchMode
+from app.settings import api_settings
 
 if TYPE_CHECKING:
     from app.services import CatalogoService
 
 MSG_SELLER_IDENTIFICATION = "Identificador do vendedor"
+MSG_FIELDS = "Campos a retornar, separados por vírgula. Ex: sku,name"
+BULK_MAX_ITEMS = api_settings.bulk.max_items
+BULK_STREAM_BATCH_SIZE = api_settings.bulk.stream_batch_size
+BATCH_GET_MAX_ITEMS = api_settings.bulk.batch_get_max_items
 
 router = APIRouter(prefix=CATALOGO_PREFIX, tags=["CRUD Catálogo v2 - MongoDB"], dependencies=[Depends(do_auth)])
 
-#BUSCA PRODUTO POR SELLER_ID PAGINADO
+
+# BUSCA PRODUTO POR SELLER_ID PAGINADO
 @router.get(
     "",
     response_model=ListResponse[CatalogoResponse],
     status_code=status.HTTP_200_OK,
     summary="Buscar produtos por filtro",
-    description=
-    """
+    description="""
     Retorna os produtos do seller, podendo ser filtrado pelo nome (like).
 
         Parâmetros:
-            
-            - name_like: Filtro pelo nome.
+
+            - name_like: Filtro pelo nome (sem diferenciar maiúsculas e acentos).
+            - name_mode: Modo da busca pelo nome: prefix (início do nome, padrão),
+              word (palavras do nome) ou contains (trecho em qualquer posição, mais lento).
             - _limit: Limite de resultados por página.
             - _offset: Deslocamento para paginação.
-            - _sort: Ordenação dos resultados.
+            - _sort: Ordenação dos resultados, por um dos campos name, sku, created_at ou updated_at.
+            - _cursor: Cursor da próxima página, retornado em meta.links.next.
+            - _fields: Campos a retornar, separados por vírgula (ex.: sku,name).
+            - _count: Inclui o total de produtos em meta.page.total: estimated (contagem em cache)
+              ou exact (contagem no banco).
             - seller_id: Identificador do vendedor.
 
         Retorna:
@@ -48,27 +69,51 @@ router = APIRouter(prefix=CATALOGO_PREFIX, tags=["CRUD Catálogo v2 - MongoDB"],
 )
 @inject
 async def get_by_seller_id_paginado(
-    
-    seller_id: str = Header(...,alias="x-seller-id", description= MSG_SELLER_IDENTIFICATION),
-    name_like: str = None,  
+
+    seller_id: str = Header(..., alias="x-seller-id", description=MSG_SELLER_IDENTIFICATION),
+    name_like: str = None,
+    name_mode: NameSearchMode = Query(default=NameSearchMode.PREFIX, description="Modo da busca pelo nome"),
+    _count: CountMode | None = Query(default=None, description="Inclui o total de produtos na resposta"),
+    _fields: str | None = Query(default=None, description=MSG_FIELDS),
     paginator: Paginator = Depends(get_request_pagination),
     catalogo_service: "CatalogoService" = Depends(Provide["catalogo_service"]),
 ):
+    fields = catalogo_service.parse_fields(_fields)
     results = await catalogo_service.find_by_filter(
         seller_id=seller_id,
         paginator=paginator,
-        name_like=name_like
+        name_like=name_like,
+        name_mode=name_mode,
+        fields=fields,
+    )
+    total = None
+    if _count:
+        total = await catalogo_service.count_by_filter(
+            seller_id=seller_id,
+            name_like=name_like,
+            name_mode=name_mode,
+            count_mode=_count,
+        )
+    response = paginator.paginate(
+        results=results,
+        filters={"name_like": name_like, "name_mode": name_mode, "_count": _count, "_fields": _fields},
+        cursor_builder=lambda catalogo: catalogo_service.build_cursor(catalogo, paginator),
+        total=total,
     )
-    return ListResponse(results=results, meta=None)
+    if fields:
+        # Resposta enxuta: documentos projetados, sem passar pelo modelo completo de resposta
+        response.results = [_project(document, fields) for document in response.results]
+        return JSONResponse(content=jsonable_encoder(response, by_alias=True))
+    return response
+
 
-#Busca um produto por Seller_id + SKU
+# Busca um produto por Seller_id + SKU
 @router.get(
     "/{sku}",
     response_model=CatalogoResponse,
     status_code=status.HTTP_200_OK,
     summary="Buscar produto por Seller_id e SKU",
-    description=
-    """
+    description="""
         Retorna um produto específico do catálogo com base no seller_id e SKU.
 
     """,
@@ -76,25 +121,37 @@ async def get_by_seller_id_paginado(
 @inject
 async def get_product(
     sku: str,
-    seller_id: str = Header(..., alias="x-seller-id", description= MSG_SELLER_IDENTIFICATION),
+    seller_id: str = Header(..., alias="x-seller-id", description=MSG_SELLER_IDENTIFICATION),
+    _fields: str | None = Query(default=None, description=MSG_FIELDS),
     catalogo_service: "CatalogoService" = Depends(Provide["catalogo_service"]),
 ):
-    result = await catalogo_service.find_by_sellerid_sku(seller_id, sku)
-    print(result)
-    return result
-
-#Cadastra um produto
+    fields = catalogo_service.parse_fields(_fields)
+    if fields:
+        result = await catalogo_service.find_by_sellerid_sku(seller_id, sku)
+        return JSONResponse(content=jsonable_encoder(_project(result, fields)))
+    # Caminho rápido: a resposta já serializada é devolvida como está, sem validar nem converter
+    content = await catalogo_service.find_product_response_in_cache(seller_id, sku)
+    if content is not None:
+        return Response(content=content, media_type="application/json")
+    result, cacheable = await catalogo_service.find_product_for_response(seller_id, sku)
+    content = CatalogoResponse.model_validate(result).model_dump_json().encode()
+    if cacheable:
+        # Não guarda respostas montadas a partir do L1 ou de entrada vencida: teriam validade renovada
+        await catalogo_service.save_product_response_in_cache(seller_id, sku, content)
+    return Response(content=content, media_type="application/json")
+
+
+# Cadastra um produto
 @router.post(
     "",
     response_model=CatalogoResponse,
     status_code=status.HTTP_201_CREATED,
     summary="Cadastrar um novo produto",
-    description=
-    """
+    description="""
     Cria um novo produto no catálogo com base nos dados fornecidos.
 
         Parâmetros:
-            
+
             - seller_id: Identificador do vendedor.
             - sku: Identificador do produto.
             - name: Nome do produto.
@@ -115,24 +172,210 @@ async def create(
     """
     Cria um novo produto no catálogo. Não pode haver um `seller_id` + `sku` já cadastrado.
     """
-    
+
     catalogo_model = CatalogoModel(**catalogo.model_dump(), seller_id=seller_id)
     catalogo_model.created_by = user_info.user
     catalogo_model.updated_by = user_info.user
     catalogo_model = await catalogo_service.create(catalogo_model)
-    
+
     catalogo_response = catalogo_model.model_dump()
-    
+
     return catalogo_response
 
-#Atualiza um produto
+
+def _to_catalogo_model(catalogo: CatalogoCreate, seller_id: str, user_info: UserAuthInfo) -> CatalogoModel:
+    catalogo_model = CatalogoModel(**catalogo.model_dump(), seller_id=seller_id)
+    catalogo_model.created_by = user_info.user
+    catalogo_model.updated_by = user_info.user
+    return catalogo_model
+
+
+def _project(catalogo: CatalogoModel | dict, fields: list[str]) -> dict:
+    """
+    Mantém só os campos solicitados em _fields.
+    """
+    if isinstance(catalogo, dict):
+        return {field: catalogo[field] for field in fields if field in catalogo}
+    return catalogo.model_dump(include=set(fields))
+
+
+def _to_bulk_response(results: list[CatalogoBulkItemResult]) -> CatalogoBulkResponse:
+    created = sum(1 for result in results if result.created)
+    return CatalogoBulkResponse(
+        total=len(results),
+        created=created,
+        failed=len(results) - created,
+        results=[CatalogoBulkItemResponse.model_validate(result) for result in results],
+    )
+
+
+async def _iter_ndjson_lines(request: Request):
+    """
+    Lê o corpo NDJSON conforme chega, devolvendo (índice, linha) sem carregar tudo em memória.
+    """
+    buffer = b""
+    index = 0
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield index, line
+                index += 1
+    if buffer.strip():
+        yield index, buffer
+
+
+# Cadastra produtos em lote
+@router.post(
+    "/bulk",
+    response_model=CatalogoBulkResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cadastrar produtos em lote",
+    description=f"""
+    Cadastra até {BULK_MAX_ITEMS} produtos em uma única requisição.
+
+        Parâmetros:
+
+            - seller_id: Identificador do vendedor.
+            - Lista de produtos (sku e name).
+
+        Retorna:
+
+            O resultado de cada item (cadastrado ou o erro encontrado).
+
+    """,
+)
+@inject
+async def bulk_create(
+    catalogos: list[CatalogoCreate] = Body(..., min_length=1, max_length=BULK_MAX_ITEMS),
+    seller_id: str = Header(..., alias="x-seller-id", description=MSG_SELLER_IDENTIFICATION),
+    catalogo_service: "CatalogoService" = Depends(Provide["catalogo_service"]),
+    user_info: UserAuthInfo = Depends(get_current_user),
+):
+    catalogo_models = [_to_catalogo_model(catalogo, seller_id, user_info) for catalogo in catalogos]
+    results = await catalogo_service.bulk_create(catalogo_models)
+    return _to_bulk_response(results)
+
+
+# Cadastra produtos em lote via NDJSON
+@router.post(
+    "/bulk/stream",
+    response_model=CatalogoBulkResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Cadastrar produtos em lote (NDJSON)",
+    description="""
+    Cadastra produtos enviados em NDJSON (um produto JSON por linha), sem limite de itens.
+    As linhas são gravadas em blocos conforme chegam.
+
+        Parâmetros:
+
+            - seller_id: Identificador do vendedor.
+            - Corpo application/x-ndjson com sku e name em cada linha.
+
+        Retorna:
+
+            O resultado de cada linha (cadastrado ou o erro encontrado).
+
+    """,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+@inject
+async def bulk_create_stream(
+    request: Request,
+    seller_id: str = Header(..., alias="x-seller-id", description=MSG_SELLER_IDENTIFICATION),
+    catalogo_service: "CatalogoService" = Depends(Provide["catalogo_service"]),
+    user_info: UserAuthInfo = Depends(get_current_user),
+):
+    results: list[CatalogoBulkItemResult] = []
+    batch: list[CatalogoModel] = []
+    batch_indexes: list[int] = []
+
+    async def _flush():
+        for result in await catalogo_service.bulk_create(batch):
+            result.index = batch_indexes[result.index]
+            results.append(result)
+        batch.clear()
+        batch_indexes.clear()
+
+    async for index, line in _iter_ndjson_lines(request):
+        try:
+            catalogo = CatalogoCreate.model_validate_json(line)
+            batch.append(_to_catalogo_model(catalogo, seller_id, user_info))
+            batch_indexes.append(index)
+        except ValidationError as exception:
+            error = exception.errors()[0]
+            results.append(
+                CatalogoBulkItemResult(index=index, created=False, slug=error["type"], message=error["msg"])
+            )
+        if len(batch) >= BULK_STREAM_BATCH_SIZE:
+            await _flush()
+    if batch:
+        await _flush()
+
+    results.sort(key=lambda result: result.index)
+    return _to_bulk_response(results)
+
+
+# Busca produtos em lote
+@router.post(
+    "/batch-get",
+    response_model=CatalogoBatchGetResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Buscar produtos em lote",
+    description=f"""
+    Retorna até {BATCH_GET_MAX_ITEMS} produtos em uma única requisição, a partir dos pares seller_id + sku.
+
+        Parâmetros:
+
+            - Lista de itens (seller_id e sku). Todos os sellers devem estar autorizados para o usuário.
+
+        Retorna:
+
+            Os produtos encontrados, na ordem da requisição, e os itens sem produto cadastrado.
+
+    """,
+)
+@inject
+async def batch_get(
+    items: list[CatalogoBatchGetItem] = Body(..., min_length=1, max_length=BATCH_GET_MAX_ITEMS),
+    user_info: UserAuthInfo = Depends(get_current_user),
+    catalogo_service: "CatalogoService" = Depends(Provide["catalogo_service"]),
+):
+    # O do_auth só valida o x-seller-id: cada seller do lote precisa estar autorizado
+    unauthorized_sellers = sorted({item.seller_id for item in items} - set(user_info.sellers))
+    if unauthorized_sellers:
+        raise ForbiddenException(
+            [
+                {"message": f"não autorizado para trabalhar com o seller {seller_id}", "location": "body"}
+                for seller_id in unauthorized_sellers
+            ]
+        )
+
+    seller_skus = list(dict.fromkeys((item.seller_id, item.sku) for item in items))
+    found = await catalogo_service.find_many_by_sellerid_skus(seller_skus)
+    return CatalogoBatchGetResponse(
+        results=[found[seller_sku] for seller_sku in seller_skus if seller_sku in found],
+        not_found=[
+            CatalogoBatchGetItem(seller_id=seller_id, sku=sku)
+            for seller_id, sku in seller_skus
+            if (seller_id, sku) not in found
+        ],
+    )
+
+
+# Atualiza um produto
 @router.put(
     "/{sku}",
     status_code=status.HTTP_202_ACCEPTED,
     summary="Atualiza todos os dados de um produto",
     response_model=CatalogoResponse,
-    description=
-    """
+    description="""
     Atualiza todos os dados de um produto"
 
         Parâmetros:
@@ -166,14 +409,14 @@ async def put_something(
 
     return catalogo_response
 
-#ATUALIZA PARCIALMENTE UM PRODUTO
+
+# ATUALIZA PARCIALMENTE UM PRODUTO
 @router.patch(
     "/{sku}",
     status_code=status.HTTP_202_ACCEPTED,
     summary="Atualiza os dados de um produto parcialmente",
     response_model=CatalogoResponse,
-    description=
-    """
+    description="""
     Atualiza os dados de um produto parcialmente"
 
         Parâmetros:
@@ -206,13 +449,13 @@ async def patch_something(
 
     return catalogo_response
 
-#Deleta um produto
+
+# Deleta um produto
 @router.delete(
         "/{sku}",
         status_code=status.HTTP_204_NO_CONTENT,
         summary="Deletar o produto",
-        description=
-        """
+        description="""
             Deleta um produto do catálogo com base no seller_id e SKU.
 
             Parâmetros:
@@ -225,8 +468,8 @@ async def patch_something(
             Erros:
                 404 - Este produto não existe.
         """
-        
-        )   
+
+        )
 @inject
 async def delete(
     sku: str,
@@ -234,4 +477,3 @@ async def delete(
     catalogo_service: "CatalogoService" = Depends(Provide["catalogo_service"]),
 ):
     return await catalogo_service.delete_by_sellerid_sku(seller_id, sku)
-
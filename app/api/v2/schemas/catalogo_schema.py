@@ -1,7 +1,8 @@
 from typing import Optional
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from app.api.common.schemas import ResponseEntity, SchemaType
+from app.models import DescriptionStatus
 
 
 class CatalogoSchema(SchemaType):
@@ -17,6 +18,39 @@ class CatalogoSchema(SchemaType):
 
 class CatalogoResponse(CatalogoSchema, ResponseEntity):
     """Resposta adicionando"""
+    description_status: Optional[DescriptionStatus] = Field(
+        default=None,
+        description="Situação da descrição gerada pela IA (pending, done ou failed)"
+    )
+
+
+class CatalogoBulkItemResponse(SchemaType):
+    index: int = Field(..., description="Posição do item na requisição")
+    sku: Optional[str] = Field(None, description="SKU do item")
+    created: bool = Field(..., description="Indica se o produto foi cadastrado")
+    slug: Optional[str] = Field(None, description="Identificação do erro, quando houver")
+    message: Optional[str] = Field(None, description="Descrição do erro, quando houver")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CatalogoBulkResponse(SchemaType):
+    """Relatório da importação em lote"""
+    total: int = Field(..., description="Quantidade de itens recebidos")
+    created: int = Field(..., description="Quantidade de produtos cadastrados")
+    failed: int = Field(..., description="Quantidade de itens com erro")
+    results: list[CatalogoBulkItemResponse] = Field(..., description="Resultado de cada item")
+
+
+class CatalogoBatchGetItem(SchemaType):
+    seller_id: str = Field(..., pattern=r'^[a-z0-9]+$', description="Só letras minúsculas e números")
+    sku: str = Field(..., pattern=r'^[A-Za-z0-9]+$', description="Só letras e números, sem espaços")
+
+
+class CatalogoBatchGetResponse(SchemaType):
+    """Resultado da busca em lote"""
+    results: list[CatalogoResponse] = Field(..., description="Produtos encontrados, na ordem da requisição")
+    not_found: list[CatalogoBatchGetItem] = Field(..., description="Itens sem produto cadastrado")
 
 
 class CatalogoCreate(SchemaType):
@@ -0,0 +1,47 @@
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+
+class LazyQueueHandler(QueueHandler):
+    """
+    QueueHandler que não formata a mensagem na thread de quem loga: a formatação fica com o QueueListener.
+
+    Os argumentos do log são lidos depois, então não devem ser alterados após a chamada.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class QueuedLogging:
+    """
+    Move os handlers do logger raiz para uma thread (QueueListener): quem loga apenas enfileira o registro.
+
+    Deve ser iniciado depois da configuração do logging e parado no encerramento, para esvaziar a fila.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._handlers: list[logging.Handler] = []
+        self._listener: QueueListener | None = None
+
+    def start(self) -> None:
+        if not self.enabled or self._listener is not None:
+            return
+        root = logging.getLogger()
+        self._handlers = list(root.handlers)
+        if not self._handlers:
+            return
+        queue: SimpleQueue = SimpleQueue()
+        self._listener = QueueListener(queue, *self._handlers, respect_handler_level=True)
+        root.handlers = [LazyQueueHandler(queue)]
+        self._listener.start()
+
+    def stop(self) -> None:
+        if self._listener is None:
+            return
+        # Processa o que ainda está na fila antes de devolver os handlers
+        self._listener.stop()
+        logging.getLogger().handlers = self._handlers
+        self._listener = None
@@ -0,0 +1,15 @@
+import re
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_search_text(text: str | None) -> str:
+    """
+    Normaliza um texto para busca: minúsculo, sem acentos e com espaços simples.
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return _WHITESPACE.sub(" ", without_accents).strip().lower()
@@ -4,8 +4,16 @@ from app.repositories import CatalogoRepository, CatalogoRepositoryV1
 from app.services import CatalogoService, HealthCheckService, CatalogoServiceV1
 from app.settings.app import AppSettings
 from app.integrations.auth.keycloak_adapter import KeycloakAdapter
-from app.worker.description.creating_product_description import CreatingProductDescription
+from app.integrations.auth.local_jwks_adapter import LocalJwksAdapter
+from app.common.metrics import MetricsRegistry
+from app.common.queued_logging import QueuedLogging
+from app.integrations.cache.cache_invalidation import CacheInvalidationBus
+from app.integrations.cache.cache_metrics import CacheMetrics
+from app.integrations.cache.local_cache import LocalCache
 from app.integrations.cache.redis_asyncio_adapter import RedisAsyncioAdapter
+from app.integrations.cache.serializers import build_serializer
+from app.integrations.http.async_http_client import build_async_http_client
+from app.worker.description.description_job_queue import DescriptionJobQueue
 
 class Container(containers.DeclarativeContainer):
     config = providers.Configuration()
@@ -16,11 +24,60 @@ class Container(containers.DeclarativeContainer):
     # ** Client MongoDB 
     mongo_client = providers.Singleton(MongoClient, config.app_db_url_mongo)
     # ** Client Keycloak Adapter
-    keycloak_adapter = providers.Singleton(KeycloakAdapter, config.app_openid_wellknown)
+    keycloak_token_cache = providers.Singleton(
+        LocalCache,
+        max_size=config.app_openid_token_cache_max_size,
+        ttl_seconds=config.app_openid_token_cache_ttl_seconds,
+    )
+    # Cliente HTTP do OpenID (compartilhado, fechado no lifespan da API)
+    keycloak_http_client = providers.Singleton(
+        build_async_http_client,
+        connect_timeout=config.app_openid_timeout_seconds,
+        read_timeout=config.app_openid_timeout_seconds,
+        write_timeout=config.app_openid_timeout_seconds,
+        pool_timeout=config.app_openid_timeout_seconds,
+        max_connections=config.app_openid_max_connections,
+        max_keepalive_connections=config.app_openid_max_connections,
+    )
+    # Modo local: valida com um JWKS em arquivo, sem Keycloak (testes de carga)
+    keycloak_adapter = providers.Selector(
+        config.app_openid_mode,
+        keycloak=providers.Singleton(
+            KeycloakAdapter,
+            config.app_openid_wellknown,
+            token_cache=keycloak_token_cache,
+            http_client=keycloak_http_client,
+            jwks_refresh_interval_seconds=config.app_openid_jwks_refresh_interval_seconds,
+            jwks_min_refetch_interval_seconds=config.app_openid_jwks_min_refetch_interval_seconds,
+        ),
+        local=providers.Singleton(
+            LocalJwksAdapter, config.app_openid_local_jwks_path, token_cache=keycloak_token_cache
+        ),
+    )
     
     #------------------------
     # ** Redis
-    redis_adapter = providers.Singleton(RedisAsyncioAdapter, config.app_redis_url)
+    redis_adapter = providers.Singleton(
+        RedisAsyncioAdapter,
+        config.app_redis_url,
+        serializer=providers.Callable(build_serializer, config.app_redis_serializer),
+        max_connections=config.app_redis_max_connections,
+    )
+    # ** Métricas do processo (expostas em /api/metrics)
+    metrics_registry = providers.Singleton(MetricsRegistry)
+    cache_metrics = providers.Singleton(CacheMetrics, metrics_registry)
+    # ** Cache local (L1) de produtos e sua invalidação entre processos via pub/sub
+    local_cache = providers.Singleton(
+        LocalCache,
+        max_size=config.local_cache_max_size,
+        ttl_seconds=config.local_cache_ttl_seconds,
+        cache_metrics=cache_metrics,
+    )
+    cache_invalidation_bus = providers.Singleton(CacheInvalidationBus, redis_adapter, local_cache=local_cache)
+    # ** Escrita dos logs fora do event loop (iniciada no lifespan da API)
+    queued_logging = providers.Singleton(QueuedLogging, enabled=config.logging_queue_enabled)
+    # ** Fila de descrições processada pelo worker de IA
+    description_job_queue = providers.Singleton(DescriptionJobQueue, redis_adapter)
     
     
     # V1 - Memory
@@ -35,7 +92,21 @@ class Container(containers.DeclarativeContainer):
     # ** Repositório
     catalogo_repository = providers.Singleton(CatalogoRepository, mongo_client)
     # ** Servico
-    catalogo_service = providers.Singleton(CatalogoService, catalogo_repository, redis_adapter=redis_adapter)
+    catalogo_service = providers.Singleton(
+        CatalogoService,
+        catalogo_repository,
+        redis_adapter=redis_adapter,
+        local_cache=local_cache,
+        invalidation_bus=cache_invalidation_bus,
+        cache_lock_enabled=config.cache_lock_enabled,
+        cache_lock_timeout_seconds=config.cache_lock_timeout_seconds,
+        cache_soft_ttl_seconds=config.cache_soft_ttl_seconds,
+        cache_hard_ttl_seconds=config.cache_hard_ttl_seconds,
+        cache_ttl_jitter=config.cache_ttl_jitter,
+        cache_not_found_ttl_seconds=config.cache_not_found_ttl_seconds,
+        cache_write_through=config.cache_write_through,
+        cache_metrics=cache_metrics,
+    )
 
     # -----------------------
     
@@ -43,12 +114,3 @@ class Container(containers.DeclarativeContainer):
     health_check_service = providers.Singleton(
         HealthCheckService, checkers=config.health_check_checkers, settings=settings
     )
-    
-    #------------------------
-    # ** Worker IA
-    creating_product_description = providers.Singleton(
-        CreatingProductDescription,
-        ia_api_url=config.ia_api_url,
-        ia_model=config.ia_model,
-        )
-
@@ -1,6 +1,15 @@
+import asyncio
+import time
+from logging import getLogger
+
 import httpx
 import jwt
 
+from app.common.hash_utils import generate_hash
+from app.integrations.cache.local_cache import LocalCache
+
+logger = getLogger(__name__)
+
 # ----- Exceções -----
 
 # Criando exceções genéricas aqui mesmo
@@ -25,43 +34,136 @@ class InvalidTokenException(OAuthException):
 
 
 class KeycloakAdapter:
-    def __init__(self, well_known_url: str):
-        
+    def __init__(
+        self,
+        well_known_url: str,
+        token_cache: LocalCache | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        jwks_refresh_interval_seconds: float = 300.0,
+        jwks_min_refetch_interval_seconds: float = 30.0,
+    ):
+        """
+        :param well_known_url: URL do documento de descoberta (well-known) do OpenID.
+        :param token_cache: Cache das claims de tokens já validados, pelo hash do token.
+            Cada token fica no cache até o seu `exp` (limitado ao TTL do cache). Sem cache, todo token é verificado.
+        :param http_client: Cliente HTTP compartilhado (pool de conexões) para a descoberta e o JWKS.
+            Sem ele, o adapter cria o seu e o fecha em `aclose()`.
+        :param jwks_refresh_interval_seconds: Intervalo da atualização das chaves em segundo plano quando o
+            JWKS não informa `Cache-Control: max-age` (0 desliga a atualização em segundo plano).
+        :param jwks_min_refetch_interval_seconds: Intervalo mínimo entre buscas do JWKS causadas por um `kid`
+            desconhecido, para que tokens forjados não virem uma enxurrada de chamadas ao Keycloak.
+        """
         self.well_known_url = str(well_known_url)
+        self.jwks_refresh_interval_seconds = jwks_refresh_interval_seconds
+        self.jwks_min_refetch_interval_seconds = jwks_min_refetch_interval_seconds
+        self._http_client = http_client or self._build_http_client()
+        self._owns_http_client = http_client is None
         self._well_knwon: dict | None = None
+        self._well_known_lock = asyncio.Lock()
         self._public_keys: list[dict] | None = None
+        self._jwks_by_kid: dict[str, jwt.PyJWK] = {}
+        self._jwks_max_age: float | None = None
+        self._jwks_fetched_at: float | None = None
+        self._jwks_lock = asyncio.Lock()
+        self._refresh_task: asyncio.Task | None = None
+        self._token_cache = token_cache
 
-    def get_well_knwon(self) -> dict:
+    async def get_well_knwon(self) -> dict:
         if self._well_knwon is None:
-            self._well_knwon = self._load_well_known()
+            async with self._well_known_lock:
+                if self._well_knwon is None:
+                    self._well_knwon = await self._load_well_known()
         return self._well_knwon
 
-    def _load_well_known(self):
-        with httpx.Client() as http_client:
-            response = http_client.get(self.well_known_url)
-            response.raise_for_status()
-            wk = response.json()
+    async def _load_well_known(self):
+        response = await self._http_client.get(self.well_known_url)
+        response.raise_for_status()
+        wk = response.json()
         return wk
 
-    def get_authorization_endpoint(self):
-        well_kwnon = self.get_well_knwon()
+    async def get_authorization_endpoint(self):
+        well_kwnon = await self.get_well_knwon()
         authorization_endpoint = well_kwnon["authorization_endpoint"]
         return authorization_endpoint
 
     async def get_public_keys(self):
         if self._public_keys is None:
-            self._public_keys = await self._fetch_public_keys()
+            async with self._jwks_lock:
+                # Outra requisição pode ter carregado as chaves enquanto esperávamos
+                if self._public_keys is None:
+                    await self.refresh_public_keys()
         return self._public_keys
 
+    async def refresh_public_keys(self) -> list[dict]:
+        """
+        Busca o JWKS e recria o índice kid -> PyJWK usado na verificação dos tokens.
+        """
+        self._jwks_fetched_at = time.monotonic()
+        keys = await self._fetch_public_keys()
+        self._jwks_by_kid = self.build_jwks_by_kid(keys)
+        self._public_keys = keys
+        return keys
+
     async def _fetch_public_keys(self) -> list:
-        well_known = self.get_well_knwon()
+        well_known = await self.get_well_knwon()
         jwks_uri = well_known["jwks_uri"]
-        async with httpx.AsyncClient() as http_client:
-            jwks_response = await http_client.get(jwks_uri)
-            jwks_response.raise_for_status()
-            
-            keys = (jwks_response.json())["keys"]  # Adicione await aqui
-            return keys
+        jwks_response = await self._http_client.get(jwks_uri)
+        jwks_response.raise_for_status()
+
+        self._jwks_max_age = self.parse_max_age(jwks_response.headers.get("cache-control"))
+        keys = (jwks_response.json())["keys"]
+        return keys
+
+    async def prewarm(self) -> None:
+        """
+        Carrega a descoberta e as chaves públicas antes das primeiras requisições.
+
+        Uma falha não impede a subida da aplicação: a carga é refeita na primeira validação de token.
+        """
+        try:
+            await self.get_public_keys()
+        except Exception as e:
+            logger.warning(f"Falha ao pré-carregar a descoberta e as chaves do OpenID: {e}")
+
+    def _build_http_client(self) -> httpx.AsyncClient | None:
+        """
+        Cria o cliente HTTP próprio, usado quando nenhum cliente compartilhado é informado.
+        """
+        return httpx.AsyncClient()
+
+    async def aclose(self) -> None:
+        await self.stop_background_refresh()
+        if self._owns_http_client and self._http_client is not None:
+            await self._http_client.aclose()
+
+    @staticmethod
+    def build_jwks_by_kid(keys: list[dict]) -> dict[str, jwt.PyJWK]:
+        jwks_by_kid = {}
+        for key in keys:
+            kid = key.get("kid")
+            # O Keycloak também publica chaves de criptografia (use=enc), que não assinam tokens
+            if not kid or key.get("use", "sig") != "sig":
+                continue
+            try:
+                jwks_by_kid[kid] = jwt.PyJWK(jwk_data=key)
+            except (jwt.PyJWTError, ValueError) as e:
+                logger.warning(f"Chave pública '{kid}' ignorada: {e}")
+        return jwks_by_kid
+
+    @staticmethod
+    def parse_max_age(cache_control: str | None) -> float | None:
+        if not cache_control:
+            return None
+        directives = [directive.strip().lower() for directive in cache_control.split(",")]
+        if "no-cache" in directives or "no-store" in directives:
+            return None
+        for directive in directives:
+            if directive.startswith("max-age="):
+                try:
+                    return float(directive.removeprefix("max-age="))
+                except ValueError:
+                    return None
+        return None
 
     @staticmethod
     def get_token_header(token: str) -> dict:
@@ -75,33 +177,100 @@ class KeycloakAdapter:
         alg = header.get("alg")
 
         return kid, alg
-        
 
-    async def get_alg_key_for_kid(self, kid) -> dict:
-        # Procurando pela chave específica
-        public_keys = await self.get_public_keys()
-        key = next((public_key for public_key in public_keys if public_key.get("kid") == kid), None)
-        if not key:
+    async def get_jwk_for_kid(self, kid) -> jwt.PyJWK:
+        await self.get_public_keys()
+        jwk = self._jwks_by_kid.get(kid)
+        if jwk is None and self._can_refetch_public_keys():
+            # Kid desconhecido: o Keycloak pode ter rotacionado as chaves
+            async with self._jwks_lock:
+                jwk = self._jwks_by_kid.get(kid)
+                if jwk is None and self._can_refetch_public_keys():
+                    logger.info(f"Chave '{kid}' desconhecida, buscando novamente as chaves públicas")
+                    await self.refresh_public_keys()
+                    jwk = self._jwks_by_kid.get(kid)
+        if jwk is None:
             raise InvalidTokenException(f"Chave '{kid}' não encontrada")
-        return key
+        return jwk
+
+    def _can_refetch_public_keys(self) -> bool:
+        if self._jwks_fetched_at is None:
+            return True
+        return time.monotonic() - self._jwks_fetched_at >= self.jwks_min_refetch_interval_seconds
+
+    def _next_refresh_delay(self) -> float:
+        if self._jwks_max_age is None:
+            return self.jwks_refresh_interval_seconds
+        return max(self._jwks_max_age, self.jwks_min_refetch_interval_seconds)
+
+    async def refresh_periodically(self) -> None:
+        """
+        Atualiza as chaves públicas em segundo plano até ser cancelado, respeitando o Cache-Control do JWKS.
+        """
+        while True:
+            await asyncio.sleep(self._next_refresh_delay())
+            try:
+                async with self._jwks_lock:
+                    await self.refresh_public_keys()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # As chaves atuais continuam valendo; tenta de novo mais cedo
+                logger.warning(f"Falha ao atualizar as chaves públicas do OpenID: {e}")
+                await asyncio.sleep(self.jwks_min_refetch_interval_seconds)
+
+    def start_background_refresh(self) -> None:
+        if self.jwks_refresh_interval_seconds > 0 and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self.refresh_periodically())
+
+    async def stop_background_refresh(self) -> None:
+        if self._refresh_task is None:
+            return
+        self._refresh_task.cancel()
+        try:
+            await self._refresh_task
+        except asyncio.CancelledError:
+            pass
+        self._refresh_task = None
 
     async def validate_token(self, token: str) -> dict:
+        if self._token_cache is None:
+            return await self._verify_token(token)
+
+        # O mesmo token chega em muitas requisições: evita refazer a verificação da assinatura
+        token_hash = generate_hash(token)
+        info_token = self._token_cache.get(token_hash)
+        if info_token is not None and info_token["exp"] > time.time():
+            return dict(info_token)
+
+        info_token = await self._verify_token(token)
+        self._cache_token(token_hash, info_token)
+        return info_token
+
+    def _cache_token(self, token_hash: str, info_token: dict) -> None:
+        expires_at = info_token.get("exp")
+        if not isinstance(expires_at, (int, float)):
+            # Sem exp não há como saber até quando o token vale
+            return
+        ttl_seconds = min(expires_at - time.time(), self._token_cache.ttl_seconds)
+        if ttl_seconds > 0:
+            self._token_cache.set(token_hash, dict(info_token), ttl_seconds=ttl_seconds)
+
+    async def _verify_token(self, token: str) -> dict:
         try:
             # Obendo o kid (key id) no cabeçalho
-            kid, alg = self.get_header_info_from_token(token)
+            kid, _alg = self.get_header_info_from_token(token)
 
-            key = await self.get_alg_key_for_kid(kid)
+            # Chave pública já montada na carga do JWKS
+            jwt_key = await self.get_jwk_for_kid(kid)
 
-            
             # Verificando o token
-            jwt_key = jwt.PyJWK(jwk_data=key, algorithm=alg)
-            
             info_token = jwt.decode(
                 token,
                 # Chave pública a ser usada
                 jwt_key,
-                # Qual é o algoritmo
-                algorithms=[alg],
+                # O algoritmo é o da chave, não o informado pelo token
+                algorithms=[jwt_key.algorithm_name],
                 # Vou validar desconsiderando a audiência
                 options={"verify_aud": False},
             )
@@ -0,0 +1,38 @@
+import asyncio
+import json
+from pathlib import Path
+
+from app.integrations.cache.local_cache import LocalCache
+
+from .keycloak_adapter import KeycloakAdapter
+
+
+class LocalJwksAdapter(KeycloakAdapter):
+    """
+    Valida tokens com as chaves públicas de um arquivo JWKS local, sem acessar o Keycloak.
+
+    Usado em testes de carga e desenvolvimento (APP_OPENID_MODE=local), com tokens emitidos por
+    `app.integrations.auth.local_tokens`. A validação (índice por kid, cache de tokens) é a mesma do Keycloak.
+    """
+
+    def __init__(self, jwks_path: str | None, token_cache: LocalCache | None = None):
+        if not jwks_path:
+            raise ValueError("APP_OPENID_LOCAL_JWKS_PATH é obrigatório no modo de autenticação local")
+        self.jwks_path = Path(jwks_path)
+        super().__init__(
+            self.jwks_path.resolve().as_uri(),
+            token_cache=token_cache,
+            # O arquivo só é relido quando aparece um kid desconhecido
+            jwks_refresh_interval_seconds=0,
+        )
+
+    def _build_http_client(self) -> None:
+        # Descoberta e chaves vêm do arquivo: nenhum cliente HTTP é criado (nem precisa ser fechado)
+        return None
+
+    async def _load_well_known(self):
+        return {"jwks_uri": self.well_known_url}
+
+    async def _fetch_public_keys(self) -> list:
+        jwks = await asyncio.to_thread(self.jwks_path.read_text, encoding="utf-8")
+        return json.loads(jwks)["keys"]
@@ -0,0 +1,110 @@
+"""
+Chaves e tokens locais para o modo de autenticação sem Keycloak (APP_OPENID_MODE=local).
+
+Uso:
+    python -m app.integrations.auth.local_tokens chaves --dir devtools/local-auth
+    python -m app.integrations.auth.local_tokens token --chave devtools/local-auth/private_key.pem --sellers magalu
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+LOCAL_KID = "catalogo-local"
+LOCAL_ISSUER = "http://localhost/realms/local"
+PRIVATE_KEY_FILE = "private_key.pem"
+JWKS_FILE = "jwks.json"
+
+
+def generate_local_keys(kid: str = LOCAL_KID) -> tuple[bytes, dict]:
+    """
+    Gera um par de chaves RSA: a privada (PEM), para emitir tokens, e o JWKS público, para validá-los.
+    """
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return private_pem, {"keys": [jwk]}
+
+
+def write_local_keys(directory: str | Path, kid: str = LOCAL_KID) -> tuple[Path, Path]:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    private_pem, jwks = generate_local_keys(kid)
+
+    private_key_path = directory / PRIVATE_KEY_FILE
+    private_key_path.write_bytes(private_pem)
+    private_key_path.chmod(0o600)
+    jwks_path = directory / JWKS_FILE
+    jwks_path.write_text(json.dumps(jwks, indent=2), encoding="utf-8")
+    return private_key_path, jwks_path
+
+
+def mint_token(
+    private_key_pem: bytes,
+    sellers: list[str],
+    sub: str = "usuario-local",
+    kid: str = LOCAL_KID,
+    expires_in_seconds: int = 3600,
+    issuer: str = LOCAL_ISSUER,
+    **claims,
+) -> str:
+    """
+    Emite um token RS256 com a claim `sellers` no mesmo formato do Keycloak (sellers separados por vírgula).
+    """
+    now = int(time.time())
+    payload = {
+        "sub": sub,
+        "iss": issuer,
+        "iat": now,
+        "exp": now + expires_in_seconds,
+        "sellers": ",".join(sellers),
+        **claims,
+    }
+    return jwt.encode(payload, private_key_pem, algorithm="RS256", headers={"kid": kid})
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Chaves e tokens para a autenticação local")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    chaves = subparsers.add_parser("chaves", help="Gera a chave privada e o JWKS")
+    chaves.add_argument("--dir", required=True, help="Diretório de saída")
+    chaves.add_argument("--kid", default=LOCAL_KID)
+
+    token = subparsers.add_parser("token", help="Emite um token assinado")
+    token.add_argument("--chave", required=True, help="Arquivo PEM da chave privada")
+    token.add_argument("--sellers", required=True, help="Sellers separados por vírgula")
+    token.add_argument("--sub", default="usuario-local")
+    token.add_argument("--kid", default=LOCAL_KID)
+    token.add_argument("--expira-em", type=int, default=3600, help="Validade (s) do token")
+
+    args = parser.parse_args(argv)
+    if args.comando == "chaves":
+        private_key_path, jwks_path = write_local_keys(args.dir, args.kid)
+        print(f"Chave privada: {private_key_path}")
+        print(f"JWKS (APP_OPENID_LOCAL_JWKS_PATH): {jwks_path}")
+    else:
+        print(
+            mint_token(
+                Path(args.chave).read_bytes(),
+                sellers=args.sellers.split(","),
+                sub=args.sub,
+                kid=args.kid,
+                expires_in_seconds=args.expira_em,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import asyncio
+from logging import getLogger
+
+from .local_cache import LocalCache
+from .redis_asyncio_adapter import RedisAsyncioAdapter
+
+logger = getLogger(__name__)
+
+INVALIDATION_CHANNEL = "cache:invalidacao"
+
+
+class CacheInvalidationBus:
+    """
+    Propaga, via Redis pub/sub, a remoção de chaves dos caches locais (L1) de todos os processos.
+
+    Processos sem cache local (como o worker) apenas publicam.
+    """
+
+    def __init__(
+        self,
+        redis_adapter: RedisAsyncioAdapter,
+        local_cache: LocalCache | None = None,
+        channel: str = INVALIDATION_CHANNEL,
+        reconnect_delay_seconds: float = 1.0,
+    ):
+        self.redis_adapter = redis_adapter
+        self.local_cache = local_cache
+        self.channel = channel
+        self.reconnect_delay_seconds = reconnect_delay_seconds
+        self._task: asyncio.Task | None = None
+
+    async def invalidate(self, *keys: str) -> None:
+        """
+        Remove as chaves do cache local e avisa os demais processos.
+        """
+        if not keys:
+            return
+        self._evict_local(keys)
+        try:
+            await self.redis_adapter.publish_json(self.channel, list(keys))
+        except Exception as e:
+            # Os outros processos ficam com a cópia local até o TTL do L1
+            logger.warning(f"Falha ao publicar invalidação de cache: {e}")
+
+    async def listen(self) -> None:
+        """
+        Escuta o canal de invalidação até ser cancelado, reconectando em caso de falha.
+        """
+        while True:
+            try:
+                async for keys in self.redis_adapter.listen_json(self.channel):
+                    self._evict_local(keys)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"Conexão de invalidação de cache perdida: {e}")
+                # Mensagens perdidas na queda: descarta o L1 inteiro por segurança
+                if self.local_cache is not None:
+                    self.local_cache.clear()
+            await asyncio.sleep(self.reconnect_delay_seconds)
+
+    def start(self) -> None:
+        if self.local_cache is not None and self._task is None:
+            self._task = asyncio.create_task(self.listen())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _evict_local(self, keys) -> None:
+        if self.local_cache is None:
+            return
+        for key in keys:
+            self.local_cache.delete(key)
@@ -0,0 +1,37 @@
+"""
+Chaves do Redis compartilhadas pela API (CatalogoService) e pelo worker de descrição.
+
+O seller_id é sempre normalizado em minúsculas, como é gravado no banco: uma gravação de um processo
+precisa invalidar exatamente as chaves lidas pelo outro.
+"""
+
+
+def normalize_seller_id(seller_id: str) -> str:
+    return seller_id.strip().lower()
+
+
+def product_cache_key(seller_id: str, sku: str) -> str:
+    return f"produto:{normalize_seller_id(seller_id)}:{sku}"
+
+
+def product_response_cache_key(seller_id: str, sku: str) -> str:
+    return f"produto_resposta:{normalize_seller_id(seller_id)}:{sku}"
+
+
+def product_cache_keys(seller_id: str, sku: str) -> list[str]:
+    """
+    Chaves do produto e da sua resposta serializada, invalidadas juntas a cada gravação.
+    """
+    return [product_cache_key(seller_id, sku), product_response_cache_key(seller_id, sku)]
+
+
+def count_cache_key(seller_id: str) -> str:
+    return f"produto_count:{normalize_seller_id(seller_id)}"
+
+
+def listing_version_key(seller_id: str) -> str:
+    return f"lista_versao:{normalize_seller_id(seller_id)}"
+
+
+def listing_cache_key(seller_id: str, version: str, query_hash: str) -> str:
+    return f"lista:{normalize_seller_id(seller_id)}:{version}:{query_hash}"
@@ -0,0 +1,45 @@
+from app.common.metrics import MetricsRegistry
+
+
+class CacheMetrics:
+    """
+    Métricas dos caches, separadas por namespace (ex.: produto, produto_local, lista).
+    """
+
+    def __init__(self, registry: MetricsRegistry | None = None):
+        registry = registry or MetricsRegistry()
+        labels = ("namespace",)
+        self.hits = registry.counter("cache_hits_total", "Leituras encontradas no cache", labels)
+        self.misses = registry.counter("cache_misses_total", "Leituras não encontradas no cache", labels)
+        self.negative_hits = registry.counter(
+            "cache_negative_hits_total", "Leituras que encontraram o marcador de item inexistente", labels
+        )
+        self.evictions = registry.counter("cache_evictions_total", "Itens removidos ou invalidados no cache", labels)
+        self.load_seconds = registry.histogram(
+            "cache_load_duration_seconds", "Tempo de carga no banco após uma falta no cache", labels
+        )
+        self.serialization_seconds = registry.histogram(
+            "cache_serialization_duration_seconds", "Tempo de serialização e desserialização dos itens do cache", labels
+        )
+
+    def hit(self, namespace: str, amount: int = 1) -> None:
+        if amount:
+            self.hits.inc(namespace, amount=amount)
+
+    def miss(self, namespace: str, amount: int = 1) -> None:
+        if amount:
+            self.misses.inc(namespace, amount=amount)
+
+    def negative_hit(self, namespace: str, amount: int = 1) -> None:
+        if amount:
+            self.negative_hits.inc(namespace, amount=amount)
+
+    def eviction(self, namespace: str, amount: int = 1) -> None:
+        if amount:
+            self.evictions.inc(namespace, amount=amount)
+
+    def time_load(self, namespace: str):
+        return self.load_seconds.time(namespace)
+
+    def time_serialization(self, namespace: str):
+        return self.serialization_seconds.time(namespace)
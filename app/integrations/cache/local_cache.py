@@ -0,0 +1,58 @@
+import time
+from collections import OrderedDict
+from typing import Any
+
+from app.integrations.cache.cache_metrics import CacheMetrics
+
+
+class LocalCache:
+    """
+    Cache em memória do processo (L1), na frente do Redis.
+
+    Mantém no máximo `max_size` itens (descarta o usado há mais tempo) e cada item expira após `ttl_seconds`.
+    Os descartes por falta de espaço são contados em `cache_metrics`, no namespace `metrics_namespace`.
+    Não é thread-safe: deve ser usado apenas pelo event loop da aplicação.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10000,
+        ttl_seconds: float = 10.0,
+        cache_metrics: CacheMetrics | None = None,
+        metrics_namespace: str = "produto_local",
+    ):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.cache_metrics = cache_metrics or CacheMetrics()
+        self.metrics_namespace = metrics_namespace
+        self._items: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        item = self._items.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: float | None = None) -> None:
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + (ttl_seconds if ttl_seconds is not None else self.ttl_seconds)
+        self._items[key] = (expires_at, value)
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_size:
+            self._items.popitem(last=False)
+            self.cache_metrics.eviction(self.metrics_namespace)
+
+    def delete(self, key: str) -> None:
+        self._items.pop(key, None)
+
+    def clear(self) -> None:
+        self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
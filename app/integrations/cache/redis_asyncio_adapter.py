@@ -1,16 +1,61 @@
-import json
 from contextlib import asynccontextmanager
 
 from pydantic import RedisDsn
 from redis.asyncio import Redis
 
+from .serializers import JsonSerializer, RedisSerializer
+
+# Grava o valor só se a versão guardada no JSON atual (campo "version") não for mais nova que a nova.
+# Versões iguais sobrescrevem: é assim que uma recarga do mesmo documento renova a validade
+SET_IF_NEWER_SCRIPT = """
+local current = redis.call('GET', KEYS[1])
+if current then
+    local ok, document = pcall(cjson.decode, current)
+    if ok and type(document) == 'table' then
+        local current_version = tonumber(document['version'])
+        if current_version and current_version > tonumber(ARGV[2]) then
+            return 0
+        end
+    end
+end
+if ARGV[3] ~= '' then
+    redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[3])
+else
+    redis.call('SET', KEYS[1], ARGV[1])
+end
+return 1
+"""
+
+# Move um item de uma lista para o final de outra, só se ele ainda estiver na lista de origem
+MOVE_LIST_ITEM_SCRIPT = """
+if redis.call('LREM', KEYS[1], 1, ARGV[1]) == 1 then
+    redis.call('RPUSH', KEYS[2], ARGV[1])
+    return 1
+end
+return 0
+"""
 
 
 class RedisAsyncioAdapter:
 
-    def __init__(self, redis_url: RedisDsn):
+    def __init__(
+        self,
+        redis_url: RedisDsn,
+        serializer: RedisSerializer | None = None,
+        max_connections: int | None = None,
+    ):
+        """
+        :param serializer: Serializador dos métodos *_json (padrão: json da biblioteca padrão).
+        :param max_connections: Tamanho máximo do pool de conexões (padrão: o do redis-py).
+        """
         self.redis_url = str(redis_url)
-        self.redis_client = Redis.from_url(self.redis_url)
+        self.serializer = serializer or JsonSerializer()
+        pool_options = {}
+        if max_connections:
+            pool_options["max_connections"] = max_connections
+        self.redis_client = Redis.from_url(self.redis_url, **pool_options)
+        self._set_if_newer_script = None
+        self._move_list_item_script = None
 
     async def aclose(self):
         await self.redis_client.aclose()
@@ -36,10 +81,19 @@ class RedisAsyncioAdapter:
 
         await self.redis_client.set(k, v, expires_in_seconds)
 
+    async def get_bytes(self, key: str) -> bytes | None:
+        """
+        Lê o valor exatamente como está no Redis, sem decode nem desserialização.
+        """
+        return await self.redis_client.get(key)
+
+    async def set_bytes(self, key: str, v: bytes, expires_in_seconds: int | None = None):
+        await self.redis_client.set(key, v, expires_in_seconds)
+
     async def get_json(self, key: str) -> dict | list | int | None:
-        v = await self.get_str(key)
+        v = await self.redis_client.get(key)
         if v is not None:
-            v = json.loads(v)
+            v = self.serializer.loads(v)
         return v
 
     async def set_json(
@@ -48,9 +102,190 @@ class RedisAsyncioAdapter:
         v: dict | list | int | None,
         expires_in_seconds: int | None = None,
     ):
-        if v is not None:
-            v = json.dumps(v)
-        await self.set_str(key, v, expires_in_seconds)
+        if v is None:
+            await self.delete(key)
+            return
+        await self.redis_client.set(key, self.serializer.dumps(v), expires_in_seconds)
+
+    async def set_json_if_newer(
+        self,
+        key: str,
+        v: dict,
+        version: int,
+        expires_in_seconds: int | None = None,
+    ) -> bool:
+        """
+        Grava `v` (que deve conter o campo "version") de forma atômica, só se o valor atual
+        não tiver uma versão mais nova. Com a mesma versão, o valor e a expiração são renovados.
+
+        :return: True se o valor foi gravado.
+        """
+        written = await self._get_set_if_newer_script()(
+            keys=[key], args=[self.serializer.dumps(v), version, expires_in_seconds or ""]
+        )
+        return bool(written)
+
+    def _get_set_if_newer_script(self):
+        if self._set_if_newer_script is None:
+            self._set_if_newer_script = self.redis_client.register_script(SET_IF_NEWER_SCRIPT)
+        return self._set_if_newer_script
 
     async def delete(self, key: str):
-        await self.redis_client.delete(key)
\ No newline at end of file
+        await self.redis_client.delete(key)
+
+    async def delete_many(self, keys: list[str]):
+        """
+        Remove várias chaves com um único DEL.
+        """
+        if keys:
+            await self.redis_client.delete(*keys)
+
+    def pipeline(self, transaction: bool = False):
+        """
+        Cria um pipeline para enviar vários comandos em uma única ida ao Redis.
+        Com `transaction=True` os comandos são executados em um MULTI/EXEC.
+
+        Uso: async with redis_adapter.pipeline() as pipe: pipe.set(...); await pipe.execute()
+        """
+        return self.redis_client.pipeline(transaction=transaction)
+
+    async def mget_json(self, keys: list[str]) -> list[dict | list | int | None]:
+        """
+        Lê várias chaves gravadas com set_json em um único MGET, na mesma ordem de `keys`.
+        """
+        if not keys:
+            return []
+        values = await self.redis_client.mget(keys)
+        return [self.serializer.loads(v) if v is not None else None for v in values]
+
+    async def mset_json(self, items: list[tuple[str, dict | list | int, int | None]], if_newer: bool = False):
+        """
+        Grava vários valores (chave, valor, expiração em segundos) em um único pipeline.
+        Com `if_newer`, os valores com campo "version" são gravados como em set_json_if_newer.
+        """
+        if not items:
+            return
+        async with self.pipeline() as pipe:
+            for key, v, expires_in_seconds in items:
+                if if_newer and isinstance(v, dict) and "version" in v:
+                    await self._get_set_if_newer_script()(
+                        keys=[key],
+                        args=[self.serializer.dumps(v), v["version"], expires_in_seconds or ""],
+                        client=pipe,
+                    )
+                else:
+                    pipe.set(key, self.serializer.dumps(v), ex=expires_in_seconds)
+            await pipe.execute()
+
+    async def incr(self, key: str) -> int:
+        """
+        Incrementa um contador (criado com 0 se não existir) e retorna o novo valor.
+        """
+        return await self.redis_client.incr(key)
+
+    def lock(self, name: str, timeout: float):
+        """
+        Cria um lock distribuído (redis.asyncio.lock.Lock) que expira sozinho após `timeout` segundos.
+        """
+        return self.redis_client.lock(name, timeout=timeout)
+
+    async def hget_json(self, key: str, field: str) -> dict | list | int | None:
+        """
+        Lê um campo de um hash, gravado com hset_json.
+        """
+        v = await self.redis_client.hget(key, field)
+        if v is not None:
+            v = self.serializer.loads(v)
+        return v
+
+    async def hset_json(
+        self,
+        key: str,
+        field: str,
+        v: dict | list | int,
+        expires_in_seconds: int | None = None,
+    ):
+        """
+        Grava um campo de um hash. A expiração vale para o hash inteiro.
+        """
+        await self.redis_client.hset(key, field, self.serializer.dumps(v))
+        if expires_in_seconds:
+            await self.redis_client.expire(key, expires_in_seconds)
+
+    async def push_json(self, key: str, v: dict | list | int):
+        """
+        Adiciona um item ao final de uma lista (fila FIFO).
+        """
+        await self.redis_client.rpush(key, self.serializer.dumps(v))
+
+    async def push_many_json(self, key: str, values: list[dict | list | int]):
+        """
+        Adiciona vários itens ao final da lista com um único RPUSH.
+        """
+        if not values:
+            return
+        await self.redis_client.rpush(key, *(self.serializer.dumps(v) for v in values))
+
+    async def pop_json(self, key: str, timeout: int = 0) -> dict | list | int | None:
+        """
+        Remove e retorna o primeiro item da lista, bloqueando por até `timeout` segundos.
+        Retorna None se nenhum item chegar dentro do tempo.
+        """
+        item = await self.redis_client.blpop([key], timeout=timeout)
+        if item is None:
+            return None
+        _, v = item
+        return self.serializer.loads(v)
+
+    async def pop_move_json(
+        self, source: str, destination: str, timeout: int = 0
+    ) -> tuple[dict | list | int, bytes] | None:
+        """
+        Move o primeiro item de `source` para o final de `destination` (BLMOVE), bloqueando por até `timeout` segundos.
+        Retorna o item e o seu valor bruto, usado para removê-lo depois de `destination` (remove_list_item).
+        """
+        raw = await self.redis_client.blmove(source, destination, timeout, "LEFT", "RIGHT")
+        if raw is None:
+            return None
+        return self.serializer.loads(raw), raw
+
+    async def list_items(self, key: str) -> list[bytes]:
+        """
+        Retorna os valores brutos de todos os itens da lista.
+        """
+        return await self.redis_client.lrange(key, 0, -1)
+
+    async def remove_list_item(self, key: str, raw: bytes) -> bool:
+        removed = await self.redis_client.lrem(key, 1, raw)
+        return removed > 0
+
+    async def move_list_item(self, source: str, destination: str, raw: bytes) -> bool:
+        """
+        Move, de forma atômica, um item (valor bruto) de `source` para o final de `destination`.
+
+        :return: False se o item não estava mais em `source`.
+        """
+        if self._move_list_item_script is None:
+            self._move_list_item_script = self.redis_client.register_script(MOVE_LIST_ITEM_SCRIPT)
+        moved = await self._move_list_item_script(keys=[source, destination], args=[raw])
+        return bool(moved)
+
+    async def publish_json(self, channel: str, v: dict | list | int):
+        """
+        Publica uma mensagem em um canal pub/sub.
+        """
+        await self.redis_client.publish(channel, self.serializer.dumps(v))
+
+    async def listen_json(self, channel: str):
+        """
+        Assina o canal e devolve as mensagens publicadas conforme chegam.
+        """
+        pubsub = self.redis_client.pubsub()
+        await pubsub.subscribe(channel)
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") == "message":
+                    yield self.serializer.loads(message["data"])
+        finally:
+            await pubsub.unsubscribe(channel)
+            await pubsub.aclose()
@@ -0,0 +1,49 @@
+import json
+from typing import Any, Protocol
+
+
+class RedisSerializer(Protocol):
+    """
+    Converte os valores gravados no Redis. `loads` recebe os bytes do Redis diretamente, sem decode.
+    """
+
+    def dumps(self, v: Any) -> str | bytes: ...
+
+    def loads(self, data: bytes) -> Any: ...
+
+
+class JsonSerializer:
+    """
+    Serializador padrão, com o json da biblioteca padrão.
+    """
+
+    def dumps(self, v: Any) -> str:
+        return json.dumps(v)
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """
+    Serializador com orjson: gera e lê bytes direto, bem mais rápido que o json padrão.
+    O formato continua JSON, compatível com valores gravados pelo JsonSerializer.
+    """
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+
+    def dumps(self, v: Any) -> bytes:
+        return self._orjson.dumps(v)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+SERIALIZERS = {"json": JsonSerializer, "orjson": OrjsonSerializer}
+
+
+def build_serializer(name: str) -> RedisSerializer:
+    return SERIALIZERS[name]()
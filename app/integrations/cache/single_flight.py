@@ -0,0 +1,26 @@
+import asyncio
+from typing import Any, Awaitable, Callable
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes pela mesma chave: só a primeira executa o carregamento,
+    as demais aguardam o mesmo resultado (ou a mesma exceção).
+
+    O carregamento roda em uma task própria, então o cancelamento de quem o iniciou
+    (ex.: cliente desconectado) não cancela os demais que estão aguardando.
+    """
+
+    def __init__(self):
+        self._calls: dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(loader())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._calls)
@@ -0,0 +1,11 @@
+import random
+
+
+def jittered_ttl(seconds: float, jitter: float) -> int:
+    """
+    Aplica uma variação aleatória de ±`jitter` (fração, ex.: 0.1 = 10%) ao TTL,
+    para que chaves gravadas juntas não expirem todas no mesmo instante.
+    """
+    if jitter > 0:
+        seconds = seconds * random.uniform(1 - jitter, 1 + jitter)
+    return max(1, int(seconds))
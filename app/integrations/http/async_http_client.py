@@ -0,0 +1,31 @@
+import httpx
+
+
+def build_async_http_client(
+    connect_timeout: float | None = 5.0,
+    read_timeout: float | None = 30.0,
+    write_timeout: float | None = 10.0,
+    pool_timeout: float | None = 5.0,
+    max_connections: int | None = 20,
+    max_keepalive_connections: int | None = 10,
+    keepalive_expiry: float | None = 30.0,
+    http2: bool = False,
+) -> httpx.AsyncClient:
+    """
+    Cria um httpx.AsyncClient de longa duração, com pool de conexões e keep-alive.
+
+    Deve ser compartilhado (singleton do container) e fechado com `aclose()` no encerramento.
+    HTTP/2 depende do pacote `h2` (`httpx[http2]`).
+    """
+    timeout = httpx.Timeout(
+        connect=connect_timeout,
+        read=read_timeout,
+        write=write_timeout,
+        pool=pool_timeout,
+    )
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    return httpx.AsyncClient(timeout=timeout, limits=limits, http2=bool(http2))
@@ -1,4 +1,4 @@
-from .catalogo_model import CatalogoModel
+from .catalogo_model import CatalogoBulkItemResult, CatalogoModel, CountMode, DescriptionStatus, NameSearchMode
 from .query_model import QueryModel
 from .base import (
     PersistableEntity,
@@ -23,5 +23,9 @@ __all__ = [
     "IdModel",
     "AuditModel",
     "CatalogoModel",
+    "CatalogoBulkItemResult",
+    "CountMode",
+    "DescriptionStatus",
+    "NameSearchMode",
     "QueryModel"
 ]
@@ -1,7 +1,38 @@
-from pydantic import Field
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
 from .base import SelllerSkuUuidPersistableEntity
 
 
+class DescriptionStatus(StrEnum):
+    """
+    Situação da descrição gerada pela IA.
+    """
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class NameSearchMode(StrEnum):
+    """
+    Modo de busca pelo nome do produto.
+    """
+
+    PREFIX = "prefix"  # Início do nome, usa o índice (seller_id, name_search)
+    WORD = "word"  # Palavras do nome, usa o índice de texto
+    CONTAINS = "contains"  # Trecho em qualquer posição, percorre os produtos do seller
+
+
+class CountMode(StrEnum):
+    """
+    Modo de contagem do total de produtos da listagem.
+    """
+
+    ESTIMATED = "estimated"  # Contagem guardada em cache, invalidada nas gravações do seller
+    EXACT = "exact"  # Contagem feita no banco a cada requisição
+
+
 class CatalogoModel(SelllerSkuUuidPersistableEntity):
     seller_id: str = Field(..., pattern=r'^[a-z0-9]+$', description="Só letras minúsculas e números")
     sku: str = Field(..., pattern=r'^[A-Za-z0-9]+$', description="Só letras e números, sem espaços")
@@ -9,4 +40,18 @@ class CatalogoModel(SelllerSkuUuidPersistableEntity):
     description: str | None = Field(
         default=None, max_length=300, description="Descrição do produto, até 300 caracteres"
     )
+    description_status: DescriptionStatus | None = Field(
+        default=None, description="Situação da geração da descrição pela IA"
+    )
+
+
+class CatalogoBulkItemResult(BaseModel):
+    """
+    Resultado do cadastro de um item de uma importação em lote.
+    """
 
+    index: int = Field(..., description="Posição do item na requisição")
+    sku: str | None = Field(None, description="SKU do item")
+    created: bool = Field(..., description="Indica se o produto foi cadastrado")
+    slug: str | None = Field(None, description="Identificação do erro, quando houver")
+    message: str | None = Field(None, description="Descrição do erro, quando houver")
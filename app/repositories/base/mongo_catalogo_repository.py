@@ -1,5 +1,6 @@
 from typing import Type, Generic, List, Optional, TypeVar
-from pymongo import ReturnDocument
+from pymongo import InsertOne, ReturnDocument
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 from pydantic import BaseModel
 from app.common.datetime import utcnow
 from app.integrations.database.mongo_client import MongoClient
@@ -12,6 +13,9 @@ T = TypeVar("T", bound=BaseModel)
 ID = TypeVar("ID", bound=int | str)
 Q = TypeVar("Q", bound=QueryModel)
 
+# Collation padrão das listagens: português, sem diferenciar maiúsculas/minúsculas
+DEFAULT_COLLATION = {"locale": "pt", "strength": 2}
+
 
 class MongoCatalogoRepository(AsyncCrudRepository[T, ID], Generic[T, ID]):
 
@@ -31,17 +35,85 @@ class MongoCatalogoRepository(AsyncCrudRepository[T, ID], Generic[T, ID]):
         when = utcnow()
         entity_dict["created_at"] = when
         entity_dict["updated_at"] = when
+        self.prepare_document(entity_dict)
+
+        try:
+            created = await self.collection.insert_one(entity_dict)
+        except DuplicateKeyError as exception:
+            # Import local para evitar import circular entre repositórios e serviços
+            from app.services.catalogo.catalogo_exceptions import ProductAlreadyExistsException
 
-        created = await self.collection.insert_one(entity_dict)
+            raise ProductAlreadyExistsException() from exception
         # XXX Rever pegar chave do banco.
         entity_dict["_id"] = created.inserted_id
         return self.model_class(**entity_dict)
     
+    async def bulk_create(self, entities: List[T]) -> dict[int, int]:
+        """
+        Insere várias entidades em um único bulk_write não ordenado.
+
+        :param entities: Entidades a serem inseridas.
+        :return: Falhas indexadas pela posição da entidade na lista -> código de erro do MongoDB.
+        """
+        if not entities:
+            return {}
+        when = utcnow()
+        operations = []
+        for entity in entities:
+            entity_dict = entity.model_dump(by_alias=True)
+            entity_dict["created_at"] = when
+            entity_dict["updated_at"] = when
+            self.prepare_document(entity_dict)
+            operations.append(InsertOne(entity_dict))
+
+        try:
+            await self.collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as exception:
+            return {error["index"]: error["code"] for error in exception.details.get("writeErrors", [])}
+        return {}
+
+    async def find_existing_sellerid_skus(self, seller_skus: List[tuple[str, str]]) -> set[tuple[str, str]]:
+        """
+        Verifica, em uma única consulta, quais pares (seller_id, sku) já estão cadastrados.
+        """
+        if not seller_skus:
+            return set()
+        query_filter = self.build_sellerid_skus_filter(seller_skus)
+        cursor = self.collection.find(query_filter, {"_id": 0, "seller_id": 1, "sku": 1})
+        return {(document["seller_id"], document["sku"]) async for document in cursor}
+
+    async def find_by_sellerid_skus(self, seller_skus: List[tuple[str, str]]) -> List[T]:
+        """
+        Busca, em uma única consulta, os produtos de vários pares (seller_id, sku).
+        Pares sem produto cadastrado são ignorados.
+        """
+        if not seller_skus:
+            return []
+        cursor = self.collection.find(self.build_sellerid_skus_filter(seller_skus))
+        return [self.model_class(**document) async for document in cursor]
+
+    def prepare_document(self, document: dict) -> dict:
+        """
+        Ponto de extensão para completar o documento antes de gravá-lo (insert, update ou patch).
+        Usado para manter campos derivados, como os de busca.
+        """
+        return document
+
     @staticmethod
     def build_sellerid_sku_filter(seller_id: str, sku: str) -> dict:
         query_filter = {"seller_id": seller_id, "sku": sku}
         return query_filter
     
+    @staticmethod
+    def build_sellerid_skus_filter(seller_skus: List[tuple[str, str]]) -> dict:
+        # Um $in de skus por seller, usando o índice único (seller_id, sku)
+        skus_by_seller: dict[str, list[str]] = {}
+        for seller_id, sku in seller_skus:
+            skus_by_seller.setdefault(seller_id, []).append(sku)
+        return {
+            "$or": [{"seller_id": seller_id, "sku": {"$in": skus}} for seller_id, skus in skus_by_seller.items()]
+        }
+
     @staticmethod
     def build_sellerid_filter(seller_id: str) -> dict:
         query_filter = {"seller_id": seller_id}
@@ -60,23 +132,62 @@ class MongoCatalogoRepository(AsyncCrudRepository[T, ID], Generic[T, ID]):
             result = self.model_class(**result)
         return result
     
-    async def find(self, filters: dict, limit: int = 20, offset: int = 0, sort: dict | None = None) -> List[T]:
-        query = filters  # agora é um dict
-        cursor = self.collection.find(query)
+    def _find_cursor(
+        self,
+        filters: dict,
+        limit: int,
+        offset: int,
+        sort: dict | None,
+        collation: dict | None,
+        projection: dict | None = None,
+    ):
+        cursor = self.collection.find(filters, projection)
         if sort:
             for field, order in sort.items():
                 cursor = cursor.sort(field, order)
         cursor = cursor.skip(offset).limit(limit)
 
-        cursor = cursor.collation({"locale": "pt", "strength": 2})
+        # Buscas em campos normalizados usam a collation simples, a mesma dos seus índices
+        if collation:
+            cursor = cursor.collation(collation)
+        return cursor
+
+    async def find(
+        self,
+        filters: dict,
+        limit: int = 20,
+        offset: int = 0,
+        sort: dict | None = None,
+        collation: dict | None = DEFAULT_COLLATION,
+    ) -> List[T]:
+        cursor = self._find_cursor(filters, limit, offset, sort, collation)
 
         entities = []
         async for document in cursor:
             entities.append(self.model_class(**document))
         return entities
 
+    async def find_projected(
+        self,
+        filters: dict,
+        projection: dict,
+        limit: int = 20,
+        offset: int = 0,
+        sort: dict | None = None,
+        collation: dict | None = DEFAULT_COLLATION,
+    ) -> List[dict]:
+        """
+        Busca apenas os campos da projeção e retorna os documentos sem convertê-los no modelo.
+        """
+        cursor = self._find_cursor(filters, limit, offset, sort, collation, projection)
+        return [document async for document in cursor]
+
+    async def count(self, filters: dict) -> int:
+        return await self.collection.count_documents(filters)
+
     async def _update_document(self, filter: dict, document: dict) -> T | None:
         document["updated_at"] = utcnow()
+        self.prepare_document(document)
 
         updated_document = await self.collection.find_one_and_update(
             filter,
@@ -87,21 +198,30 @@ class MongoCatalogoRepository(AsyncCrudRepository[T, ID], Generic[T, ID]):
             updated_document = self.model_class(**updated_document)
         return updated_document
 
-    async def update(self, filter: dict, entity: T) -> T | None:
-        entity_dict = entity.model_dump(by_alias=True, exclude={"id"})
+    async def update(self, filter: dict, entity: T, exclude: set[str] | None = None) -> T | None:
+        """
+        Substitui os campos do documento pelos da entidade, exceto os de `exclude`, que são mantidos.
+        """
+        entity_dict = entity.model_dump(by_alias=True, exclude={"id", *(exclude or ())})
 
         updated_document = await self._update_document(filter, entity_dict)
         return updated_document
 
-    async def update_by_sellerid_sku(self, seller_id, sku, entity: T) -> T | None:
+    async def update_by_sellerid_sku(self, seller_id, sku, entity: T, exclude: set[str] | None = None) -> T | None:
         query_filter = self.build_sellerid_sku_filter(seller_id, sku)
 
-        updated_document = await self.update(query_filter, entity)
+        updated_document = await self.update(query_filter, entity, exclude=exclude)
         return updated_document
 
-    async def patch_by_sellerid_sku(self, seller_id, sku, patch_entity) -> T | None:
+    async def patch_by_sellerid_sku(self, seller_id, sku, patch_entity, condition: dict | None = None) -> T | None:
+        """
+        Altera apenas os campos de `patch_entity`.
 
+        :param condition: Filtro adicional; se o documento não o atender, nada é alterado e o retorno é None.
+        """
         query_filter = self.build_sellerid_sku_filter(seller_id, sku)
+        if condition:
+            query_filter.update(condition)
         updated_document = await self._update_document(query_filter, patch_entity)
         return updated_document
     
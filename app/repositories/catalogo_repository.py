@@ -1,6 +1,8 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from app.common.text_utils import normalize_search_text
+
 from ..models import CatalogoModel
 from .base import MongoCatalogoRepository
 
@@ -17,6 +19,12 @@ class CatalogoRepository(MongoCatalogoRepository[CatalogoModel, UUID]):
     def __init__(self, client: "MongoClient"):
         super().__init__(client, collection_name=self.COLLECTION_NAME, model_class=CatalogoModel)
 
+    def prepare_document(self, document: dict) -> dict:
+        # Mantém o nome normalizado usado pela busca por prefixo (índice seller_id + name_search)
+        if "name" in document:
+            document["name_search"] = normalize_search_text(document["name"])
+        return document
+
 
 class CatalogoRepositoryV1(AsyncMemoryRepository[CatalogoModel, UUID]):
 
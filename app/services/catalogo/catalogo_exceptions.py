@@ -1,4 +1,5 @@
-from app.common.exceptions import ConflictException, NotFoundException
+from app.common.exceptions import BadRequestException, ConflictException, NotFoundException
+
 
 class ProductAlreadyExistsException(ConflictException):
     def __init__(self):
@@ -10,6 +11,7 @@ class ProductAlreadyExistsException(ConflictException):
         ]
         super().__init__(details)
 
+
 class ProductNotExistException(NotFoundException):
     def __init__(self):
         details = [
@@ -20,6 +22,7 @@ class ProductNotExistException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class ProductNameLengthException(NotFoundException):
     def __init__(self):
         details = [
@@ -30,6 +33,7 @@ class ProductNameLengthException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class SKULengthException(NotFoundException):
     def __init__(self):
         details = [
@@ -40,6 +44,7 @@ class SKULengthException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class SellerIDException(NotFoundException):
     def __init__(self):
         details = [
@@ -50,6 +55,7 @@ class SellerIDException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class NoFieldsToUpdateException(NotFoundException):
     def __init__(self):
         details = [
@@ -60,6 +66,7 @@ class NoFieldsToUpdateException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class SellerIDNotExistException(NotFoundException):
     def __init__(self):
         details = [
@@ -70,6 +77,7 @@ class SellerIDNotExistException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class LikeNotFoundException(NotFoundException):
     def __init__(self):
         details = [
@@ -80,6 +88,7 @@ class LikeNotFoundException(NotFoundException):
         ]
         super().__init__(details)
 
+
 class ProductNameNotFoundException(NotFoundException):
     def __init__(self):
         details = [
@@ -91,3 +100,54 @@ class ProductNameNotFoundException(NotFoundException):
         super().__init__(details)
 
 
+class InvalidSortFieldException(BadRequestException):
+    def __init__(self, field: str, allowed_fields: tuple[str, ...]):
+        details = [
+            {
+                "message": f"Ordenação por '{field}' não permitida. Campos permitidos: {', '.join(allowed_fields)}",
+                "slug": "400-ordenacao-nao-permitida",
+                "location": "query",
+                "field": "_sort",
+            }
+        ]
+        super().__init__(details)
+
+
+class MultipleSortFieldsException(BadRequestException):
+    def __init__(self, fields: list[str]):
+        details = [
+            {
+                "message": f"Ordenação por {', '.join(fields)} não suportada: informe só um campo de ordenação "
+                "(o sku é sempre usado como desempate)",
+                "slug": "400-ordenacao-multipla",
+                "location": "query",
+                "field": "_sort",
+            }
+        ]
+        super().__init__(details)
+
+
+class MixedSortDirectionsException(BadRequestException):
+    def __init__(self):
+        details = [
+            {
+                "message": "Ordenação com direções diferentes não suportada: use asc ou desc para todos os campos",
+                "slug": "400-ordenacao-direcoes-diferentes",
+                "location": "query",
+                "field": "_sort",
+            }
+        ]
+        super().__init__(details)
+
+
+class InvalidFieldsException(BadRequestException):
+    def __init__(self, fields: list[str], allowed_fields: tuple[str, ...]):
+        details = [
+            {
+                "message": f"Campos inválidos: {', '.join(fields)}. Campos permitidos: {', '.join(allowed_fields)}",
+                "slug": "400-campos-invalidos",
+                "location": "query",
+                "field": "_fields",
+            }
+        ]
+        super().__init__(details)
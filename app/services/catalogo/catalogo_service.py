@@ -1,5 +1,16 @@
-from app.api.common.schemas.pagination import Paginator
-from ...models import CatalogoModel
+import asyncio
+import json
+import re
+import time
+
+from bson import json_util
+
+from app.api.common.schemas.pagination import Paginator, decode_cursor, encode_cursor
+from app.common.hash_utils import generate_hash
+from app.common.text_utils import normalize_search_text
+from app.common.error_codes import ErrorCodes
+from app.common.exceptions import ApplicationException, BadRequestException
+from ...models import CatalogoBulkItemResult, CatalogoModel, CountMode, DescriptionStatus, NameSearchMode
 from ...repositories import CatalogoRepository
 from ..base import CrudService
 from .catalogo_exceptions import ( 
@@ -11,19 +22,67 @@ from .catalogo_exceptions import (
     SKULengthException, 
     SellerIDNotExistException, 
     LikeNotFoundException,
-    ProductNameNotFoundException
+    ProductNameNotFoundException,
+    InvalidSortFieldException,
+    MixedSortDirectionsException,
+    MultipleSortFieldsException,
+    InvalidFieldsException,
 )
 from dependency_injector.wiring import inject, Provide
 from app.api.v1.schemas.catalogo_schema import CatalogoUpdate
 from typing import TypeVar
+from app.integrations.cache.cache_invalidation import CacheInvalidationBus
+from app.integrations.cache.cache_keys import (
+    count_cache_key,
+    listing_cache_key,
+    listing_version_key,
+    product_cache_key,
+    product_cache_keys,
+    product_response_cache_key,
+)
+from app.integrations.cache.cache_metrics import CacheMetrics
+from app.integrations.cache.local_cache import LocalCache
+from app.integrations.cache.single_flight import SingleFlight
+from app.integrations.cache.ttl import jittered_ttl
 from app.integrations.cache.redis_asyncio_adapter import RedisAsyncioAdapter
-from app.worker.description.creating_product_description import CreatingProductDescription
+from app.worker.description.description_job_queue import DescriptionJobQueue
 
 T = TypeVar("T")
 
-from pclogging import LoggingBuilder
+# Código de erro do MongoDB para violação de índice único
+DUPLICATE_KEY_ERROR_CODE = 11000
+
+# Campos aceitos no _sort da listagem, cada um com índice (seller_id, campo, sku)
+LIST_SORT_FIELDS = ("name", "sku", "created_at", "updated_at")
+
+# Campos que podem ser solicitados em _fields
+PROJECTION_FIELDS = tuple(CatalogoModel.model_fields)
+
+# Intervalo (s) entre consultas ao cache enquanto outro processo carrega o produto
+CACHE_LOCK_POLL_SECONDS = 0.05
+
+# Marcador gravado no Redis para produtos que não existem (cache negativo)
+NOT_FOUND_CACHE_ENTRY = {"not_found": True}
+
+# Campos mantidos em um PUT sem descrição
+DESCRIPTION_FIELDS = {"description", "description_status"}
+
+# Resultado de uma leitura do cache que encontrou o marcador de produto inexistente
+PRODUCT_NOT_FOUND = object()
+
+# Validade das contagens da listagem guardadas no cache
+COUNT_CACHE_TTL_SECONDS = 300
+
+# Validade das páginas da listagem guardadas no cache
+LIST_CACHE_TTL_SECONDS = 60
+
+# Leitura das páginas em cache com datas com fuso, como as retornadas pelo MongoClient
+LIST_CACHE_JSON_OPTIONS = json_util.JSONOptions(tz_aware=True)
 
-LoggingBuilder.init(log_level="DEBUG")
+# Campos de ordenação da listagem que são gravados normalizados
+LIST_SORT_ALIASES = {"name": "name_search"}
+
+from pclogging import LoggingBuilder
 
 logger = LoggingBuilder.get_logger(__name__)
 
@@ -31,39 +90,185 @@ class CatalogoService(CrudService[CatalogoModel, int]):
 
     redis_adapter: RedisAsyncioAdapter
 
-    def __init__(self, repository: CatalogoRepository, redis_adapter: RedisAsyncioAdapter):
+    def __init__(
+        self,
+        repository: CatalogoRepository,
+        redis_adapter: RedisAsyncioAdapter,
+        local_cache: LocalCache | None = None,
+        invalidation_bus: CacheInvalidationBus | None = None,
+        cache_lock_enabled: bool = False,
+        cache_lock_timeout_seconds: float = 2.0,
+        cache_soft_ttl_seconds: int = 240,
+        cache_hard_ttl_seconds: int = 600,
+        cache_ttl_jitter: float = 0.1,
+        cache_not_found_ttl_seconds: int = 30,
+        cache_write_through: bool = False,
+        cache_metrics: CacheMetrics | None = None,
+    ):
         super().__init__(repository)
         self.redis_adapter = redis_adapter
+        self.local_cache = local_cache
+        self.invalidation_bus = invalidation_bus
+        self.cache_lock_enabled = cache_lock_enabled
+        self.cache_lock_timeout_seconds = cache_lock_timeout_seconds
+        self.cache_soft_ttl_seconds = cache_soft_ttl_seconds
+        self.cache_hard_ttl_seconds = cache_hard_ttl_seconds
+        self.cache_ttl_jitter = cache_ttl_jitter
+        self.cache_not_found_ttl_seconds = cache_not_found_ttl_seconds
+        self.cache_write_through = cache_write_through
+        self.cache_metrics = cache_metrics or CacheMetrics()
+        self._single_flight = SingleFlight()
+        self._background_tasks: set[asyncio.Task] = set()
 
     @inject
-    async def create(self,
-                    catalogo: CatalogoModel,
-                    creating_product_description: CreatingProductDescription = Provide["creating_product_description"],
-                    ) -> CatalogoModel:
+    async def create(
+        self,
+        catalogo: CatalogoModel,
+        description_job_queue: DescriptionJobQueue = Provide["description_job_queue"],
+    ) -> CatalogoModel:
         """
         Cria um novo produto no catálogo.
+        A descrição é gerada depois pelo worker de IA, a partir da fila de descrições.
         
         :param catalogo: Produto a ser cadastrado.
-        :param product_description: Descrição do produto gerada pela IA.
-        :return: Instância de Produto criado.
+        :param description_job_queue: Fila consumida pelo worker de descrição.
+        :return: Instância de Produto criado, com a descrição pendente.
         """
         await self.review(catalogo)
         await self.validate(catalogo)
-        # Gera a descrição usando IA
-        description_data = await creating_product_description.create_description(catalogo)
-        # Se a IA retornar um dicionário com a chave "description"
-        if description_data and "description" in description_data:
-            catalogo.description = description_data["description"]
+        catalogo.description = None
+        catalogo.description_status = DescriptionStatus.PENDING
+        created = await self.save(catalogo)
+        try:
+            await description_job_queue.enqueue(created.seller_id, created.sku)
+        except Exception as e:
+            logger.warning(f"Falha ao enfileirar geração de descrição: {e}")
+            if await self.mark_description_failed([(created.seller_id, created.sku)]):
+                created.description_status = DescriptionStatus.FAILED
+        if self.cache_write_through:
+            # Sobrescreve também um eventual marcador de produto inexistente
+            await self.cache_written_product(created.seller_id, created.sku, created)
         else:
-            catalogo.description = ""
-        return await self.save(catalogo)
+            await self.clear_not_found_cache([(created.seller_id, created.sku)])
+        await self.invalidate_counts(created.seller_id)
+        await self.invalidate_listing(created.seller_id)
+        return created
     
+    @inject
+    async def bulk_create(
+        self,
+        catalogos: list[CatalogoModel],
+        description_job_queue: DescriptionJobQueue = Provide["description_job_queue"],
+    ) -> list[CatalogoBulkItemResult]:
+        """
+        Cadastra vários produtos de uma vez.
+        A existência é verificada com uma única consulta e a gravação é feita com um bulk_write não ordenado.
+
+        :param catalogos: Produtos a serem cadastrados.
+        :param description_job_queue: Fila consumida pelo worker de descrição.
+        :return: Resultado de cada item, na mesma ordem da entrada.
+        """
+        results: dict[int, CatalogoBulkItemResult] = {}
+        candidates: dict[int, CatalogoModel] = {}
+        seen: set[tuple[str, str]] = set()
+
+        for index, catalogo in enumerate(catalogos):
+            try:
+                await self.review(catalogo)
+                await self.validate_fields(catalogo)
+            except ApplicationException as exception:
+                results[index] = self._bulk_item_error(index, catalogo.sku, exception)
+                continue
+            key = (catalogo.seller_id, catalogo.sku)
+            if key in seen:
+                results[index] = self._bulk_item_error(index, catalogo.sku, ProductAlreadyExistsException())
+                continue
+            seen.add(key)
+            candidates[index] = catalogo
+
+        existing = await self.repository.find_existing_sellerid_skus(list(seen))
+        for index, catalogo in list(candidates.items()):
+            if (catalogo.seller_id, catalogo.sku) in existing:
+                results[index] = self._bulk_item_error(index, catalogo.sku, ProductAlreadyExistsException())
+                del candidates[index]
+
+        indexes = list(candidates.keys())
+        to_insert = list(candidates.values())
+        for catalogo in to_insert:
+            catalogo.description = None
+            catalogo.description_status = DescriptionStatus.PENDING
+        failures = await self.repository.bulk_create(to_insert)
+
+        created: list[tuple[str, str]] = []
+        for position, (index, catalogo) in enumerate(zip(indexes, to_insert)):
+            error_code = failures.get(position)
+            if error_code is None:
+                results[index] = CatalogoBulkItemResult(index=index, sku=catalogo.sku, created=True)
+                created.append((catalogo.seller_id, catalogo.sku))
+            elif error_code == DUPLICATE_KEY_ERROR_CODE:
+                results[index] = self._bulk_item_error(index, catalogo.sku, ProductAlreadyExistsException())
+            else:
+                results[index] = CatalogoBulkItemResult(
+                    index=index, sku=catalogo.sku, created=False,
+                    slug=ErrorCodes.SERVER_ERROR.slug, message=ErrorCodes.SERVER_ERROR.message,
+                )
+
+        try:
+            await description_job_queue.enqueue_many(created)
+        except Exception as e:
+            logger.warning(f"Falha ao enfileirar geração de descrição: {e}")
+            await self.mark_description_failed(created)
+
+        await self.clear_not_found_cache(created)
+        for seller_id in {seller_id for seller_id, _ in created}:
+            await self.invalidate_counts(seller_id)
+            await self.invalidate_listing(seller_id)
+
+        return [results[index] for index in sorted(results)]
+
+    async def mark_description_failed(self, seller_skus: list[tuple[str, str]]) -> bool:
+        """
+        Marca como falha a descrição de produtos que não entraram na fila de descrições.
+        Sem job na fila, a descrição ficaria pendente para sempre; com a falha, o seller pode informá-la.
+
+        :return: True se todos os produtos foram marcados.
+        """
+        marked = True
+        for seller_id, sku in seller_skus:
+            try:
+                await self.repository.patch_by_sellerid_sku(
+                    seller_id,
+                    sku,
+                    {"description_status": DescriptionStatus.FAILED},
+                    condition={"description_status": DescriptionStatus.PENDING},
+                )
+            except Exception as e:
+                logger.warning(f"Falha ao marcar descrição como falha -> seller_id: {seller_id}, sku: {sku}: {e}")
+                marked = False
+        return marked
+
+    @staticmethod
+    def _bulk_item_error(index: int, sku: str | None, exception: ApplicationException) -> CatalogoBulkItemResult:
+        detail = exception.details[0] if exception.details else {}
+        return CatalogoBulkItemResult(
+            index=index,
+            sku=sku,
+            created=False,
+            slug=detail.get("slug", exception.slug),
+            message=detail.get("message", exception.message),
+        )
+
     async def validate(self, catalogo: CatalogoModel) -> None:
-        
+        # A duplicidade de seller_id + sku é garantida pelo índice único (ProductAlreadyExistsException no insert)
+        await self.validate_fields(catalogo)
+
+    async def validate_fields(self, catalogo: CatalogoModel) -> None:
+        """
+        Valida os campos do produto, sem consultar o banco.
+        """
         await self.validate_len_seller_id(catalogo.seller_id)
         await self.validate_len_sku(catalogo.sku)
         await self.validate_len_product_name(catalogo.name)
-        await self.validate_product_exist(catalogo.seller_id, catalogo.sku)
 
     async def review(self, catalogo: CatalogoModel) -> None:
         # Converte e limpa campos
@@ -78,12 +283,24 @@ class CatalogoService(CrudService[CatalogoModel, int]):
 
         if not model.name or not model.name.strip():
             raise ProductNameNotFoundException()
-        
-        model = await self.validate_update(seller_id, sku, model)
-        model = await self.repository.update_by_sellerid_sku(seller_id, sku, model)
-        #Remove produto do cache após atualização
-        cache_key = f"produto:{seller_id}:{sku}"
-        await self.redis_adapter.delete(cache_key)
+
+        exclude = None
+        if model.description is not None:
+            # Descrição informada pelo seller: o worker de IA não pode mais sobrescrevê-la
+            model.description_status = None
+        else:
+            # Sem descrição: mantém a gravada e o status, para o worker concluir uma descrição pendente
+            exclude = DESCRIPTION_FIELDS
+
+        # find_one_and_update retorna None quando o produto não existe
+        model = await self.repository.update_by_sellerid_sku(seller_id, sku, model, exclude=exclude)
+        if model is None:
+            raise ProductNotExistException()
+        #Atualiza (write-through) ou remove o produto do cache após atualização
+        await self.refresh_product_cache(seller_id, sku, model)
+        # O nome pode ter mudado, o que altera as contagens das buscas
+        await self.invalidate_counts(seller_id)
+        await self.invalidate_listing(seller_id)
         return model
     
     async def delete_by_sellerid_sku(self, seller_id: str, sku: str, raises_exception: bool = True) -> bool:
@@ -95,35 +312,79 @@ class CatalogoService(CrudService[CatalogoModel, int]):
         :return: Confirmação deleção do produto.
         :raises NotFoundException: Se não encontrar o produto.
         """
-        await self.validate_delete(seller_id, sku)
         deleted = await self.repository.delete_by_sellerid_sku(seller_id, sku)
+        if not deleted and raises_exception:
+            raise ProductNotExistException()
         #Remove produto do cache após deleção
-        cache_key = f"produto:{seller_id}:{sku}"
-        await self.redis_adapter.delete(cache_key)
+        if deleted and self.cache_write_through:
+            await self.cache_deleted_product(seller_id, sku)
+        else:
+            await self.evict_product_cache(seller_id, sku)
+        if deleted:
+            await self.invalidate_counts(seller_id)
+            await self.invalidate_listing(seller_id)
         return deleted
     
     async def patch_by_sellerid_sku(self, seller_id: str, sku: str, patch_model: dict) -> T:
 
-        await self.find_by_seller_id(seller_id)
-        patch_model = await self.validate_patch(seller_id, sku, patch_model)
+        if "description" in patch_model:
+            # Descrição informada pelo seller: o worker de IA não pode mais sobrescrevê-la
+            patch_model = {**patch_model, "description_status": None}
+
+        # find_one_and_update retorna None quando o produto não existe
         model = await self.repository.patch_by_sellerid_sku(seller_id, sku, patch_model)
-        #Remove produto do cache após atualização
-        cache_key = f"produto:{seller_id}:{sku}"
-        await self.redis_adapter.delete(cache_key)
+        if model is None:
+            raise ProductNotExistException()
+        #Atualiza (write-through) ou remove o produto do cache após atualização
+        await self.refresh_product_cache(seller_id, sku, model)
+        if "name" in patch_model:
+            await self.invalidate_counts(seller_id)
+        await self.invalidate_listing(seller_id)
 
         return model
     
-    async def find_by_filter(self, seller_id: str, paginator: Paginator = None, name_like: str = None) -> list[CatalogoModel]:
+    async def find_by_filter(
+        self,
+        seller_id: str,
+        paginator: Paginator = None,
+        name_like: str = None,
+        name_mode: NameSearchMode = NameSearchMode.PREFIX,
+        fields: list[str] | None = None,
+    ) -> list[CatalogoModel] | list[dict]:
         """ 
-        Busca produtos no catálogo filtrando por seller_id e opcionalmente por nome (like).
+        Busca produtos no catálogo filtrando por seller_id e opcionalmente por nome.
+
+        :param name_like: Texto buscado no nome do produto.
+        :param name_mode: Modo de busca do nome (prefixo, palavras ou trecho).
+        :param fields: Campos a retornar. Quando informado, o MongoDB devolve só esses campos
+            (mais as chaves de ordenação) e os documentos são retornados sem conversão para o modelo.
         """
-        filters = {"seller_id": seller_id.lower()}
-        if name_like:
-            filters["name"] = {"$regex": name_like, "$options": "i"}
-        limit = paginator.limit if paginator else 50
+        filters = self.build_list_filter(seller_id, name_like, name_mode)
+        # Busca um item a mais para saber se existe próxima página
+        limit = paginator.limit + 1 if paginator else 50
         offset = paginator.offset if paginator else 0
-        sort = paginator.get_sort_order() if paginator else None
-        result = await self.repository.find(filters=filters, limit=limit, offset=offset, sort=sort)
+        sort = self.build_list_sort(paginator.get_sort_order() if paginator else None)
+        if paginator and paginator.cursor:
+            filters.update(self.build_keyset_filter(sort, decode_cursor(paginator.cursor)))
+            offset = 0
+        # As chaves de ordenação e busca já são normalizadas: a collation simples é a mesma dos índices
+        cache_key = await self.build_listing_cache_key(
+            seller_id, {"filters": filters, "sort": sort, "offset": offset, "limit": limit, "fields": fields}
+        )
+        result = await self.find_listing_in_cache(cache_key, projected=bool(fields))
+        if result is None:
+            with self.cache_metrics.time_load("lista"):
+                if fields:
+                    projection = self.build_projection(fields, sort)
+                    result = await self.repository.find_projected(
+                        filters=filters, projection=projection, limit=limit, offset=offset, sort=sort, collation=None
+                    )
+                else:
+                    result = await self.repository.find(
+                        filters=filters, limit=limit, offset=offset, sort=sort, collation=None
+                    )
+            if result:
+                await self.save_listing_in_cache(cache_key, result)
         if not result:
             if name_like:
                 raise LikeNotFoundException()
@@ -131,20 +392,218 @@ class CatalogoService(CrudService[CatalogoModel, int]):
                 raise SellerIDNotExistException()
         return result
 
-    async def validate_product_exist(self, seller_id: str, sku: str) -> None:
+    async def count_by_filter(
+        self,
+        seller_id: str,
+        name_like: str = None,
+        name_mode: NameSearchMode = NameSearchMode.PREFIX,
+        count_mode: CountMode = CountMode.ESTIMATED,
+    ) -> int:
         """
-        Valida se um produto pode ser criado verificando se já existe um produto com o mesmo seller_id e SKU.
+        Conta os produtos da listagem com os mesmos filtros de find_by_filter.
+
+        As contagens ficam em um hash do Redis por seller, invalidado a cada gravação do seller.
+        No modo estimated a contagem do cache é reaproveitada; no exact o banco é sempre consultado.
         """
+        filters = self.build_list_filter(seller_id, name_like, name_mode)
+        cache_key = count_cache_key(seller_id)
+        cache_field = generate_hash(json.dumps(filters, sort_keys=True))
+        if count_mode == CountMode.ESTIMATED:
+            try:
+                cached = await self.redis_adapter.hget_json(cache_key, cache_field)
+            except Exception as e:
+                logger.warning(f"Falha ao buscar contagem no cache: {e}")
+                cached = None
+            if cached is not None:
+                self.cache_metrics.hit("produto_count")
+                return cached
+            self.cache_metrics.miss("produto_count")
+
+        with self.cache_metrics.time_load("produto_count"):
+            total = await self.repository.count(filters)
         try:
-            # Tenta encontrar o produto pelo seller_id e SKU
-            product_exist = await self.find_product(seller_id, sku)
-        except Exception:  # Captura NotFoundException ou equivalente
-            product_exist = None
+            await self.redis_adapter.hset_json(
+                cache_key, cache_field, total, expires_in_seconds=COUNT_CACHE_TTL_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao salvar contagem no cache: {e}")
+        return total
+
+    async def invalidate_counts(self, seller_id: str) -> None:
+        """
+        Descarta as contagens de listagem do seller guardadas no cache.
+        """
+        try:
+            await self.redis_adapter.delete(count_cache_key(seller_id))
+            self.cache_metrics.eviction("produto_count")
+        except Exception as e:
+            logger.warning(f"Falha ao invalidar contagens no cache: {e}")
+
+    async def build_listing_cache_key(self, seller_id: str, query: dict) -> str | None:
+        """
+        Monta a chave de uma página da listagem: lista:{seller}:{versão}:{hash da consulta}.
+        A versão do seller muda a cada gravação, o que descarta todas as páginas antigas sem SCAN.
+        """
+        try:
+            version = await self.redis_adapter.get_str(listing_version_key(seller_id)) or "0"
+        except Exception as e:
+            logger.warning(f"Falha ao buscar versão da listagem no cache: {e}")
+            return None
+        query_hash = generate_hash(json_util.dumps(query, sort_keys=True))
+        return listing_cache_key(seller_id, version, query_hash)
+
+    async def find_listing_in_cache(
+        self, cache_key: str | None, projected: bool
+    ) -> list[CatalogoModel] | list[dict] | None:
+        if cache_key is None:
+            return None
+        try:
+            cached = await self.redis_adapter.get_str(cache_key)
+        except Exception as e:
+            logger.warning(f"Falha ao buscar listagem no cache: {e}")
+            return None
+        if cached is None:
+            self.cache_metrics.miss("lista")
+            return None
+        self.cache_metrics.hit("lista")
+        with self.cache_metrics.time_serialization("lista"):
+            # json_util preserva datas e demais tipos do MongoDB nos documentos projetados
+            documents = json_util.loads(cached, json_options=LIST_CACHE_JSON_OPTIONS)
+            if projected:
+                return documents
+            return [CatalogoModel.model_validate(document) for document in documents]
+
+    async def save_listing_in_cache(self, cache_key: str | None, result: list[CatalogoModel] | list[dict]) -> None:
+        if cache_key is None:
+            return
+        with self.cache_metrics.time_serialization("lista"):
+            documents = [item.model_dump() if isinstance(item, CatalogoModel) else item for item in result]
+            content = json_util.dumps(documents)
+        try:
+            await self.redis_adapter.set_str(cache_key, content, expires_in_seconds=LIST_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Falha ao salvar listagem no cache: {e}")
+
+    async def invalidate_listing(self, seller_id: str) -> None:
+        """
+        Troca a versão das listagens do seller; as páginas da versão anterior expiram sozinhas.
+        """
+        try:
+            await self.redis_adapter.incr(listing_version_key(seller_id))
+            self.cache_metrics.eviction("lista")
+        except Exception as e:
+            logger.warning(f"Falha ao invalidar listagem no cache: {e}")
+
+    def build_list_filter(
+        self,
+        seller_id: str,
+        name_like: str = None,
+        name_mode: NameSearchMode = NameSearchMode.PREFIX,
+    ) -> dict:
+        filters = {"seller_id": seller_id.lower()}
+        filters.update(self.build_name_filter(name_like, name_mode))
+        return filters
+
+    @staticmethod
+    def parse_fields(fields: str | None) -> list[str] | None:
+        """
+        Converte o parâmetro _fields (campos separados por vírgula) em lista.
+
+        :raises InvalidFieldsException: Se algum campo não existir no produto.
+        """
+        if not fields:
+            return None
+        field_list = list(dict.fromkeys(field.strip() for field in fields.split(",") if field.strip()))
+        invalid = [field for field in field_list if field not in PROJECTION_FIELDS]
+        if invalid:
+            raise InvalidFieldsException(invalid, PROJECTION_FIELDS)
+        return field_list or None
+
+    @staticmethod
+    def build_projection(fields: list[str], sort: dict) -> dict:
+        """
+        Projeção do MongoDB com os campos pedidos e as chaves de ordenação, usadas no cursor.
+        """
+        projection = {"_id": 0}
+        for field in [*fields, *sort]:
+            projection[field] = 1
+        return projection
+
+    @staticmethod
+    def build_list_sort(sort: dict | None) -> dict:
+        """
+        Ordenação da listagem: usa os campos normalizados e o sku como desempate,
+        para que a ordem seja total e possa ser retomada por cursor.
+
+        :raises InvalidSortFieldException: Se algum campo não tiver índice para ordenação.
+        :raises MultipleSortFieldsException: Se for informado mais de um campo além do sku.
+        :raises MixedSortDirectionsException: Se os campos tiverem direções diferentes.
+        """
+        sort_fields = [field for field in sort or {} if field != "sku"]
+        for field in sort_fields:
+            if field not in LIST_SORT_FIELDS:
+                raise InvalidSortFieldException(field, LIST_SORT_FIELDS)
+        # Os índices cobrem um campo de ordenação (além do sku), combinações seriam ordenadas em memória
+        if len(sort_fields) > 1:
+            raise MultipleSortFieldsException(sort_fields)
+        # Os índices só são percorridos com todas as chaves em um mesmo sentido (ou todas no inverso)
+        if len(set((sort or {}).values())) > 1:
+            raise MixedSortDirectionsException()
+        list_sort = {LIST_SORT_ALIASES.get(field, field): order for field, order in (sort or {}).items()}
+        list_sort.setdefault("sku", list(list_sort.values())[-1] if list_sort else 1)
+        return list_sort
+
+    @staticmethod
+    def build_keyset_filter(sort: dict, after: dict) -> dict:
+        """
+        Filtro de range para buscar os itens posteriores ao cursor (paginação keyset).
+        Para a ordenação (a, b) resulta em: a > va OU (a = va E b > vb).
+        """
+        if set(after) != set(sort):
+            raise BadRequestException(
+                details=[{"message": "Cursor não corresponde à ordenação", "location": "query", "field": "_cursor"}]
+            )
+        fields = list(sort.items())
+        clauses = []
+        for position, (field, order) in enumerate(fields):
+            clause = {previous: after[previous] for previous, _ in fields[:position]}
+            clause[field] = {"$gt" if order == 1 else "$lt": after[field]}
+            clauses.append(clause)
+        return {"$or": clauses}
+
+    def build_cursor(self, catalogo: CatalogoModel | dict, paginator: Paginator) -> str:
+        """
+        Gera o cursor da próxima página a partir do último produto da página atual.
+        """
+        sort = self.build_list_sort(paginator.get_sort_order())
+        if isinstance(catalogo, dict):
+            # Documento projetado: as chaves de ordenação fazem parte da projeção
+            values = {field: catalogo.get(field) for field in sort}
+        else:
+            values = {
+                field: (
+                    normalize_search_text(catalogo.name) if field == "name_search" else getattr(catalogo, field, None)
+                )
+                for field in sort
+            }
+        return encode_cursor(values)
+
+    @staticmethod
+    def build_name_filter(name_like: str | None, name_mode: NameSearchMode = NameSearchMode.PREFIX) -> dict:
+        """
+        Monta o filtro de busca pelo nome. O texto do usuário nunca é usado como expressão regular.
+        """
+        normalized = normalize_search_text(name_like)
+        if not normalized:
+            return {}
+        if name_mode == NameSearchMode.WORD:
+            return {"$text": {"$search": normalized}}
+        pattern = re.escape(normalized)
+        if name_mode == NameSearchMode.PREFIX:
+            # Regex ancorada e sem opções: o MongoDB usa um range do índice (seller_id, name_search)
+            pattern = f"^{pattern}"
+        return {"name_search": {"$regex": pattern}}
 
-        # Se o produto já existir, lança uma exceção
-        if product_exist:
-            raise ProductAlreadyExistsException()
-        
     async def validate_len_product_name(self, name: str) -> None:
         """
         Valida o tamanho do nome do produto.
@@ -167,72 +626,411 @@ class CatalogoService(CrudService[CatalogoModel, int]):
         if not isinstance(seller_id, str) or not seller_id.strip() or len(seller_id.strip()) < 2:
             raise SellerIDException()
 
-    async def validate_patch(self, seller_id, sku, patch_model) -> dict:
+    async def find_by_sellerid_sku(self, seller_id: str, sku: str, raises_exception: bool = True) -> T | None:
+        product, _ = await self._find_by_sellerid_sku(seller_id, sku, raises_exception)
+        return product
 
-        try:
-            product_exist = await self.find_product(seller_id, sku)
-        except Exception:
-            product_exist = None
+    async def find_product_for_response(self, seller_id: str, sku: str) -> tuple[CatalogoModel, bool]:
+        """
+        Busca o produto para montar a resposta do GET e informa se ela pode ir para o cache de respostas.
+        Só é seguro guardar a resposta quando o produto veio do banco ou de uma entrada do Redis ainda
+        dentro da validade "soft"; cópias do L1 ou entradas vencidas podem estar desatualizadas.
+        """
+        return await self._find_by_sellerid_sku(seller_id, sku)
 
-        if not product_exist:
-            raise ProductNotExistException()
+    async def _find_by_sellerid_sku(
+        self, seller_id: str, sku: str, raises_exception: bool = True
+    ) -> tuple[T | None, bool]:
+        """
+        Retorna o produto e se ele veio de uma fonte atualizada (banco ou cache dentro da validade "soft").
+        """
+        logger.debug("Buscando produto no CACHE -> seller_id: %s, sku: %s", seller_id, sku)
+        cache_key = product_cache_key(seller_id, sku)
+        if self.local_cache is not None:
+            local = self.local_cache.get(cache_key)
+            if local is not None:
+                self.cache_metrics.hit("produto_local")
+                return local, False
+            self.cache_metrics.miss("produto_local")
 
-        return patch_model
-    
-    async def validate_update(self, seller_id: str, sku: str, catalogo: CatalogoModel) -> CatalogoModel:
-        try:
-            product_exist = await self.find_product(seller_id, sku)
-        except Exception:
-            product_exist = None
+        cached, stale = await self._read_cache_entry(seller_id, sku, cache_key)
+
+        if cached is PRODUCT_NOT_FOUND:
+            self.cache_metrics.negative_hit("produto")
+            if raises_exception:
+                raise ProductNotExistException()
+            return None, False
+
+        if cached is not None:
+            self.cache_metrics.hit("produto")
+            if stale:
+                # Stale-while-revalidate: responde com a cópia antiga e recarrega em segundo plano
+                self._schedule_refresh(seller_id, sku, cache_key)
+            self._set_local_cache(cache_key, cached)
+            return cached, not stale
+        self.cache_metrics.miss("produto")
+
+        # Leituras simultâneas do mesmo produto ausente no cache fazem uma única consulta ao banco
+        product_exist = await self._single_flight.do(
+            cache_key, lambda: self._load_product(seller_id, sku, cache_key)
+        )
 
         if not product_exist:
-            raise ProductNotExistException()
+            if raises_exception:
+                raise ProductNotExistException()
+            return None, False
+        self._set_local_cache(cache_key, product_exist)
+
+        return product_exist, True
+
+    async def find_many_by_sellerid_skus(
+        self, seller_skus: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], CatalogoModel]:
+        """
+        Busca vários produtos de uma vez: um MGET no Redis para todos os pares, uma única consulta
+        ao banco só para os que faltaram e um pipeline para gravá-los no cache.
+
+        :param seller_skus: Pares (seller_id, sku) buscados.
+        :return: Produtos encontrados, indexados pelo par (seller_id, sku). Pares inexistentes ficam de fora.
+        """
+        found: dict[tuple[str, str], CatalogoModel] = {}
+        pending: list[tuple[str, str]] = []
+        for seller_sku in dict.fromkeys(seller_skus):
+            local = None
+            if self.local_cache is not None:
+                local = self.local_cache.get(product_cache_key(*seller_sku))
+            if local is not None:
+                found[seller_sku] = local
+            else:
+                pending.append(seller_sku)
+        if self.local_cache is not None:
+            self.cache_metrics.hit("produto_local", len(found))
+            self.cache_metrics.miss("produto_local", len(pending))
+        if not pending:
+            return found
 
-        return catalogo
-            
-    async def validate_delete(self, seller_id: str, sku: str):
+        keys = [product_cache_key(*seller_sku) for seller_sku in pending]
         try:
-            product_exist = await self.find_product(seller_id, sku)
-        except Exception:
-            product_exist = None
+            cached_entries = await self.redis_adapter.mget_json(keys)
+        except Exception as e:
+            logger.warning(f"Falha ao buscar produtos no cache: {e}")
+            cached_entries = [None] * len(keys)
 
-        if not product_exist:
-            raise ProductNotExistException()
-        
-    async def find_by_sellerid_sku(self, seller_id: str, sku: str, raises_exception: bool = True) -> T | None:
-        logger.debug(f"Buscando produto no CACHE -> seller_id: {seller_id}, sku: {sku}")
-        cache_key = f"produto:{seller_id}:{sku}"
-        cached = await self.find_product_in_cache(seller_id, sku, cache_key)
+        misses: list[tuple[str, str]] = []
+        negative_hits = 0
+        for seller_sku, cache_key, cached_entry in zip(pending, keys, cached_entries):
+            with self.cache_metrics.time_serialization("produto"):
+                cached, stale = self._parse_cache_entry(cached_entry)
+            if cached is PRODUCT_NOT_FOUND:
+                negative_hits += 1
+                continue
+            if cached is None:
+                misses.append(seller_sku)
+                continue
+            if stale:
+                self._schedule_refresh(*seller_sku, cache_key)
+            found[seller_sku] = cached
+            self._set_local_cache(cache_key, cached)
+        self.cache_metrics.hit("produto", len(pending) - len(misses) - negative_hits)
+        self.cache_metrics.negative_hit("produto", negative_hits)
+        self.cache_metrics.miss("produto", len(misses))
+        if not misses:
+            return found
 
-        if cached is not None:
-            return cached
-        
+        # Versão dos marcadores de inexistente: tomada antes da leitura, perde para um cadastro concorrente
+        read_version = self.current_cache_version()
+        with self.cache_metrics.time_load("produto"):
+            products = await self.repository.find_by_sellerid_skus(misses)
+        loaded = {(product.seller_id, product.sku): product for product in products}
+        to_cache = []
+        for seller_sku in misses:
+            cache_key = product_cache_key(*seller_sku)
+            product = loaded.get(seller_sku)
+            if product is not None:
+                found[seller_sku] = product
+                self._set_local_cache(cache_key, product)
+                entry, hard_ttl = self._build_cache_entry(product)
+                to_cache.append((cache_key, entry, hard_ttl))
+            elif self.cache_not_found_ttl_seconds > 0:
+                to_cache.append(
+                    (cache_key, self._build_not_found_entry(read_version), self.cache_not_found_ttl_seconds)
+                )
         try:
-            product_exist = await self.repository.find_by_sellerid_sku(seller_id, sku)
-        except Exception:
-            product_exist = None
+            await self.redis_adapter.mset_json(to_cache, if_newer=self.cache_write_through)
+        except Exception as e:
+            logger.warning(f"Falha ao salvar produtos no cache: {e}")
+        return found
 
-        if not product_exist:
-            if raises_exception:
-                raise ProductNotExistException()
+    async def find_product_response_in_cache(self, seller_id: str, sku: str) -> bytes | None:
+        """
+        Busca a resposta JSON já serializada do produto (cache local e depois Redis).
+        """
+        cache_key = product_response_cache_key(seller_id, sku)
+        if self.local_cache is not None:
+            local = self.local_cache.get(cache_key)
+            if local is not None:
+                self.cache_metrics.hit("produto_resposta")
+                return local
+        try:
+            content = await self.redis_adapter.get_bytes(cache_key)
+        except Exception as e:
+            logger.warning(f"Falha ao buscar resposta do produto no cache: {e}")
             return None
+        if content is None:
+            self.cache_metrics.miss("produto_resposta")
+            return None
+        self.cache_metrics.hit("produto_resposta")
+        if self.local_cache is not None:
+            self.local_cache.set(cache_key, content)
+        return content
+
+    async def save_product_response_in_cache(self, seller_id: str, sku: str, content: bytes) -> None:
+        """
+        Guarda a resposta JSON serializada do produto. Ela vale só até a validade "soft" do produto,
+        depois a leitura volta a passar pelo cache do produto (e pela sua renovação).
+        """
+        cache_key = product_response_cache_key(seller_id, sku)
+        try:
+            await self.redis_adapter.set_bytes(
+                cache_key, content, expires_in_seconds=jittered_ttl(self.cache_soft_ttl_seconds, self.cache_ttl_jitter)
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao salvar resposta do produto no cache: {e}")
+            return
+        if self.local_cache is not None:
+            self.local_cache.set(cache_key, content)
+
+    async def _load_product(
+        self, seller_id: str, sku: str, cache_key: str, refresh: bool = False
+    ) -> CatalogoModel | None:
+        """
+        Carrega o produto do banco e o grava no Redis.
+        Com o lock habilitado, só um processo consulta o banco; os demais aguardam o cache ser preenchido
+        ou, quando é só uma renovação (`refresh`), desistem, pois o cache ainda tem uma cópia.
+        """
+        lock = None
+        if self.cache_lock_enabled:
+            lock = self.redis_adapter.lock(f"lock:{cache_key}", timeout=self.cache_lock_timeout_seconds)
+            try:
+                acquired = await lock.acquire(blocking=False)
+            except Exception as e:
+                logger.warning(f"Falha ao obter lock do cache: {e}")
+                acquired = False
+            if not acquired:
+                lock = None
+                if refresh:
+                    return None
+                cached = await self._wait_for_cache(seller_id, sku, cache_key)
+                if cached is PRODUCT_NOT_FOUND:
+                    return None
+                if cached is not None:
+                    return cached
+
+        try:
+            read_version = self.current_cache_version()
+            try:
+                with self.cache_metrics.time_load("produto"):
+                    product_exist = await self.repository.find_by_sellerid_sku(seller_id, sku)
+            except Exception:
+                return None
+
+            try:
+                if product_exist:
+                    await self._save_product_in_cache(cache_key, product_exist)
+                elif self.cache_not_found_ttl_seconds > 0:
+                    await self._save_not_found_in_cache(cache_key, read_version)
+            except Exception as e:
+                logger.warning(f"Falha ao salvar produto no cache: {e}")
+            return product_exist
+        finally:
+            if lock is not None:
+                try:
+                    await lock.release()
+                except Exception as e:
+                    logger.warning(f"Falha ao liberar lock do cache: {e}")
+
+    async def _save_product_in_cache(self, cache_key: str, catalogo: CatalogoModel) -> None:
+        """
+        Grava o produto no Redis com validade "soft" (dentro do envelope) e "hard" (TTL da chave),
+        ambas com variação aleatória para espalhar as expirações.
+        """
+        entry, hard_ttl = self._build_cache_entry(catalogo)
+        if self.cache_write_through and "version" in entry:
+            # Gravação condicionada à versão: uma leitura ou escrita atrasada não sobrescreve uma mais nova
+            await self.redis_adapter.set_json_if_newer(cache_key, entry, entry["version"], expires_in_seconds=hard_ttl)
+        else:
+            await self.redis_adapter.set_json(cache_key, entry, expires_in_seconds=hard_ttl)
+
+    async def _save_not_found_in_cache(self, cache_key: str, read_version: int) -> None:
+        """
+        Grava o marcador de produto inexistente. No modo write-through ele leva a versão de antes da
+        leitura no banco: se o produto foi cadastrado (e gravado no cache) durante a leitura, o marcador
+        atrasado não o sobrescreve.
+        """
+        entry = self._build_not_found_entry(read_version)
+        if "version" in entry:
+            await self.redis_adapter.set_json_if_newer(
+                cache_key, entry, read_version, expires_in_seconds=self.cache_not_found_ttl_seconds
+            )
+        else:
+            await self.redis_adapter.set_json(cache_key, entry, expires_in_seconds=self.cache_not_found_ttl_seconds)
+
+    def _build_not_found_entry(self, version: int) -> dict:
+        if self.cache_write_through:
+            return {**NOT_FOUND_CACHE_ENTRY, "version": version}
+        return NOT_FOUND_CACHE_ENTRY
+
+    @staticmethod
+    def current_cache_version() -> int:
+        """
+        Versão de cache do instante atual, na mesma escala da versão do produto (updated_at em milissegundos).
+        """
+        return int(time.time() * 1000)
+
+    def _build_cache_entry(self, catalogo: CatalogoModel) -> tuple[dict, int]:
+        soft_ttl = jittered_ttl(self.cache_soft_ttl_seconds, self.cache_ttl_jitter)
+        hard_ttl = max(jittered_ttl(self.cache_hard_ttl_seconds, self.cache_ttl_jitter), soft_ttl + 1)
+        with self.cache_metrics.time_serialization("produto"):
+            data = catalogo.model_dump(mode="json")
+        entry = {"soft_expires_at": time.time() + soft_ttl, "data": data}
+        if catalogo.updated_at is not None:
+            # Versão do produto em milissegundos, a mesma precisão das datas no MongoDB
+            entry["version"] = int(catalogo.updated_at.timestamp() * 1000)
+        return entry, hard_ttl
+
+    def _schedule_refresh(self, seller_id: str, sku: str, cache_key: str) -> None:
+        task = asyncio.ensure_future(self._refresh_product(seller_id, sku, cache_key))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh_product(self, seller_id: str, sku: str, cache_key: str) -> None:
+        try:
+            product = await self._single_flight.do(
+                cache_key, lambda: self._load_product(seller_id, sku, cache_key, refresh=True)
+            )
+            if product is not None:
+                self._set_local_cache(cache_key, product)
+        except Exception as e:
+            logger.warning(f"Falha ao renovar produto no cache: {e}")
+
+    async def _wait_for_cache(self, seller_id: str, sku: str, cache_key: str) -> CatalogoModel | object | None:
+        """
+        Aguarda outro processo preencher o cache, até o tempo do lock.
+        Retorna PRODUCT_NOT_FOUND se o outro processo concluiu que o produto não existe.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.cache_lock_timeout_seconds
+        while loop.time() < deadline:
+            await asyncio.sleep(CACHE_LOCK_POLL_SECONDS)
+            try:
+                cached, _ = await self._read_cache_entry(seller_id, sku, cache_key)
+            except Exception:
+                cached = None
+            if cached is not None:
+                return cached
+        return None
+
+    def _set_local_cache(self, cache_key: str, catalogo: CatalogoModel) -> None:
+        if self.local_cache is not None:
+            self.local_cache.set(cache_key, catalogo)
+
+    async def evict_product_cache(self, seller_id: str, sku: str) -> None:
+        """
+        Remove o produto (e sua resposta serializada) do Redis e dos caches locais de todos os processos da API.
+        """
+        cache_keys = product_cache_keys(seller_id, sku)
+        await self.redis_adapter.delete_many(cache_keys)
+        self.cache_metrics.eviction("produto")
+        await self._invalidate_local_caches(cache_keys)
+
+    async def refresh_product_cache(self, seller_id: str, sku: str, catalogo: CatalogoModel) -> None:
+        """
+        Após uma gravação, atualiza o produto no cache (modo write-through) ou apenas o remove.
+        """
+        if self.cache_write_through:
+            await self.cache_written_product(seller_id, sku, catalogo)
+        else:
+            await self.evict_product_cache(seller_id, sku)
+
+    async def cache_written_product(self, seller_id: str, sku: str, catalogo: CatalogoModel) -> None:
+        """
+        Write-through: grava no Redis o documento retornado pelo banco, para que a leitura seguinte
+        já encontre o produto no cache. A resposta serializada e os caches locais são descartados.
+        """
+        cache_key = product_cache_key(seller_id, sku)
+        response_key = product_response_cache_key(seller_id, sku)
         try:
-            await self.redis_adapter.set_json(cache_key, product_exist.model_dump(mode="json"), expires_in_seconds=300)
+            await self._save_product_in_cache(cache_key, catalogo)
+            await self.redis_adapter.delete(response_key)
         except Exception as e:
-            logger.warning(f"Falha ao salvar produto no cache: {e}")
+            logger.warning(f"Falha ao gravar produto no cache, removendo: {e}")
+            await self.evict_product_cache(seller_id, sku)
+            return
+        await self._invalidate_local_caches([cache_key, response_key])
 
-        return product_exist
+    async def cache_deleted_product(self, seller_id: str, sku: str) -> None:
+        """
+        Write-through: no lugar do produto removido grava um marcador de inexistente com versão.
+        Sem ela, uma leitura ou escrita atrasada do documento antigo devolveria o produto ao cache.
+        """
+        cache_key = product_cache_key(seller_id, sku)
+        response_key = product_response_cache_key(seller_id, sku)
+        # Um novo cadastro tem updated_at posterior e supera o marcador
+        version = self.current_cache_version()
+        tombstone = {**NOT_FOUND_CACHE_ENTRY, "version": version}
+        hard_ttl = jittered_ttl(self.cache_hard_ttl_seconds, self.cache_ttl_jitter)
+        try:
+            await self.redis_adapter.set_json_if_newer(cache_key, tombstone, version, expires_in_seconds=hard_ttl)
+            await self.redis_adapter.delete(response_key)
+        except Exception as e:
+            logger.warning(f"Falha ao gravar remoção do produto no cache, removendo: {e}")
+            await self.evict_product_cache(seller_id, sku)
+            return
+        self.cache_metrics.eviction("produto")
+        await self._invalidate_local_caches([cache_key, response_key])
+
+    async def _invalidate_local_caches(self, cache_keys: list[str]) -> None:
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.invalidate(*cache_keys)
+        elif self.local_cache is not None:
+            for cache_key in cache_keys:
+                self.local_cache.delete(cache_key)
+
+    async def clear_not_found_cache(self, seller_skus: list[tuple[str, str]]) -> None:
+        """
+        Remove do Redis os marcadores de produto inexistente dos produtos recém-cadastrados.
+        """
+        try:
+            await self.redis_adapter.delete_many(
+                [product_cache_key(seller_id, sku) for seller_id, sku in seller_skus]
+            )
+        except Exception as e:
+            logger.warning(f"Falha ao limpar cache negativo: {e}")
 
-    async def find_product_in_cache(self, seller_id: str, sku: str, cache_key: str) -> dict:
+    async def _read_cache_entry(
+        self, seller_id: str, sku: str, cache_key: str
+    ) -> tuple[CatalogoModel | object | None, bool]:
         """
-        Busca um preço pelo seller_id e sku, utilizando cache.
+        Lê o produto do Redis.
 
-        :param seller_id: Identificador do vendedor.
-        :param sku: Código do produto.
-        :return: Instância de Preco encontrada.
-        :raises NotFoundException: Se não encontrar o preço.
+        :return: O produto (None se não estiver no cache ou PRODUCT_NOT_FOUND se estiver marcado
+            como inexistente) e se a validade "soft" já passou.
         """
         cached = await self.redis_adapter.get_json(cache_key)
         if cached is not None:
-            logger.debug(f"🔄 Produto encontrado no CACHE -> seller_id: {seller_id}, sku: {sku}")
-            return CatalogoModel.model_validate(cached)
+            logger.debug("🔄 Produto encontrado no CACHE -> seller_id: %s, sku: %s", seller_id, sku)
+        with self.cache_metrics.time_serialization("produto"):
+            return self._parse_cache_entry(cached)
+
+    @staticmethod
+    def _parse_cache_entry(cached: dict | None) -> tuple[CatalogoModel | object | None, bool]:
+        if cached is None:
+            return None, False
+        if cached.get("not_found"):
+            # Marcador de inexistente, com versão quando gravado na remoção (write-through)
+            return PRODUCT_NOT_FOUND, False
+        if "soft_expires_at" not in cached:
+            # Entrada gravada antes do envelope com validade
+            return CatalogoModel.model_validate(cached), False
+        stale = cached["soft_expires_at"] <= time.time()
+        return CatalogoModel.model_validate(cached["data"]), stale
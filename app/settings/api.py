@@ -20,6 +20,21 @@ class PaginationConfig(BaseModel):
     )
 
 
+class BulkConfig(BaseModel):
+    max_items: int = Field(
+        default=1000,
+        description="Quantidade máxima de produtos por requisição de importação em lote",
+    )
+    stream_batch_size: int = Field(
+        default=500,
+        description="Quantidade de linhas NDJSON gravadas por bulk_write na importação em streaming",
+    )
+    batch_get_max_items: int = Field(
+        default=100,
+        description="Quantidade máxima de produtos por requisição de busca em lote",
+    )
+
+
 class ApiSettings(AppSettings):
     server_port: int = Field(default=8000, title="Porta da aplicação")
 
@@ -55,10 +70,24 @@ class ApiSettings(AppSettings):
         title="Headers que devem ser ofuscados no log de requisições",
     )
 
+    access_log_sample_rate: float = Field(
+        default=1.0,
+        ge=0,
+        le=1,
+        title="Fração das requisições registradas no log de acesso (erros 5xx são sempre registrados)",
+    )
+
+    access_log_route_sample_rates: dict[str, float] = Field(
+        default={},
+        title="Fração registrada por prefixo de rota, sobrepondo access_log_sample_rate",
+    )
+
     pagination: PaginationConfig = Field(default=PaginationConfig(), description="Configurações de paginação")
 
     filter_config: FilterConfig = Field(default=FilterConfig(), description="Configurações de filtros")
 
+    bulk: BulkConfig = Field(default=BulkConfig(), description="Configurações de importação em lote")
+
     enable_seller_resources: bool = Field(default=True, description="Habilita Recursos de APIs do contexto de Seller")
 
     enable_channel_resources: bool = Field(default=True, description="Habilita Recursos de APIs do contexto de Canal")
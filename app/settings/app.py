@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field, HttpUrl, MongoDsn, RedisDsn
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
@@ -13,12 +15,64 @@ class AppSettings(BaseSettings):
     app_db_url_mongo: MongoDsn = Field(..., title="URL para o MongoDB")
 
     app_openid_wellknown: HttpUrl = Field(..., title="URL para well known de um openid")
+    app_openid_mode: Literal["keycloak", "local"] = Field(
+        "keycloak", description="Validação de tokens: pelo Keycloak ou por um JWKS local (testes de carga)"
+    )
+    app_openid_local_jwks_path: str | None = Field(
+        None, description="Arquivo JWKS com as chaves públicas usadas no modo local"
+    )
+    app_openid_timeout_seconds: float = Field(
+        5.0, description="Timeout (s) das chamadas de descoberta e de chaves públicas ao OpenID"
+    )
+    app_openid_max_connections: int = Field(10, description="Máximo de conexões simultâneas com o OpenID")
+    app_openid_jwks_refresh_interval_seconds: float = Field(
+        300.0,
+        description="Intervalo (s) da atualização das chaves públicas quando o JWKS não informa max-age (0 desliga)",
+    )
+    app_openid_jwks_min_refetch_interval_seconds: float = Field(
+        30.0, description="Intervalo (s) mínimo entre novas buscas do JWKS causadas por um kid desconhecido"
+    )
+    app_openid_token_cache_max_size: int = Field(
+        10000, description="Quantidade máxima de tokens validados mantidos em memória (0 desliga)"
+    )
+    app_openid_token_cache_ttl_seconds: float = Field(
+        300.0, description="Tempo (s) máximo de um token validado no cache, mesmo que o exp seja maior"
+    )
 
     # XXX Configurações para o logging.
     pc_logging_level: str = Field("WARNING", description="Nível do logging")
     pc_logging_env: str = Field("prod", description="Ambiente do logging (prod ou dev ou test)")
+    logging_queue_enabled: bool = Field(
+        False, description="Escreve os logs em uma thread separada; quem loga apenas enfileira o registro"
+    )
     
     # XXX Configurações para o Redis
     app_redis_url: RedisDsn = Field(..., title="URL para o Redis")
+    app_redis_max_connections: int | None = Field(
+        None, description="Tamanho máximo do pool de conexões do Redis (vazio usa o padrão do redis-py)"
+    )
+    app_redis_serializer: Literal["json", "orjson"] = Field(
+        "orjson", description="Serializador dos valores JSON gravados no Redis"
+    )
+
+    # XXX Cache local (L1) de produtos, na frente do Redis
+    local_cache_max_size: int = Field(10000, description="Quantidade máxima de produtos no cache local (0 desliga)")
+    local_cache_ttl_seconds: float = Field(10.0, description="Validade (s) de um produto no cache local")
+    cache_lock_enabled: bool = Field(
+        False, description="Usa lock no Redis para que só um processo carregue do banco um produto ausente no cache"
+    )
+    cache_lock_timeout_seconds: float = Field(2.0, description="Tempo (s) máximo do lock e da espera pelo cache")
+    cache_soft_ttl_seconds: int = Field(
+        240, description="Tempo (s) em que um produto no Redis é considerado atual; depois é servido e recarregado"
+    )
+    cache_hard_ttl_seconds: int = Field(600, description="Tempo (s) máximo de um produto no Redis")
+    cache_ttl_jitter: float = Field(0.1, description="Variação aleatória (fração) aplicada aos TTLs do cache")
+    cache_not_found_ttl_seconds: int = Field(
+        30, description="Tempo (s) do marcador de produto inexistente no Redis (0 desabilita)"
+    )
+    cache_write_through: bool = Field(
+        False,
+        description="Grava no cache o produto retornado pelo banco após cadastro e alterações, em vez de removê-lo",
+    )
 
 settings = AppSettings()
@@ -7,6 +7,22 @@ class WorkerSettings(AppSettings):
     number_workers: int = Field(1)
     ia_api_url: str = Field("http://ollama:11434/api/generate", description="URL da IA") 
     ia_model: str = Field("phi3", description="Modelo da IA")
+    description_max_attempts: int = Field(3, description="Tentativas de gerar a descrição antes de marcar como falha")
+    description_visibility_timeout_seconds: int = Field(
+        600, description="Tempo (s) que um job em processamento aguarda a confirmação antes de voltar para a fila"
+    )
+    description_requeue_interval_seconds: float = Field(
+        60.0, description="Intervalo (s) da verificação de jobs em processamento sem confirmação"
+    )
 
-worker_settings = WorkerSettings()
+    # XXX Configurações do cliente HTTP da IA
+    ia_connect_timeout: float = Field(5.0, description="Timeout (s) para abrir conexão com a IA")
+    ia_read_timeout: float = Field(200.0, description="Timeout (s) aguardando a resposta da IA")
+    ia_write_timeout: float = Field(10.0, description="Timeout (s) enviando a requisição para a IA")
+    ia_pool_timeout: float = Field(5.0, description="Timeout (s) aguardando uma conexão livre no pool")
+    ia_max_connections: int = Field(20, description="Máximo de conexões simultâneas com a IA")
+    ia_max_keepalive_connections: int = Field(10, description="Máximo de conexões ociosas mantidas no pool")
+    ia_keepalive_expiry: float = Field(30.0, description="Tempo (s) que uma conexão ociosa fica no pool")
+    ia_http2: bool = Field(False, description="Habilita HTTP/2 (requer httpx[http2])")
 
+worker_settings = WorkerSettings()
@@ -1,38 +1,68 @@
 from dependency_injector import containers, providers
 
+from app.integrations.cache.cache_invalidation import CacheInvalidationBus
+from app.integrations.cache.redis_asyncio_adapter import RedisAsyncioAdapter
+from app.integrations.cache.serializers import build_serializer
 from app.integrations.database.mongo_client import MongoClient
+from app.integrations.http.async_http_client import build_async_http_client
 from app.repositories import CatalogoRepository
-
 from app.settings.worker import WorkerSettings
-from app.services.catalogo.catalogo_service import CatalogoService
-from app.models.catalogo_model import CatalogoModel
-
-import app.services.catalogo.catalogo_service as catalogo_service_module
-
-from app.container import Container
-import app.services.catalogo.catalogo_service as catalogo_service_module
-
-
-
 from app.worker.description.creating_product_description import CreatingProductDescription
+from app.worker.description.description_job_queue import DescriptionJobQueue
+from app.worker.description.product_description_worker import ProductDescriptionWorker
+
 
 class WorkerContainer(containers.DeclarativeContainer):
     config = providers.Configuration()
     settings = providers.Singleton(WorkerSettings)
 
     # Integrações
-    mongo_client = providers.Singleton(MongoClient, config.app_db_url)
+    mongo_client = providers.Singleton(MongoClient, config.app_db_url_mongo)
+    redis_adapter = providers.Singleton(
+        RedisAsyncioAdapter,
+        config.app_redis_url,
+        serializer=providers.Callable(build_serializer, config.app_redis_serializer),
+        max_connections=config.app_redis_max_connections,
+    )
+    # Sem cache local: o worker só avisa a API das alterações
+    cache_invalidation_bus = providers.Singleton(CacheInvalidationBus, redis_adapter)
+    ia_http_client = providers.Singleton(
+        build_async_http_client,
+        connect_timeout=config.ia_connect_timeout,
+        read_timeout=config.ia_read_timeout,
+        write_timeout=config.ia_write_timeout,
+        pool_timeout=config.ia_pool_timeout,
+        max_connections=config.ia_max_connections,
+        max_keepalive_connections=config.ia_max_keepalive_connections,
+        keepalive_expiry=config.ia_keepalive_expiry,
+        http2=config.ia_http2,
+    )
 
     # Repositórios
     catalogo_repository = providers.Singleton(CatalogoRepository, mongo_client)
 
-    # Serviços
-    # (adicione outros serviços aqui)
+    # Filas
+    description_job_queue = providers.Singleton(
+        DescriptionJobQueue,
+        redis_adapter,
+        visibility_timeout_seconds=config.description_visibility_timeout_seconds,
+    )
 
     # Tarefas
     creating_product_description = providers.Singleton(
-        CreatingProductDescription, ia_api_url=config.ia_api_url, ia_model=config.ia_model
+        CreatingProductDescription,
+        ia_api_url=config.ia_api_url,
+        ia_model=config.ia_model,
+        http_client=ia_http_client,
     )
 
-    container = Container()
-    container.wire(modules=[catalogo_service_module])
\ No newline at end of file
+    product_description_worker = providers.Singleton(
+        ProductDescriptionWorker,
+        job_queue=description_job_queue,
+        repository=catalogo_repository,
+        redis_adapter=redis_adapter,
+        creating_product_description=creating_product_description,
+        max_attempts=config.description_max_attempts,
+        invalidation_bus=cache_invalidation_bus,
+        requeue_interval_seconds=config.description_requeue_interval_seconds,
+    )
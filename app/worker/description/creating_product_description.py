@@ -7,9 +7,11 @@ from app.settings import settings
 logger = getLogger(__name__)
 
 class CreatingProductDescription:
-    def __init__(self, ia_api_url: str, ia_model: str):
+    def __init__(self, ia_api_url: str, ia_model: str, http_client: httpx.AsyncClient):
         self.ia_model = ia_model
         self.ia_api_url = ia_api_url
+        # Cliente compartilhado (pool de conexões), criado e fechado pelo container
+        self.http_client = http_client
 
     async def create_description(self, catalogo: CatalogoModel):
         
@@ -45,8 +47,7 @@ class CreatingProductDescription:
                 f"🤖Enviando para análise da IA. Modelo: {self.ia_model}", extra={"Produto": catalogo.name}
             )
 
-            async with httpx.AsyncClient(timeout=200) as http_client:
-                response = await http_client.post(self.ia_api_url, json=payload)  
+            response = await self.http_client.post(self.ia_api_url, json=payload)
             # Lança um erro para respostas com código 4xx ou 5xx
             response.raise_for_status()
 
@@ -0,0 +1,81 @@
+from logging import getLogger
+
+from app.common.hash_utils import generate_hash
+from app.integrations.cache.redis_asyncio_adapter import RedisAsyncioAdapter
+
+logger = getLogger(__name__)
+
+
+class DescriptionJobQueue:
+    """
+    Fila (Redis) de produtos aguardando a geração da descrição pela IA.
+
+    Um job retirado da fila fica na lista de processamento, com uma reserva que expira após
+    `visibility_timeout_seconds`, até ser confirmado (ack). Jobs sem confirmação e com a reserva
+    expirada (worker que caiu no meio do processamento) voltam para a fila em `requeue_expired`.
+    """
+
+    QUEUE_NAME = "fila:descricao_produto"
+
+    def __init__(
+        self,
+        redis_adapter: RedisAsyncioAdapter,
+        queue_name: str = QUEUE_NAME,
+        visibility_timeout_seconds: int = 600,
+    ):
+        self.redis_adapter = redis_adapter
+        self.queue_name = queue_name
+        self.processing_name = f"{queue_name}:processando"
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+
+    async def enqueue(self, seller_id: str, sku: str, attempt: int = 1) -> None:
+        job = {"seller_id": seller_id, "sku": sku, "attempt": attempt}
+        await self.redis_adapter.push_json(self.queue_name, job)
+        logger.debug(f"Job de descrição enfileirado: {job}")
+
+    async def enqueue_many(self, seller_skus: list[tuple[str, str]]) -> None:
+        jobs = [{"seller_id": seller_id, "sku": sku, "attempt": 1} for seller_id, sku in seller_skus]
+        await self.redis_adapter.push_many_json(self.queue_name, jobs)
+        logger.debug(f"{len(jobs)} jobs de descrição enfileirados")
+
+    async def dequeue(self, timeout: int = 5) -> tuple[dict, bytes] | None:
+        """
+        Aguarda até `timeout` segundos pelo próximo job. Retorna None se a fila estiver vazia.
+
+        :return: O job e o recibo a ser passado para `ack` depois do processamento.
+        """
+        item = await self.redis_adapter.pop_move_json(self.queue_name, self.processing_name, timeout=timeout)
+        if item is None:
+            return None
+        job, receipt = item
+        await self.redis_adapter.set_str(
+            self._lease_key(receipt), 1, expires_in_seconds=self.visibility_timeout_seconds
+        )
+        return job, receipt
+
+    async def ack(self, receipt: bytes) -> None:
+        """
+        Confirma o processamento do job, removendo-o da lista de processamento.
+        """
+        await self.redis_adapter.remove_list_item(self.processing_name, receipt)
+        await self.redis_adapter.delete(self._lease_key(receipt))
+
+    async def requeue_expired(self) -> int:
+        """
+        Devolve para a fila os jobs em processamento cuja reserva expirou.
+
+        :return: Quantidade de jobs devolvidos.
+        """
+        requeued = 0
+        for receipt in await self.redis_adapter.list_items(self.processing_name):
+            if await self.redis_adapter.exists(self._lease_key(receipt)):
+                continue
+            # Outro worker pode ter devolvido ou confirmado o mesmo job
+            if await self.redis_adapter.move_list_item(self.processing_name, self.queue_name, receipt):
+                requeued += 1
+        if requeued:
+            logger.warning(f"{requeued} jobs de descrição sem confirmação devolvidos para a fila")
+        return requeued
+
+    def _lease_key(self, receipt: bytes) -> str:
+        return f"{self.processing_name}:reserva:{generate_hash(receipt.decode())}"
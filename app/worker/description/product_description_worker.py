@@ -0,0 +1,112 @@
+import asyncio
+from logging import getLogger
+
+from app.integrations.cache.cache_invalidation import CacheInvalidationBus
+from app.integrations.cache.cache_keys import listing_version_key, product_cache_keys
+from app.integrations.cache.redis_asyncio_adapter import RedisAsyncioAdapter
+from app.models import DescriptionStatus
+from app.repositories import CatalogoRepository
+
+from .creating_product_description import CreatingProductDescription
+from .description_job_queue import DescriptionJobQueue
+
+logger = getLogger(__name__)
+
+
+class ProductDescriptionWorker:
+    """
+    Consome a fila de descrições, chama a IA e atualiza o produto no MongoDB.
+    """
+
+    def __init__(
+        self,
+        job_queue: DescriptionJobQueue,
+        repository: CatalogoRepository,
+        redis_adapter: RedisAsyncioAdapter,
+        creating_product_description: CreatingProductDescription,
+        max_attempts: int = 3,
+        invalidation_bus: CacheInvalidationBus | None = None,
+        requeue_interval_seconds: float = 60.0,
+    ):
+        self.job_queue = job_queue
+        self.repository = repository
+        self.redis_adapter = redis_adapter
+        self.creating_product_description = creating_product_description
+        self.max_attempts = max_attempts
+        self.invalidation_bus = invalidation_bus
+        self.requeue_interval_seconds = requeue_interval_seconds
+
+    async def process(self, job: dict) -> None:
+        seller_id = job["seller_id"]
+        sku = job["sku"]
+        attempt = job.get("attempt", 1)
+
+        product = await self.repository.find_by_sellerid_sku(seller_id, sku)
+        if product is None or product.description_status != DescriptionStatus.PENDING:
+            # Produto removido ou descrição já definida manualmente
+            logger.info(f"Job de descrição descartado -> seller_id: {seller_id}, sku: {sku}")
+            return
+
+        description_data = await self.creating_product_description.create_description(product)
+
+        if description_data and "description" in description_data:
+            patch = {"description": description_data["description"], "description_status": DescriptionStatus.DONE}
+        elif attempt < self.max_attempts:
+            logger.warning(f"Falha ao gerar descrição (tentativa {attempt}) -> seller_id: {seller_id}, sku: {sku}")
+            await self.job_queue.enqueue(seller_id, sku, attempt=attempt + 1)
+            return
+        else:
+            patch = {"description_status": DescriptionStatus.FAILED}
+
+        # Só grava se a descrição ainda estiver pendente: o seller pode tê-la informado durante a chamada à IA
+        updated = await self.repository.patch_by_sellerid_sku(
+            seller_id, sku, patch, condition={"description_status": DescriptionStatus.PENDING}
+        )
+        if updated is None:
+            logger.info(
+                f"Descrição alterada durante a geração, resultado descartado -> seller_id: {seller_id}, sku: {sku}"
+            )
+            return
+        # Remove produto (e sua resposta serializada) do cache para que a próxima leitura traga a descrição
+        cache_keys = product_cache_keys(seller_id, sku)
+        await self.redis_adapter.delete_many(cache_keys)
+        if self.invalidation_bus is not None:
+            await self.invalidation_bus.invalidate(*cache_keys)
+        # Nova versão das listagens do seller
+        await self.redis_adapter.incr(listing_version_key(seller_id))
+
+    async def consume(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            try:
+                item = await self.job_queue.dequeue()
+                if item is not None:
+                    job, receipt = item
+                    await self.process(job)
+                    # Sem ack (erro ou queda do worker), o job volta para a fila quando a reserva expirar
+                    await self.job_queue.ack(receipt)
+            except Exception as e:
+                logger.error(f"❌ Erro ao processar job de descrição: {type(e).__name__}: {e}", exc_info=True)
+
+    async def requeue_expired(self, stop_event: asyncio.Event) -> None:
+        """
+        Devolve periodicamente para a fila os jobs que ficaram sem confirmação.
+        """
+        while not stop_event.is_set():
+            try:
+                await self.job_queue.requeue_expired()
+            except Exception as e:
+                logger.error(f"❌ Erro ao devolver jobs de descrição para a fila: {type(e).__name__}: {e}")
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.requeue_interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, number_workers: int = 1, stop_event: asyncio.Event | None = None) -> None:
+        """
+        Executa `number_workers` consumidores concorrentes até que `stop_event` seja sinalizado.
+        """
+        stop_event = stop_event or asyncio.Event()
+        logger.info(f"🤖 Worker de descrição iniciado com {number_workers} consumidor(es)")
+        await asyncio.gather(
+            self.requeue_expired(stop_event), *(self.consume(stop_event) for _ in range(number_workers))
+        )
@@ -0,0 +1,48 @@
+import asyncio
+import signal
+from typing import TYPE_CHECKING
+
+import dotenv
+from pclogging import LoggingBuilder
+
+if TYPE_CHECKING:
+    from app.worker.container_worker import WorkerContainer
+
+# As configurações leem o ENV ao serem importadas, por isso só são importadas (em init) depois do .env
+dotenv.load_dotenv()
+
+# XXX Iniciando a biblitoeca pc-logging.
+LoggingBuilder.init()
+
+logger = LoggingBuilder.get_logger(__name__)
+
+
+def init() -> "WorkerContainer":
+    from app.settings.worker import worker_settings
+    from app.worker.container_worker import WorkerContainer
+
+    container = WorkerContainer()
+    container.config.from_pydantic(worker_settings)
+    return container
+
+
+async def main() -> None:
+    container = init()
+    worker = container.product_description_worker()
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    try:
+        await worker.run(number_workers=container.config.number_workers(), stop_event=stop_event)
+    finally:
+        await container.ia_http_client().aclose()
+        await container.redis_adapter().aclose()
+        container.mongo_client().close()
+        logger.info("Worker de descrição finalizado")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,58 @@
+from mongodb_migrations.base import BaseMigration
+from pymongo import IndexModel, ASCENDING
+
+
+class Migration(BaseMigration):
+    """
+    Torna único o índice (seller_id, sku).
+
+    O cadastro passa a confiar no índice para detectar produtos duplicados (DuplicateKeyError),
+    sem consultar o banco antes de inserir.
+
+    O MongoDB não aceita dois índices com as mesmas chaves diferindo só em `unique`, por isso o índice
+    é recriado com o mesmo nome. Os duplicados são verificados antes de remover o índice atual, e se a
+    criação do índice único falhar o índice anterior é restaurado: a coleção nunca fica sem ele.
+    """
+
+    IDX_CATALOGO_SELLERID_SKU = "idx_sellerid_sku"
+
+    # Quantidade de pares duplicados exibidos na mensagem de erro
+    DUPLICATES_SAMPLE_SIZE = 10
+
+    def upgrade(self):
+        duplicates = self.find_duplicates()
+        if duplicates:
+            raise RuntimeError(
+                "Produtos duplicados por (seller_id, sku), remova-os antes de aplicar a migração: "
+                + ", ".join(f"{seller_id}/{sku}" for seller_id, sku in duplicates)
+            )
+
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_SKU)
+        try:
+            self.db.catalogo.create_indexes([self.sellerid_sku_index(unique=True)])
+        except Exception:
+            # Duplicados gravados depois da verificação: volta ao índice anterior
+            self.db.catalogo.create_indexes([self.sellerid_sku_index(unique=False)])
+            raise
+
+    def downgrade(self):
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_SKU)
+        self.db.catalogo.create_indexes([self.sellerid_sku_index(unique=False)])
+
+    def sellerid_sku_index(self, unique: bool) -> IndexModel:
+        return IndexModel(
+            [("seller_id", ASCENDING), ("sku", ASCENDING)],
+            name=self.IDX_CATALOGO_SELLERID_SKU,
+            unique=unique,
+        )
+
+    def find_duplicates(self) -> list[tuple[str, str]]:
+        pipeline = [
+            {"$group": {"_id": {"seller_id": "$seller_id", "sku": "$sku"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+            {"$limit": self.DUPLICATES_SAMPLE_SIZE},
+        ]
+        return [
+            (duplicate["_id"]["seller_id"], duplicate["_id"]["sku"])
+            for duplicate in self.db.catalogo.aggregate(pipeline, allowDiskUse=True)
+        ]
@@ -0,0 +1,48 @@
+from mongodb_migrations.base import BaseMigration
+from pymongo import IndexModel, ASCENDING, TEXT, UpdateOne
+
+from app.common.text_utils import normalize_search_text
+
+
+class Migration(BaseMigration):
+    """
+    Índices da busca por nome.
+
+    - (seller_id, name_search): busca por prefixo no nome normalizado (minúsculo e sem acentos).
+    - (seller_id, name) texto: busca por palavras, sempre restrita a um seller.
+
+    Preenche o campo name_search dos produtos já cadastrados.
+    """
+
+    IDX_CATALOGO_SELLERID_NAME_SEARCH = "idx_sellerid_name_search"
+    IDX_CATALOGO_SELLERID_NAME_TEXT = "idx_sellerid_name_text"
+    BATCH_SIZE = 1000
+
+    def upgrade(self):
+        operations = []
+        for document in self.db.catalogo.find({}, {"_id": 1, "name": 1}):
+            name_search = normalize_search_text(document.get("name"))
+            operations.append(UpdateOne({"_id": document["_id"]}, {"$set": {"name_search": name_search}}))
+            if len(operations) >= self.BATCH_SIZE:
+                self.db.catalogo.bulk_write(operations, ordered=False)
+                operations = []
+        if operations:
+            self.db.catalogo.bulk_write(operations, ordered=False)
+
+        indexes = [
+            IndexModel(
+                [("seller_id", ASCENDING), ("name_search", ASCENDING)],
+                name=self.IDX_CATALOGO_SELLERID_NAME_SEARCH,
+            ),
+            IndexModel(
+                [("seller_id", ASCENDING), ("name", TEXT)],
+                name=self.IDX_CATALOGO_SELLERID_NAME_TEXT,
+                default_language="portuguese",
+            ),
+        ]
+        self.db.catalogo.create_indexes(indexes)
+
+    def downgrade(self):
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_NAME_TEXT)
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_NAME_SEARCH)
+        self.db.catalogo.update_many({}, {"$unset": {"name_search": ""}})
@@ -0,0 +1,51 @@
+from mongodb_migrations.base import BaseMigration
+from pymongo import IndexModel, ASCENDING
+
+
+class Migration(BaseMigration):
+    """
+    Índices das ordenações aceitas na listagem (_sort): name, created_at e updated_at.
+
+    A listagem filtra por seller_id e desempata pelo sku, por isso os índices são (seller_id, campo, sku).
+    Ordenar por sku usa o índice único (seller_id, sku). A listagem roda com a collation simples
+    (o nome é ordenado pelo campo normalizado name_search), a mesma destes índices.
+
+    O índice (seller_id, name_search, sku) também atende a busca por prefixo e substitui o (seller_id, name_search).
+    """
+
+    IDX_CATALOGO_SELLERID_NAME_SEARCH = "idx_sellerid_name_search"
+
+    IDX_CATALOGO_SELLERID_NAME_SEARCH_SKU = "idx_sellerid_name_search_sku"
+    IDX_CATALOGO_SELLERID_CREATED_AT_SKU = "idx_sellerid_created_at_sku"
+    IDX_CATALOGO_SELLERID_UPDATED_AT_SKU = "idx_sellerid_updated_at_sku"
+
+    def upgrade(self):
+        indexes = [
+            IndexModel(
+                [("seller_id", ASCENDING), ("name_search", ASCENDING), ("sku", ASCENDING)],
+                name=self.IDX_CATALOGO_SELLERID_NAME_SEARCH_SKU,
+            ),
+            IndexModel(
+                [("seller_id", ASCENDING), ("created_at", ASCENDING), ("sku", ASCENDING)],
+                name=self.IDX_CATALOGO_SELLERID_CREATED_AT_SKU,
+            ),
+            IndexModel(
+                [("seller_id", ASCENDING), ("updated_at", ASCENDING), ("sku", ASCENDING)],
+                name=self.IDX_CATALOGO_SELLERID_UPDATED_AT_SKU,
+            ),
+        ]
+        self.db.catalogo.create_indexes(indexes)
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_NAME_SEARCH)
+
+    def downgrade(self):
+        self.db.catalogo.create_indexes(
+            [
+                IndexModel(
+                    [("seller_id", ASCENDING), ("name_search", ASCENDING)],
+                    name=self.IDX_CATALOGO_SELLERID_NAME_SEARCH,
+                )
+            ]
+        )
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_UPDATED_AT_SKU)
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_CREATED_AT_SKU)
+        self.db.catalogo.drop_index(self.IDX_CATALOGO_SELLERID_NAME_SEARCH_SKU)
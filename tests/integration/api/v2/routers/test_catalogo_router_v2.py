@@ -118,3 +118,117 @@ class TestCatalogoRouterV2:
             )
         assert resposta.status_code == 202
         assert resposta.json()["name"] == "tv50"
+
+    @pytest.mark.asyncio
+    async def test_cadastrar_lote(self, async_client: AsyncClient):
+        lote = [
+            {"sku": "lote1", "name": "produto 1"},
+            {"sku": "lote2", "name": "produto 2"},
+            {"sku": "lote1", "name": "produto repetido"},
+        ]
+        resposta = await async_client.post(
+            "/seller/v2/catalogo/bulk",
+            json=lote,
+            headers={
+                "x-seller-id": "magalu11",
+                "Authorization": "Bearer fake-token"
+            }
+        )
+        assert resposta.status_code == 200
+        data = resposta.json()
+        assert data["total"] == 3
+        assert data["created"] == 2
+        assert data["failed"] == 1
+        assert data["results"][2]["slug"] == "409-produto-ja-existe"
+
+    @pytest.mark.asyncio
+    async def test_cadastrar_lote_ndjson(self, async_client: AsyncClient):
+        linhas = (
+            '{"sku": "nd1", "name": "produto 1"}\n'
+            '{"sku": "nd 2", "name": "sku inválido"}\n'
+            '{"sku": "nd3", "name": "produto 3"}\n'
+        )
+        resposta = await async_client.post(
+            "/seller/v2/catalogo/bulk/stream",
+            content=linhas,
+            headers={
+                "x-seller-id": "magalu11",
+                "Content-Type": "application/x-ndjson",
+                "Authorization": "Bearer fake-token"
+            }
+        )
+        assert resposta.status_code == 200
+        data = resposta.json()
+        assert data["created"] == 2
+        assert [item["created"] for item in data["results"]] == [True, False, True]
+
+    @pytest.mark.asyncio
+    async def test_listar_produtos_por_cursor(self, async_client: AsyncClient):
+        headers = {"x-seller-id": "magalu11", "Authorization": "Bearer fake-token"}
+        lote = [{"sku": f"cursor{i}", "name": f"produto {i}"} for i in range(5)]
+        resposta = await async_client.post("/seller/v2/catalogo/bulk", json=lote, headers=headers)
+        assert resposta.status_code == 200
+
+        skus = []
+        url = "/seller/v2/catalogo?_limit=2&_count=exact"
+        while url:
+            resposta = await async_client.get(url, headers=headers)
+            assert resposta.status_code == 200
+            data = resposta.json()
+            assert data["meta"]["page"]["total"] == 5
+            skus.extend(item["sku"] for item in data["results"])
+            url = data["meta"]["links"]["next"]
+            if url:
+                assert "_cursor=" in url
+
+        assert skus == [f"cursor{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_listar_produtos_com_campos(self, async_client: AsyncClient):
+        headers = {"x-seller-id": "magalu11", "Authorization": "Bearer fake-token"}
+        resposta = await async_client.post(
+            "/seller/v2/catalogo", json={"sku": "campos1", "name": "produto"}, headers=headers
+        )
+        assert resposta.status_code == 201
+
+        resposta = await async_client.get("/seller/v2/catalogo?_fields=sku,name", headers=headers)
+        assert resposta.status_code == 200
+        assert resposta.json()["results"] == [{"sku": "campos1", "name": "produto"}]
+
+        resposta = await async_client.get("/seller/v2/catalogo/campos1?_fields=name", headers=headers)
+        assert resposta.status_code == 200
+        assert resposta.json() == {"name": "produto"}
+
+        resposta = await async_client.get("/seller/v2/catalogo?_fields=senha", headers=headers)
+        assert resposta.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_buscar_produtos_em_lote(self, async_client: AsyncClient):
+        headers = {"x-seller-id": "magalu11", "Authorization": "Bearer fake-token"}
+        lote = [{"sku": "batch1", "name": "produto 1"}, {"sku": "batch2", "name": "produto 2"}]
+        resposta = await async_client.post("/seller/v2/catalogo/bulk", json=lote, headers=headers)
+        assert resposta.status_code == 200
+
+        itens = [
+            {"seller_id": "magalu11", "sku": "batch2"},
+            {"seller_id": "magalu11", "sku": "batch9"},
+            {"seller_id": "magalu11", "sku": "batch1"},
+        ]
+        resposta = await async_client.post("/seller/v2/catalogo/batch-get", json=itens, headers=headers)
+        assert resposta.status_code == 200
+        data = resposta.json()
+        assert [item["sku"] for item in data["results"]] == ["batch2", "batch1"]
+        assert data["not_found"] == [{"seller_id": "magalu11", "sku": "batch9"}]
+
+    @pytest.mark.asyncio
+    async def test_buscar_produtos_em_lote_de_outro_seller(self, async_client: AsyncClient):
+        headers = {"x-seller-id": "magalu11", "Authorization": "Bearer fake-token"}
+        itens = [
+            {"seller_id": "magalu11", "sku": "batch1"},
+            {"seller_id": "outroseller", "sku": "batch1"},
+        ]
+
+        resposta = await async_client.post("/seller/v2/catalogo/batch-get", json=itens, headers=headers)
+
+        assert resposta.status_code == 403
+        assert "outroseller" in resposta.text
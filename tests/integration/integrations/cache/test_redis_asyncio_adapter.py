@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from pydantic import RedisDsn
 
 from app.integrations.cache.redis_asyncio_adapter import RedisAsyncioAdapter
+from app.integrations.cache.serializers import OrjsonSerializer
 
 
 class TestRedisAsyncioAdapter:
@@ -270,6 +271,177 @@ class TestRedisAsyncioAdapter:
         # Assert
         redis_adapter.redis_client.delete.assert_called_once_with("test_key")
 
+    @pytest.mark.asyncio
+    async def test_mget_json(self, redis_adapter):
+        """Testa leitura de várias chaves com um único MGET"""
+        # Arrange
+        redis_adapter.redis_client.mget.return_value = [b'{"a": 1}', None]
+
+        # Act
+        result = await redis_adapter.mget_json(["k1", "k2"])
+
+        # Assert
+        assert result == [{"a": 1}, None]
+        redis_adapter.redis_client.mget.assert_called_once_with(["k1", "k2"])
+
+    @pytest.mark.asyncio
+    async def test_mset_json_uses_pipeline(self, redis_adapter):
+        """Testa gravação de várias chaves em um único pipeline"""
+        # Arrange
+        pipe = MagicMock()
+        pipe.execute = AsyncMock()
+        pipeline = MagicMock()
+        pipeline.__aenter__ = AsyncMock(return_value=pipe)
+        pipeline.__aexit__ = AsyncMock(return_value=False)
+        redis_adapter.redis_client.pipeline = MagicMock(return_value=pipeline)
+
+        # Act
+        await redis_adapter.mset_json([("k1", {"a": 1}, 60), ("k2", [1], None)])
+
+        # Assert
+        redis_adapter.redis_client.pipeline.assert_called_once_with(transaction=False)
+        pipe.set.assert_any_call("k1", json.dumps({"a": 1}), ex=60)
+        pipe.set.assert_any_call("k2", json.dumps([1]), ex=None)
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_and_set_bytes(self, redis_adapter):
+        """Testa leitura e gravação de bytes sem conversão"""
+        # Arrange
+        redis_adapter.redis_client.get.return_value = b'{"a":1}'
+
+        # Act
+        await redis_adapter.set_bytes("test_key", b'{"a":1}', 60)
+        result = await redis_adapter.get_bytes("test_key")
+
+        # Assert
+        redis_adapter.redis_client.set.assert_called_once_with("test_key", b'{"a":1}', 60)
+        assert result == b'{"a":1}'
+
+    @pytest.mark.asyncio
+    async def test_set_json_if_newer(self, redis_adapter):
+        """Testa gravação condicionada à versão com script Lua"""
+        # Arrange
+        script = AsyncMock(return_value=0)
+        redis_adapter.redis_client.register_script = MagicMock(return_value=script)
+
+        # Act
+        written = await redis_adapter.set_json_if_newer("test_key", {"version": 5}, 5, expires_in_seconds=60)
+        await redis_adapter.set_json_if_newer("test_key", {"version": 6}, 6)
+
+        # Assert
+        assert written is False
+        redis_adapter.redis_client.register_script.assert_called_once()
+        script.assert_any_await(keys=["test_key"], args=[json.dumps({"version": 5}), 5, 60])
+        script.assert_any_await(keys=["test_key"], args=[json.dumps({"version": 6}), 6, ""])
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, redis_adapter):
+        """Testa remoção de várias chaves com um único DEL"""
+        # Act
+        await redis_adapter.delete_many(["k1", "k2"])
+        await redis_adapter.delete_many([])
+
+        # Assert
+        redis_adapter.redis_client.delete.assert_called_once_with("k1", "k2")
+
+    @pytest.mark.asyncio
+    async def test_pop_move_json(self, redis_adapter):
+        """Testa BLMOVE da fila para a lista de processamento, mantendo o valor bruto"""
+        # Arrange
+        redis_adapter.redis_client.blmove.return_value = b'{"sku": "TV123"}'
+
+        # Act
+        result = await redis_adapter.pop_move_json("fila", "fila:processando", timeout=5)
+
+        # Assert
+        assert result == ({"sku": "TV123"}, b'{"sku": "TV123"}')
+        redis_adapter.redis_client.blmove.assert_awaited_once_with("fila", "fila:processando", 5, "LEFT", "RIGHT")
+
+    @pytest.mark.asyncio
+    async def test_pop_move_json_timeout(self, redis_adapter):
+        """Testa BLMOVE sem item dentro do tempo"""
+        # Arrange
+        redis_adapter.redis_client.blmove.return_value = None
+
+        # Act & Assert
+        assert await redis_adapter.pop_move_json("fila", "fila:processando", timeout=1) is None
+
+    @pytest.mark.asyncio
+    async def test_remove_list_item(self, redis_adapter):
+        """Testa remoção de um item da lista pelo valor bruto"""
+        # Arrange
+        redis_adapter.redis_client.lrem.return_value = 1
+
+        # Act
+        removed = await redis_adapter.remove_list_item("fila:processando", b"job")
+
+        # Assert
+        assert removed is True
+        redis_adapter.redis_client.lrem.assert_awaited_once_with("fila:processando", 1, b"job")
+
+    @pytest.mark.asyncio
+    async def test_move_list_item(self, redis_adapter):
+        """Testa movimentação atômica de um item entre listas com script Lua"""
+        # Arrange
+        script = AsyncMock(return_value=1)
+        redis_adapter.redis_client.register_script = MagicMock(return_value=script)
+
+        # Act
+        moved = await redis_adapter.move_list_item("fila:processando", "fila", b"job")
+
+        # Assert
+        assert moved is True
+        script.assert_awaited_once_with(keys=["fila:processando", "fila"], args=[b"job"])
+
+    def test_pipeline(self, redis_adapter):
+        """Testa criação de pipeline com transação"""
+        # Arrange
+        redis_adapter.redis_client.pipeline = MagicMock()
+
+        # Act
+        redis_adapter.pipeline(transaction=True)
+
+        # Assert
+        redis_adapter.redis_client.pipeline.assert_called_once_with(transaction=True)
+
+    def test_init_with_max_connections(self, redis_url):
+        """Testa tamanho do pool de conexões"""
+        with patch('redis.asyncio.Redis.from_url') as mock_from_url:
+            # Act
+            RedisAsyncioAdapter(redis_url, max_connections=20)
+
+            # Assert
+            mock_from_url.assert_called_once_with(str(redis_url), max_connections=20)
+
+    @pytest.mark.asyncio
+    async def test_json_with_orjson_serializer(self, redis_adapter):
+        """Testa set_json/get_json com orjson, sem decode dos bytes"""
+        # Arrange
+        redis_adapter.serializer = OrjsonSerializer()
+        redis_adapter.redis_client.get.return_value = b'{"a":1}'
+
+        # Act
+        await redis_adapter.set_json("test_key", {"a": 1}, 60)
+        result = await redis_adapter.get_json("test_key")
+
+        # Assert
+        redis_adapter.redis_client.set.assert_called_once_with("test_key", b'{"a":1}', 60)
+        assert result == {"a": 1}
+
+    @pytest.mark.asyncio
+    async def test_incr(self, redis_adapter):
+        """Testa incremento de contador"""
+        # Arrange
+        redis_adapter.redis_client.incr.return_value = 4
+
+        # Act
+        result = await redis_adapter.incr("test_key")
+
+        # Assert
+        assert result == 4
+        redis_adapter.redis_client.incr.assert_called_once_with("test_key")
+
     @pytest.mark.asyncio
     async def test_get_json_with_invalid_json(self, redis_adapter):
         """Testa get_json com JSON inválido"""
@@ -335,4 +507,70 @@ class TestRedisAsyncioAdapter:
         result = await redis_adapter.exists("test_key")
         
         # Assert
-        assert result is True
\ No newline at end of file
+        assert result is True
+
+    @pytest.mark.asyncio
+    async def test_push_json(self, redis_adapter):
+        """Testa inclusão de item na fila"""
+        # Act
+        await redis_adapter.push_json("fila", {"sku": "123"})
+
+        # Assert
+        redis_adapter.redis_client.rpush.assert_called_once_with("fila", '{"sku": "123"}')
+
+    @pytest.mark.asyncio
+    async def test_pop_json(self, redis_adapter):
+        """Testa retirada de item da fila"""
+        # Arrange
+        redis_adapter.redis_client.blpop.return_value = (b"fila", b'{"sku": "123"}')
+
+        # Act
+        result = await redis_adapter.pop_json("fila", timeout=1)
+
+        # Assert
+        assert result == {"sku": "123"}
+        redis_adapter.redis_client.blpop.assert_called_once_with(["fila"], timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_pop_json_timeout(self, redis_adapter):
+        """Testa retirada de item da fila vazia"""
+        # Arrange
+        redis_adapter.redis_client.blpop.return_value = None
+
+        # Act
+        result = await redis_adapter.pop_json("fila", timeout=1)
+
+        # Assert
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_hget_json(self, redis_adapter):
+        """Testa leitura de campo de hash"""
+        # Arrange
+        redis_adapter.redis_client.hget.return_value = b"42"
+
+        # Act
+        result = await redis_adapter.hget_json("contagens", "campo")
+
+        # Assert
+        assert result == 42
+        redis_adapter.redis_client.hget.assert_called_once_with("contagens", "campo")
+
+    @pytest.mark.asyncio
+    async def test_hset_json_with_expires(self, redis_adapter):
+        """Testa gravação de campo de hash com expiração"""
+        # Act
+        await redis_adapter.hset_json("contagens", "campo", 42, 300)
+
+        # Assert
+        redis_adapter.redis_client.hset.assert_called_once_with("contagens", "campo", "42")
+        redis_adapter.redis_client.expire.assert_called_once_with("contagens", 300)
+
+    @pytest.mark.asyncio
+    async def test_publish_json(self, redis_adapter):
+        """Testa publicação em canal pub/sub"""
+        # Act
+        await redis_adapter.publish_json("canal", ["produto:magalu:tv1"])
+
+        # Assert
+        redis_adapter.redis_client.publish.assert_called_once_with("canal", '["produto:magalu:tv1"]')
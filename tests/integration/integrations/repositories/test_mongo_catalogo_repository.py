@@ -1,5 +1,5 @@
 import pytest
-from app.models import CatalogoModel
+from app.models import CatalogoModel, DescriptionStatus
 
 class TestMongoCatalogoRepository:
 
@@ -92,6 +92,21 @@ class TestMongoCatalogoRepository:
         assert updated.seller_id == "1234"
         assert updated.name == "produto3"
 
+    @pytest.mark.asyncio
+    async def test_update_by_sellerid_sku_keeps_excluded_fields(self, repository):
+        produto = CatalogoModel(
+            seller_id="1234", sku="1234", name="produto2", description_status=DescriptionStatus.PENDING
+        )
+        await repository.create(produto)
+
+        produto_atualizado = CatalogoModel(seller_id="1234", sku="1234", name="produto3")
+        updated = await repository.update_by_sellerid_sku(
+            "1234", "1234", produto_atualizado, exclude={"description", "description_status"}
+        )
+
+        assert updated.name == "produto3"
+        assert updated.description_status == DescriptionStatus.PENDING
+
     @pytest.mark.asyncio
     async def test_update_document_not_found(self, repository):
         product = CatalogoModel(seller_id="123", sku="123", name="Produto 1")
@@ -141,6 +156,18 @@ class TestMongoCatalogoRepository:
         assert updated.sku == "123"
         assert updated.name == "Produto Atualizado"
 
+    @pytest.mark.asyncio
+    async def test_patch_by_sellerid_sku_with_condition(self, repository):
+        produto = CatalogoModel(seller_id="123", sku="123", name="Produto 1", description_status=DescriptionStatus.DONE)
+        await repository.create(produto)
+
+        patch = {"description": "gerada", "description_status": DescriptionStatus.DONE}
+        updated = await repository.patch_by_sellerid_sku(
+            "123", "123", patch, condition={"description_status": DescriptionStatus.PENDING}
+        )
+        assert updated is None
+        assert (await repository.find_by_sellerid_sku("123", "123")).description is None
+
     @pytest.mark.asyncio
     async def test_find_by_sellerid_sku(self, repository):
         product = CatalogoModel(seller_id="123", sku="123", name="Produto 1")
@@ -171,4 +198,26 @@ class TestMongoCatalogoRepository:
         deleted = await repository.delete_by_sellerid_sku("123", "123")
         assert deleted is True
     
-    
\ No newline at end of file
+    
+    @pytest.mark.asyncio
+    async def test_bulk_create_and_find_existing(self, repository):
+        produtos = [
+            CatalogoModel(seller_id="lote", sku="sku1", name="Produto 1"),
+            CatalogoModel(seller_id="lote", sku="sku2", name="Produto 2"),
+        ]
+        failures = await repository.bulk_create(produtos)
+        assert failures == {}
+
+        existentes = await repository.find_existing_sellerid_skus([("lote", "sku1"), ("lote", "sku3")])
+        assert existentes == {("lote", "sku1")}
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_skus(self, repository):
+        await repository.bulk_create([
+            CatalogoModel(seller_id="lote", sku="sku1", name="Produto 1"),
+            CatalogoModel(seller_id="outro", sku="sku1", name="Produto 2"),
+        ])
+
+        produtos = await repository.find_by_sellerid_skus([("lote", "sku1"), ("outro", "sku1"), ("lote", "sku9")])
+
+        assert sorted((produto.seller_id, produto.sku) for produto in produtos) == [("lote", "sku1"), ("outro", "sku1")]
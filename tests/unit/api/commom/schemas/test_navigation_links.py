@@ -51,4 +51,29 @@ def test_navigation_links_build_offset_less_than_zero():
     # prev_offset deve ser 0, nunca negativo
     assert links.previous == "/produtos?_offset=0&_limit=10"
     assert links.current == "/produtos?_offset=5&_limit=10"
-    assert links.next == "/produtos?_offset=15&_limit=10"
\ No newline at end of file
+    assert links.next == "/produtos?_offset=15&_limit=10"
+def test_navigation_links_build_with_cursor():
+    links = NavigationLinks.build(
+        request_path="/produtos",
+        offset=0,
+        limit=10,
+        has_next=True,
+        filters="name_like=tv",
+        sorting=None,
+        cursor="abc",
+        next_cursor="def",
+    )
+    assert links.previous == "/produtos?_offset=0&_limit=10&name_like=tv"
+    assert links.current == "/produtos?_cursor=abc&_limit=10&name_like=tv"
+    assert links.next == "/produtos?_cursor=def&_limit=10&name_like=tv"
+
+def test_navigation_links_build_first_page_with_next_cursor():
+    links = NavigationLinks.build(
+        request_path="/produtos",
+        offset=0,
+        limit=10,
+        has_next=True,
+        next_cursor="def",
+    )
+    assert links.current == "/produtos?_offset=0&_limit=10"
+    assert links.next == "/produtos?_cursor=def&_limit=10"
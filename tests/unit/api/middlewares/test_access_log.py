@@ -0,0 +1,134 @@
+import logging
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.middlewares.access_log import OBFUSCATED_VALUE, AccessLogMiddleware
+
+ACCESS_LOGGER = "app.access"
+
+
+def build_client(**middleware_options) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.get("/seller/v2/catalogo")
+    async def catalogo():
+        return []
+
+    @app.get("/falha")
+    async def falha():
+        raise HTTPException(status_code=503)
+
+    app.add_middleware(AccessLogMiddleware, **middleware_options)
+    return TestClient(app)
+
+
+def access_records(caplog) -> list[logging.LogRecord]:
+    return [record for record in caplog.records if record.name == ACCESS_LOGGER]
+
+
+class TestAccessLogMiddleware:
+
+    def test_logs_request_with_structured_fields(self, caplog):
+        client = build_client()
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER):
+            client.get("/seller/v2/catalogo?limit=10")
+
+        [record] = access_records(caplog)
+        assert record.getMessage().startswith("GET /seller/v2/catalogo 200 ")
+        assert record.access_log["path"] == "/seller/v2/catalogo"
+        assert record.access_log["query"] == "limit=10"
+        assert record.access_log["status"] == 200
+        assert "headers" not in record.access_log
+
+    def test_headers_are_filtered_and_obfuscated(self, caplog):
+        client = build_client(headers_to_log={"Authorization", "X-Seller-Id"})
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER):
+            client.get(
+                "/seller/v2/catalogo",
+                headers={"Authorization": "Bearer segredo", "X-Seller-Id": "magalu", "Cookie": "sessao=1"},
+            )
+
+        [record] = access_records(caplog)
+        assert record.access_log["headers"] == {"authorization": OBFUSCATED_VALUE, "x-seller-id": "magalu"}
+        assert "segredo" not in str(record.__dict__)
+
+    def test_configured_headers_to_obfuscate(self, caplog):
+        client = build_client(headers_to_log={"x-seller-id"}, headers_to_obfuscate={"X-Seller-Id"})
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER):
+            client.get("/seller/v2/catalogo", headers={"X-Seller-Id": "magalu"})
+
+        [record] = access_records(caplog)
+        assert record.access_log["headers"] == {"x-seller-id": OBFUSCATED_VALUE}
+
+    def test_ignored_urls_are_not_logged(self, caplog):
+        client = build_client(ignored_urls={"/api/ping"})
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER):
+            client.get("/api/ping")
+
+        assert access_records(caplog) == []
+
+    def test_route_sample_rate_overrides_default(self, caplog):
+        client = build_client(sample_rate=1.0, route_sample_rates={"/api": 0.0})
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER):
+            client.get("/api/ping")
+            client.get("/seller/v2/catalogo")
+
+        assert [record.access_log["path"] for record in access_records(caplog)] == ["/seller/v2/catalogo"]
+
+    def test_server_errors_are_always_logged(self, caplog):
+        client = build_client(sample_rate=0.0)
+
+        with caplog.at_level(logging.INFO, logger=ACCESS_LOGGER):
+            client.get("/seller/v2/catalogo")
+            client.get("/falha")
+
+        [record] = access_records(caplog)
+        assert record.access_log["status"] == 503
+        assert record.levelno == logging.WARNING
+
+    def test_nothing_is_built_when_info_is_disabled(self, caplog):
+        client = build_client()
+
+        with caplog.at_level(logging.WARNING, logger=ACCESS_LOGGER):
+            client.get("/seller/v2/catalogo")
+
+        assert access_records(caplog) == []
+
+    def test_server_errors_are_logged_when_info_is_disabled(self, caplog):
+        client = build_client()
+
+        with caplog.at_level(logging.WARNING, logger=ACCESS_LOGGER):
+            client.get("/seller/v2/catalogo")
+            client.get("/falha")
+
+        [record] = access_records(caplog)
+        assert record.access_log["status"] == 503
+        assert record.levelno == logging.WARNING
+
+    def test_nothing_is_logged_when_warning_is_disabled(self, caplog):
+        client = build_client()
+
+        with caplog.at_level(logging.ERROR, logger=ACCESS_LOGGER):
+            client.get("/falha")
+
+        assert access_records(caplog) == []
+
+    @pytest.mark.parametrize(
+        "path, expected",
+        [("/api/ping", 0.0), ("/api/metrics", 0.5), ("/seller/v2/catalogo", 0.25)],
+    )
+    def test_sample_rate_for_uses_longest_prefix(self, path, expected):
+        middleware = AccessLogMiddleware(app=None, sample_rate=0.25, route_sample_rates={"/api": 0.5, "/api/ping": 0.0})
+
+        assert middleware.sample_rate_for(path) == expected
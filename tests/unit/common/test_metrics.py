@@ -0,0 +1,48 @@
+from app.common.metrics import MetricsRegistry
+
+
+def test_counter_render():
+    registry = MetricsRegistry()
+    counter = registry.counter("cache_hits_total", "Acertos", ("namespace",))
+
+    counter.inc("produto")
+    counter.inc("produto", amount=2)
+    counter.inc("lista")
+
+    text = registry.render()
+    assert "# HELP cache_hits_total Acertos" in text
+    assert "# TYPE cache_hits_total counter" in text
+    assert 'cache_hits_total{namespace="produto"} 3' in text
+    assert 'cache_hits_total{namespace="lista"} 1' in text
+
+
+def test_histogram_render_is_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latencia_seconds", "Latência", ("namespace",), buckets=(0.1, 1.0))
+
+    histogram.observe(0.05, "produto")
+    histogram.observe(0.5, "produto")
+    histogram.observe(5, "produto")
+
+    text = registry.render()
+    assert 'latencia_seconds_bucket{namespace="produto",le="0.1"} 1' in text
+    assert 'latencia_seconds_bucket{namespace="produto",le="1"} 2' in text
+    assert 'latencia_seconds_bucket{namespace="produto",le="+Inf"} 3' in text
+    assert 'latencia_seconds_sum{namespace="produto"} 5.55' in text
+    assert 'latencia_seconds_count{namespace="produto"} 3' in text
+
+
+def test_histogram_time():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("operacao_seconds", "Operação")
+
+    with histogram.time():
+        pass
+
+    assert histogram.get_count() == 1
+
+
+def test_register_same_name_returns_existing_metric():
+    registry = MetricsRegistry()
+
+    assert registry.counter("total", "Total") is registry.counter("total", "Total")
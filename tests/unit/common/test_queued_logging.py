@@ -0,0 +1,58 @@
+import logging
+
+import pytest
+
+from app.common.queued_logging import LazyQueueHandler, QueuedLogging
+
+
+class ListHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record):
+        self.messages.append(self.format(record))
+
+
+@pytest.fixture
+def root_handler():
+    root = logging.getLogger()
+    original_handlers = root.handlers
+    handler = ListHandler()
+    root.handlers = [handler]
+    yield handler
+    root.handlers = original_handlers
+
+
+def test_queued_logging_writes_through_listener(root_handler):
+    handlers = logging.getLogger().handlers
+    queued_logging = QueuedLogging()
+    queued_logging.start()
+    try:
+        assert isinstance(logging.getLogger().handlers[0], LazyQueueHandler)
+        logging.getLogger("teste.fila").warning("produto %s", "abc")
+    finally:
+        queued_logging.stop()
+
+    assert root_handler.messages == ["produto abc"]
+    assert logging.getLogger().handlers == handlers
+
+
+def test_queued_logging_disabled_keeps_handlers(root_handler):
+    handlers = logging.getLogger().handlers
+    queued_logging = QueuedLogging(enabled=False)
+
+    queued_logging.start()
+
+    assert logging.getLogger().handlers is handlers
+    assert root_handler in handlers
+    queued_logging.stop()
+
+
+def test_lazy_queue_handler_does_not_format():
+    record = logging.LogRecord("teste", logging.INFO, __file__, 1, "produto %s", ("abc",), None)
+
+    prepared = LazyQueueHandler(None).prepare(record)
+
+    assert prepared.msg == "produto %s"
+    assert prepared.args == ("abc",)
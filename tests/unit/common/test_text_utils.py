@@ -0,0 +1,17 @@
+from app.common.text_utils import normalize_search_text
+
+
+class TestTextUtils:
+    def test_normalize_search_text_removes_accents_and_case(self):
+        """Testa se o texto é convertido para minúsculo e sem acentos."""
+        assert normalize_search_text("Câmera FOTOGRÁFICA Ação") == "camera fotografica acao"
+
+    def test_normalize_search_text_collapses_whitespace(self):
+        """Testa se espaços repetidos e nas pontas são removidos."""
+        assert normalize_search_text("  Smart   TV\t55 ") == "smart tv 55"
+
+    def test_normalize_search_text_empty(self):
+        """Testa entradas vazias."""
+        assert normalize_search_text(None) == ""
+        assert normalize_search_text("") == ""
+        assert normalize_search_text("   ") == ""
@@ -0,0 +1,106 @@
+import json
+
+import jwt
+import pytest
+
+from app.container import Container
+from app.integrations.auth.keycloak_adapter import InvalidTokenException, TokenExpiredException
+from app.integrations.auth.local_jwks_adapter import LocalJwksAdapter
+from app.integrations.auth.local_tokens import (
+    JWKS_FILE,
+    LOCAL_KID,
+    PRIVATE_KEY_FILE,
+    main,
+    mint_token,
+    write_local_keys,
+)
+
+
+@pytest.fixture(scope="module")
+def local_keys(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("local-auth")
+    private_key_path, jwks_path = write_local_keys(directory)
+    return private_key_path.read_bytes(), jwks_path
+
+
+@pytest.fixture
+def local_adapter(local_keys):
+    _, jwks_path = local_keys
+    return LocalJwksAdapter(str(jwks_path))
+
+
+class TestLocalJwksAdapter:
+
+    @pytest.mark.asyncio
+    async def test_validate_minted_token(self, local_adapter, local_keys):
+        private_key_pem, _ = local_keys
+        token = mint_token(private_key_pem, sellers=["magalu", "luizalabs"], sub="vendedor")
+
+        info_token = await local_adapter.validate_token(token)
+
+        assert info_token["sub"] == "vendedor"
+        assert info_token["sellers"] == "magalu,luizalabs"
+
+    @pytest.mark.asyncio
+    async def test_validate_expired_token(self, local_adapter, local_keys):
+        private_key_pem, _ = local_keys
+        token = mint_token(private_key_pem, sellers=["magalu"], expires_in_seconds=-10)
+
+        with pytest.raises(TokenExpiredException):
+            await local_adapter.validate_token(token)
+
+    @pytest.mark.asyncio
+    async def test_validate_token_unknown_kid(self, local_adapter, local_keys):
+        private_key_pem, _ = local_keys
+        token = mint_token(private_key_pem, sellers=["magalu"], kid="outra-chave")
+
+        with pytest.raises(InvalidTokenException, match="Chave 'outra-chave' não encontrada"):
+            await local_adapter.validate_token(token)
+
+    @pytest.mark.asyncio
+    async def test_prewarm_reads_jwks_file(self, local_adapter, local_keys):
+        _, jwks_path = local_keys
+
+        await local_adapter.prewarm()
+
+        assert local_adapter._public_keys == json.loads(jwks_path.read_text())["keys"]
+        assert list(local_adapter._jwks_by_kid) == [LOCAL_KID]
+
+    @pytest.mark.asyncio
+    async def test_does_not_create_http_client(self, local_adapter):
+        assert local_adapter._http_client is None
+
+        await local_adapter.aclose()
+
+    def test_jwks_path_required(self):
+        with pytest.raises(ValueError, match="APP_OPENID_LOCAL_JWKS_PATH"):
+            LocalJwksAdapter(None)
+
+    def test_container_selects_local_adapter(self, local_keys):
+        _, jwks_path = local_keys
+        container = Container()
+        container.config.app_openid_mode.from_value("local")
+        container.config.app_openid_local_jwks_path.from_value(str(jwks_path))
+
+        adapter = container.keycloak_adapter()
+
+        assert isinstance(adapter, LocalJwksAdapter)
+        assert container.keycloak_adapter() is adapter
+
+
+class TestLocalTokens:
+
+    def test_cli_generates_keys_and_token(self, tmp_path, capsys):
+        main(["chaves", "--dir", str(tmp_path)])
+        assert (tmp_path / PRIVATE_KEY_FILE).exists()
+        assert (tmp_path / JWKS_FILE).exists()
+        capsys.readouterr()
+
+        main(["token", "--chave", str(tmp_path / PRIVATE_KEY_FILE), "--sellers", "magalu", "--sub", "carga"])
+        token = capsys.readouterr().out.strip()
+
+        header = jwt.get_unverified_header(token)
+        claims = jwt.decode(token, options={"verify_signature": False})
+        assert header["kid"] == LOCAL_KID
+        assert claims["sub"] == "carga"
+        assert claims["sellers"] == "magalu"
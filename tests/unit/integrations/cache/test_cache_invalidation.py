@@ -0,0 +1,65 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.integrations.cache.cache_invalidation import INVALIDATION_CHANNEL, CacheInvalidationBus
+from app.integrations.cache.local_cache import LocalCache
+
+
+class TestCacheInvalidationBus:
+
+    @pytest.fixture
+    def local_cache(self):
+        cache = LocalCache(max_size=10, ttl_seconds=60)
+        cache.set("produto:magalu:tv1", "tv1")
+        cache.set("produto:magalu:tv2", "tv2")
+        return cache
+
+    @pytest.mark.asyncio
+    async def test_invalidate_evicts_local_and_publishes(self, local_cache):
+        redis_adapter = AsyncMock()
+        bus = CacheInvalidationBus(redis_adapter, local_cache=local_cache)
+
+        await bus.invalidate("produto:magalu:tv1")
+
+        assert local_cache.get("produto:magalu:tv1") is None
+        assert local_cache.get("produto:magalu:tv2") == "tv2"
+        redis_adapter.publish_json.assert_awaited_once_with(INVALIDATION_CHANNEL, ["produto:magalu:tv1"])
+
+    @pytest.mark.asyncio
+    async def test_invalidate_publish_failure_is_ignored(self, local_cache):
+        redis_adapter = AsyncMock()
+        redis_adapter.publish_json.side_effect = Exception("Redis fora")
+        bus = CacheInvalidationBus(redis_adapter, local_cache=local_cache)
+
+        await bus.invalidate("produto:magalu:tv1")
+
+        assert local_cache.get("produto:magalu:tv1") is None
+
+    @pytest.mark.asyncio
+    async def test_listen_evicts_keys_from_other_processes(self, local_cache):
+        received = asyncio.Event()
+
+        async def listen_json(channel):
+            yield ["produto:magalu:tv2"]
+            received.set()
+            await asyncio.Event().wait()
+
+        redis_adapter = AsyncMock()
+        redis_adapter.listen_json = listen_json
+        bus = CacheInvalidationBus(redis_adapter, local_cache=local_cache)
+
+        bus.start()
+        await asyncio.wait_for(received.wait(), timeout=1)
+        await bus.stop()
+
+        assert local_cache.get("produto:magalu:tv2") is None
+        assert local_cache.get("produto:magalu:tv1") == "tv1"
+
+    def test_start_without_local_cache_does_nothing(self):
+        bus = CacheInvalidationBus(AsyncMock())
+
+        bus.start()
+
+        assert bus._task is None
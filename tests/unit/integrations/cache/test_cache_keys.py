@@ -0,0 +1,23 @@
+from app.integrations.cache.cache_keys import (
+    count_cache_key,
+    listing_cache_key,
+    listing_version_key,
+    product_cache_key,
+    product_cache_keys,
+    product_response_cache_key,
+)
+
+
+def test_keys_normalize_seller_id():
+    assert product_cache_key("Magalu", "TV123") == "produto:magalu:TV123"
+    assert product_response_cache_key(" MAGALU ", "TV123") == "produto_resposta:magalu:TV123"
+    assert count_cache_key("Magalu") == "produto_count:magalu"
+    assert listing_version_key("Magalu") == "lista_versao:magalu"
+    assert listing_cache_key("Magalu", "3", "abc") == "lista:magalu:3:abc"
+
+
+def test_product_cache_keys_match_single_keys():
+    assert product_cache_keys("Magalu", "TV123") == [
+        product_cache_key("magalu", "TV123"),
+        product_response_cache_key("magalu", "TV123"),
+    ]
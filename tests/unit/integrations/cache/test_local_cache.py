@@ -0,0 +1,66 @@
+from unittest.mock import patch
+
+from app.integrations.cache.cache_metrics import CacheMetrics
+from app.integrations.cache.local_cache import LocalCache
+
+
+class TestLocalCache:
+
+    def test_set_and_get(self):
+        cache = LocalCache(max_size=10, ttl_seconds=10)
+
+        cache.set("produto:magalu:tv1", {"sku": "tv1"})
+
+        assert cache.get("produto:magalu:tv1") == {"sku": "tv1"}
+        assert cache.get("produto:magalu:tv2") is None
+
+    def test_expired_item_is_removed(self):
+        cache = LocalCache(max_size=10, ttl_seconds=10)
+        with patch("app.integrations.cache.local_cache.time.monotonic", return_value=100.0):
+            cache.set("chave", "valor")
+
+        with patch("app.integrations.cache.local_cache.time.monotonic", return_value=110.0):
+            assert cache.get("chave") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self):
+        cache = LocalCache(max_size=2, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_eviction_is_counted_in_metrics(self):
+        cache_metrics = CacheMetrics()
+        cache = LocalCache(max_size=1, ttl_seconds=10, cache_metrics=cache_metrics)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("b", 3)
+        cache.delete("b")
+
+        assert cache_metrics.evictions.get("produto_local") == 1
+
+    def test_delete_and_clear(self):
+        cache = LocalCache(max_size=10, ttl_seconds=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.delete("a")
+        cache.delete("inexistente")
+        assert cache.get("a") is None
+
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_zero_size_disables_cache(self):
+        cache = LocalCache(max_size=0, ttl_seconds=10)
+
+        cache.set("a", 1)
+
+        assert cache.get("a") is None
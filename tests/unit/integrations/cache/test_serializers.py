@@ -0,0 +1,25 @@
+import pytest
+
+from app.integrations.cache.serializers import JsonSerializer, OrjsonSerializer, build_serializer
+
+
+@pytest.mark.parametrize("serializer", [JsonSerializer(), OrjsonSerializer()])
+def test_serializer_roundtrip_from_bytes(serializer):
+    value = {"sku": "tv1", "tags": ["a", "b"], "preco": 10}
+
+    data = serializer.dumps(value)
+    raw = data.encode() if isinstance(data, str) else data
+
+    assert serializer.loads(raw) == value
+
+
+def test_serializers_are_compatible():
+    value = {"name": "Televisão", "quantidade": 2}
+
+    assert OrjsonSerializer().loads(JsonSerializer().dumps(value).encode()) == value
+    assert JsonSerializer().loads(OrjsonSerializer().dumps(value)) == value
+
+
+def test_build_serializer():
+    assert isinstance(build_serializer("json"), JsonSerializer)
+    assert isinstance(build_serializer("orjson"), OrjsonSerializer)
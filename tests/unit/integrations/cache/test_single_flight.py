@@ -0,0 +1,61 @@
+import asyncio
+
+import pytest
+
+from app.integrations.cache.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_load(self):
+        single_flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "produto"
+
+        pending = [asyncio.create_task(single_flight.do("chave", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert results == ["produto"] * 5
+        assert calls == 1
+        assert len(single_flight) == 0
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_and_not_cached(self):
+        single_flight = SingleFlight()
+
+        async def failing_loader():
+            raise ValueError("falhou")
+
+        async def loader():
+            return "ok"
+
+        with pytest.raises(ValueError):
+            await single_flight.do("chave", failing_loader)
+
+        assert await single_flight.do("chave", loader) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_others(self):
+        single_flight = SingleFlight()
+        release = asyncio.Event()
+
+        async def loader():
+            await release.wait()
+            return "produto"
+
+        first = asyncio.create_task(single_flight.do("chave", loader))
+        second = asyncio.create_task(single_flight.do("chave", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == "produto"
@@ -0,0 +1,17 @@
+from app.integrations.cache.ttl import jittered_ttl
+
+
+def test_jittered_ttl_stays_within_bounds():
+    values = {jittered_ttl(100, 0.1) for _ in range(200)}
+
+    assert min(values) >= 90
+    assert max(values) <= 110
+    assert len(values) > 1
+
+
+def test_jittered_ttl_without_jitter():
+    assert jittered_ttl(300, 0) == 300
+
+
+def test_jittered_ttl_is_at_least_one_second():
+    assert jittered_ttl(0.2, 0.5) == 1
@@ -0,0 +1,32 @@
+import httpx
+import pytest
+
+from app.integrations.http.async_http_client import build_async_http_client
+
+
+class TestBuildAsyncHttpClient:
+
+    @pytest.mark.asyncio
+    async def test_build_with_timeouts_and_limits(self):
+        client = build_async_http_client(
+            connect_timeout=1.0,
+            read_timeout=2.0,
+            write_timeout=3.0,
+            pool_timeout=4.0,
+            max_connections=5,
+            max_keepalive_connections=2,
+            keepalive_expiry=10.0,
+        )
+
+        assert isinstance(client, httpx.AsyncClient)
+        assert client.timeout == httpx.Timeout(connect=1.0, read=2.0, write=3.0, pool=4.0)
+        await client.aclose()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_build_with_defaults(self):
+        client = build_async_http_client()
+
+        assert client.timeout.connect == 5.0
+        assert client.timeout.read == 30.0
+        await client.aclose()
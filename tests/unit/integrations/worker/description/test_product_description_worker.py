@@ -0,0 +1,287 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from app.models import CatalogoModel, DescriptionStatus
+from app.services import CatalogoService
+from app.worker.description.description_job_queue import DescriptionJobQueue
+from app.worker.description.product_description_worker import ProductDescriptionWorker
+
+
+class TestDescriptionJobQueue:
+
+    @pytest.fixture
+    def redis_mock(self):
+        return AsyncMock()
+
+    @pytest.mark.asyncio
+    async def test_enqueue(self, redis_mock):
+        queue = DescriptionJobQueue(redis_mock)
+
+        await queue.enqueue("magalu", "TV123")
+
+        redis_mock.push_json.assert_awaited_once_with(
+            DescriptionJobQueue.QUEUE_NAME, {"seller_id": "magalu", "sku": "TV123", "attempt": 1}
+        )
+
+    @pytest.mark.asyncio
+    async def test_dequeue_moves_job_to_processing(self, redis_mock):
+        redis_mock.pop_move_json.return_value = ({"seller_id": "magalu", "sku": "TV123", "attempt": 1}, b"job")
+        queue = DescriptionJobQueue(redis_mock, visibility_timeout_seconds=300)
+
+        job, receipt = await queue.dequeue(timeout=1)
+
+        assert job["sku"] == "TV123"
+        assert receipt == b"job"
+        redis_mock.pop_move_json.assert_awaited_once_with(
+            DescriptionJobQueue.QUEUE_NAME, queue.processing_name, timeout=1
+        )
+        redis_mock.set_str.assert_awaited_once_with(queue._lease_key(b"job"), 1, expires_in_seconds=300)
+
+    @pytest.mark.asyncio
+    async def test_dequeue_empty(self, redis_mock):
+        redis_mock.pop_move_json.return_value = None
+        queue = DescriptionJobQueue(redis_mock)
+
+        assert await queue.dequeue(timeout=1) is None
+        redis_mock.set_str.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_ack_removes_job_and_lease(self, redis_mock):
+        queue = DescriptionJobQueue(redis_mock)
+
+        await queue.ack(b"job")
+
+        redis_mock.remove_list_item.assert_awaited_once_with(queue.processing_name, b"job")
+        redis_mock.delete.assert_awaited_once_with(queue._lease_key(b"job"))
+
+    @pytest.mark.asyncio
+    async def test_requeue_expired_only_moves_jobs_without_lease(self, redis_mock):
+        queue = DescriptionJobQueue(redis_mock)
+        redis_mock.list_items.return_value = [b"em-andamento", b"abandonado"]
+        redis_mock.exists.side_effect = lambda key: key == queue._lease_key(b"em-andamento")
+        redis_mock.move_list_item.return_value = True
+
+        requeued = await queue.requeue_expired()
+
+        assert requeued == 1
+        redis_mock.move_list_item.assert_awaited_once_with(
+            queue.processing_name, DescriptionJobQueue.QUEUE_NAME, b"abandonado"
+        )
+
+
+class InMemoryCatalogoRepository:
+    """
+    Repositório mínimo com a semântica de gravação do MongoCatalogoRepository ($set dos campos informados).
+    """
+
+    def __init__(self, *products: CatalogoModel):
+        self.documents = {(product.seller_id, product.sku): product.model_dump() for product in products}
+
+    async def find_by_sellerid_sku(self, seller_id, sku):
+        document = self.documents.get((seller_id, sku))
+        return CatalogoModel(**document) if document else None
+
+    async def update_by_sellerid_sku(self, seller_id, sku, entity, exclude=None):
+        return await self.patch_by_sellerid_sku(seller_id, sku, entity.model_dump(exclude={"id", *(exclude or ())}))
+
+    async def patch_by_sellerid_sku(self, seller_id, sku, patch_entity, condition=None):
+        document = self.documents.get((seller_id, sku))
+        if document is None or any(document.get(field) != value for field, value in (condition or {}).items()):
+            return None
+        document.update(patch_entity)
+        return CatalogoModel(**document)
+
+
+class TestProductDescriptionWorker:
+
+    @pytest.fixture
+    def pending_product(self):
+        return CatalogoModel(
+            seller_id="magalu", sku="TV123", name="Smart TV", description_status=DescriptionStatus.PENDING
+        )
+
+    @pytest.fixture
+    def repository_mock(self, pending_product):
+        mock = MagicMock()
+        mock.find_by_sellerid_sku = AsyncMock(return_value=pending_product)
+        mock.patch_by_sellerid_sku = AsyncMock()
+        return mock
+
+    @pytest.fixture
+    def ia_mock(self):
+        mock = MagicMock()
+        mock.create_description = AsyncMock(return_value={"description": "desc gerada"})
+        return mock
+
+    @pytest.fixture
+    def queue_mock(self):
+        mock = MagicMock()
+        mock.enqueue = AsyncMock()
+        mock.dequeue = AsyncMock(return_value=None)
+        mock.requeue_expired = AsyncMock(return_value=0)
+        return mock
+
+    @pytest.fixture
+    def worker(self, queue_mock, repository_mock, ia_mock):
+        return ProductDescriptionWorker(
+            job_queue=queue_mock,
+            repository=repository_mock,
+            redis_adapter=AsyncMock(),
+            creating_product_description=ia_mock,
+            max_attempts=2,
+            invalidation_bus=AsyncMock(),
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_success(self, worker, repository_mock):
+        await worker.process({"seller_id": "magalu", "sku": "TV123", "attempt": 1})
+
+        repository_mock.patch_by_sellerid_sku.assert_awaited_once_with(
+            "magalu",
+            "TV123",
+            {"description": "desc gerada", "description_status": DescriptionStatus.DONE},
+            condition={"description_status": DescriptionStatus.PENDING},
+        )
+        worker.redis_adapter.delete_many.assert_awaited_once_with(
+            ["produto:magalu:TV123", "produto_resposta:magalu:TV123"]
+        )
+        worker.invalidation_bus.invalidate.assert_awaited_once_with(
+            "produto:magalu:TV123", "produto_resposta:magalu:TV123"
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_retry_on_failure(self, worker, repository_mock, ia_mock, queue_mock):
+        ia_mock.create_description.return_value = None
+
+        await worker.process({"seller_id": "magalu", "sku": "TV123", "attempt": 1})
+
+        queue_mock.enqueue.assert_awaited_once_with("magalu", "TV123", attempt=2)
+        repository_mock.patch_by_sellerid_sku.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_marks_failed_after_max_attempts(self, worker, repository_mock, ia_mock, queue_mock):
+        ia_mock.create_description.return_value = None
+
+        await worker.process({"seller_id": "magalu", "sku": "TV123", "attempt": 2})
+
+        queue_mock.enqueue.assert_not_called()
+        repository_mock.patch_by_sellerid_sku.assert_awaited_once_with(
+            "magalu",
+            "TV123",
+            {"description_status": DescriptionStatus.FAILED},
+            condition={"description_status": DescriptionStatus.PENDING},
+        )
+
+    @pytest.mark.asyncio
+    async def test_process_skips_product_not_pending(self, worker, repository_mock, ia_mock, pending_product):
+        pending_product.description_status = None
+
+        await worker.process({"seller_id": "magalu", "sku": "TV123"})
+
+        ia_mock.create_description.assert_not_called()
+        repository_mock.patch_by_sellerid_sku.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_discards_description_edited_meanwhile(self, worker, repository_mock):
+        # O seller informou a descrição enquanto a IA gerava: o filtro por "pending" não encontra o produto
+        repository_mock.patch_by_sellerid_sku.return_value = None
+
+        await worker.process({"seller_id": "magalu", "sku": "TV123", "attempt": 1})
+
+        worker.redis_adapter.delete_many.assert_not_called()
+        worker.redis_adapter.incr.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_process_skips_deleted_product(self, worker, repository_mock, ia_mock):
+        repository_mock.find_by_sellerid_sku.return_value = None
+
+        await worker.process({"seller_id": "magalu", "sku": "TV123"})
+
+        ia_mock.create_description.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_put_without_description_keeps_job_pending(self, queue_mock, ia_mock, pending_product):
+        repository = InMemoryCatalogoRepository(pending_product)
+        service = CatalogoService(repository=repository, redis_adapter=AsyncMock())
+        worker = ProductDescriptionWorker(
+            job_queue=queue_mock,
+            repository=repository,
+            redis_adapter=AsyncMock(),
+            creating_product_description=ia_mock,
+        )
+
+        # PUT só com o nome, enquanto a descrição ainda está sendo gerada
+        updated = await service.update_by_sellerid_sku(
+            "magalu", "TV123", CatalogoModel(seller_id="magalu", sku="TV123", name="Smart TV 50")
+        )
+        assert updated.description_status == DescriptionStatus.PENDING
+
+        await worker.process({"seller_id": "magalu", "sku": "TV123", "attempt": 1})
+
+        product = await repository.find_by_sellerid_sku("magalu", "TV123")
+        assert product.name == "Smart TV 50"
+        assert product.description == "desc gerada"
+        assert product.description_status == DescriptionStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_consume_acks_processed_job(self, worker, queue_mock, repository_mock):
+        stop_event = asyncio.Event()
+        job = {"seller_id": "magalu", "sku": "TV123", "attempt": 1}
+
+        async def ack(receipt):
+            stop_event.set()
+
+        queue_mock.dequeue = AsyncMock(return_value=(job, b"job"))
+        queue_mock.ack = AsyncMock(side_effect=ack)
+
+        await asyncio.wait_for(worker.consume(stop_event), timeout=1)
+
+        repository_mock.patch_by_sellerid_sku.assert_awaited_once()
+        queue_mock.ack.assert_awaited_once_with(b"job")
+
+    @pytest.mark.asyncio
+    async def test_consume_does_not_ack_failed_job(self, worker, queue_mock, repository_mock):
+        stop_event = asyncio.Event()
+        job = {"seller_id": "magalu", "sku": "TV123", "attempt": 1}
+
+        async def find(*args):
+            stop_event.set()
+            raise RuntimeError("Mongo fora")
+
+        repository_mock.find_by_sellerid_sku = AsyncMock(side_effect=find)
+        queue_mock.dequeue = AsyncMock(return_value=(job, b"job"))
+        queue_mock.ack = AsyncMock()
+
+        await asyncio.wait_for(worker.consume(stop_event), timeout=1)
+
+        # Fica na lista de processamento até a reserva expirar
+        queue_mock.ack.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_run_requeues_expired_jobs(self, worker, queue_mock):
+        stop_event = asyncio.Event()
+
+        async def requeue_expired():
+            stop_event.set()
+            return 1
+
+        queue_mock.requeue_expired = AsyncMock(side_effect=requeue_expired)
+
+        await asyncio.wait_for(worker.run(number_workers=1, stop_event=stop_event), timeout=1)
+
+        queue_mock.requeue_expired.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_run_stops_on_event(self, worker, queue_mock):
+        stop_event = asyncio.Event()
+
+        async def dequeue(*args, **kwargs):
+            stop_event.set()
+            return None
+
+        queue_mock.dequeue = AsyncMock(side_effect=dequeue)
+
+        await asyncio.wait_for(worker.run(number_workers=2, stop_event=stop_event), timeout=1)
+
+        assert queue_mock.dequeue.await_count >= 1
@@ -1,8 +1,11 @@
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from app.common.exceptions import BadRequestException, NotFoundException
-from app.models import CatalogoModel
+from app.models import CatalogoModel, CountMode, DescriptionStatus, NameSearchMode
 from app.services import CatalogoService
 from app.services.catalogo.catalogo_exceptions import(
     ProductAlreadyExistsException,
@@ -10,9 +13,15 @@ from app.services.catalogo.catalogo_exceptions import(
     LikeNotFoundException,
     ProductNameLengthException,
     SKULengthException,
-    SellerIDException
+    SellerIDException,
+    InvalidSortFieldException,
+    MixedSortDirectionsException,
+    MultipleSortFieldsException,
+    InvalidFieldsException
     )
 from app.api.common.schemas.pagination import Paginator
+from app.integrations.cache.cache_metrics import CacheMetrics
+from app.integrations.cache.local_cache import LocalCache
 class FakeCursor:
     def __init__(self, items):
         self.items = items
@@ -51,7 +60,6 @@ class FakeCursor:
 def repository_mock():
     mock = MagicMock()
     mock.create = AsyncMock(return_value=CatalogoModel(seller_id="seller1", sku="sku1", name="product1"))
-    mock.validate_product_exist = AsyncMock(return_value=None)
     mock.find_product = AsyncMock(return_value=None)
     mock.find_by_seller_id = AsyncMock(return_value=[])
     mock.find = AsyncMock(return_value=[]) 
@@ -63,11 +71,48 @@ def repository_mock():
 def redis_mock():
     mock = AsyncMock()
     mock.get_json.return_value = None  # Simula cache vazio
+    mock.get_str.return_value = None
     mock.set_json.return_value = None
     mock.exists.return_value = False
     return mock
 
 
+class VersionedRedisStub:
+    """
+    Redis em memória com a regra de versão do SET_IF_NEWER_SCRIPT, para testar intercalações de gravações.
+    """
+
+    def __init__(self):
+        self.values = {}
+
+    async def get_json(self, key):
+        return self.values.get(key)
+
+    async def set_json(self, key, value, expires_in_seconds=None):
+        self.values[key] = value
+
+    async def set_json_if_newer(self, key, value, version, expires_in_seconds=None):
+        current = self.values.get(key)
+        if isinstance(current, dict) and current.get("version") is not None and current["version"] > version:
+            return False
+        self.values[key] = value
+        return True
+
+    async def mset_json(self, items, if_newer=False):
+        for key, value, expires_in_seconds in items:
+            if if_newer and "version" in value:
+                await self.set_json_if_newer(key, value, value["version"], expires_in_seconds)
+            else:
+                await self.set_json(key, value, expires_in_seconds)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+
+    async def delete_many(self, keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
 @pytest.fixture
 def service_with_mock(repository_mock, redis_mock):
     return CatalogoService(repository=repository_mock, redis_adapter=redis_mock)
@@ -80,69 +125,110 @@ class TestCatalogoService:
         catalogo_create = CatalogoModel(seller_id="magalu", sku="magatv", name="tv")
         repository_mock.create.return_value = catalogo_create
 
-        # Mock da IA
-        mock_ia = MagicMock()
-        mock_ia.create_description = AsyncMock(return_value={"description": "desc gerada"})
+        # Mock da fila de descrições
+        mock_queue = MagicMock()
+        mock_queue.enqueue = AsyncMock()
 
         created_catalogo = await service_with_mock.create(
             catalogo_create,
-            creating_product_description=mock_ia 
+            description_job_queue=mock_queue
         )
 
         assert created_catalogo is not None
         assert created_catalogo.seller_id == "magalu"
         assert created_catalogo.sku == "magatv"
         assert created_catalogo.name == "tv"
-        assert created_catalogo.description == "desc gerada"
+        assert created_catalogo.description is None
+        assert created_catalogo.description_status == DescriptionStatus.PENDING
         repository_mock.create.assert_called_once_with(catalogo_create)
+        mock_queue.enqueue.assert_awaited_once_with("magalu", "magatv")
 
     @pytest.mark.asyncio
-    async def test_create_product_already_exists(self, service_with_mock, repository_mock):
-        catalogo_create = CatalogoModel(seller_id="123", sku="123", name="produto1")
-        # Simula que o produto já existe
-        repository_mock.find_product.return_value = catalogo_create
+    async def test_create_catalogo_clears_not_found_cache(self, service_with_mock, repository_mock, redis_mock):
+        catalogo_create = CatalogoModel(seller_id="magalu", sku="magatv", name="tv")
+        repository_mock.create.return_value = catalogo_create
+        mock_queue = MagicMock()
+        mock_queue.enqueue = AsyncMock()
 
-        with pytest.raises(ProductAlreadyExistsException):
-            await service_with_mock.create(catalogo_create)
+        await service_with_mock.create(catalogo_create, description_job_queue=mock_queue)
+
+        redis_mock.delete_many.assert_awaited_once_with(["produto:magalu:magatv"])
 
     @pytest.mark.asyncio
-    async def test_validate_delete_success(self, service_with_mock, repository_mock):
-        repository_mock.find_product.return_value = CatalogoModel(seller_id="123", sku="123", name="tv10")
-        await service_with_mock.validate_delete("123", "123")
-        repository_mock.find_product.assert_called_once_with("123", "123")
+    async def test_create_catalogo_enqueue_failure(self, service_with_mock, repository_mock):
+        catalogo_create = CatalogoModel(seller_id="magalu", sku="magatv", name="tv")
+        repository_mock.create.return_value = catalogo_create
+
+        repository_mock.patch_by_sellerid_sku = AsyncMock()
+
+        # Falha no Redis não impede o cadastro, mas a descrição não ficaria pendente para sempre
+        mock_queue = MagicMock()
+        mock_queue.enqueue = AsyncMock(side_effect=Exception("Redis fora"))
+
+        created_catalogo = await service_with_mock.create(catalogo_create, description_job_queue=mock_queue)
+
+        assert created_catalogo.description_status == DescriptionStatus.FAILED
+        repository_mock.create.assert_called_once_with(catalogo_create)
+        repository_mock.patch_by_sellerid_sku.assert_awaited_once_with(
+            "magalu",
+            "magatv",
+            {"description_status": DescriptionStatus.FAILED},
+            condition={"description_status": DescriptionStatus.PENDING},
+        )
 
     @pytest.mark.asyncio
-    async def test_validate_delete_exception(self, service_with_mock, repository_mock):
-        repository_mock.find_product = AsyncMock(side_effect=Exception("Erro inesperado"))
-        with pytest.raises(ProductNotExistException):
-            await service_with_mock.validate_delete("qualquer", "coisa")
+    async def test_bulk_create_enqueue_failure_marks_description_failed(self, service_with_mock, repository_mock):
+        catalogos = [
+            CatalogoModel(seller_id="magalu", sku="sku1", name="produto 1"),
+            CatalogoModel(seller_id="magalu", sku="sku2", name="produto 2"),
+        ]
+        repository_mock.find_existing_sellerid_skus = AsyncMock(return_value=set())
+        repository_mock.bulk_create = AsyncMock(return_value={})
+        repository_mock.patch_by_sellerid_sku = AsyncMock()
+        mock_queue = MagicMock()
+        mock_queue.enqueue_many = AsyncMock(side_effect=Exception("Redis fora"))
+
+        results = await service_with_mock.bulk_create(catalogos, description_job_queue=mock_queue)
+
+        assert [result.created for result in results] == [True, True]
+        assert repository_mock.patch_by_sellerid_sku.await_count == 2
 
     @pytest.mark.asyncio
-    async def test_validate_delete_not_found(self, service_with_mock, repository_mock):
-        repository_mock.find_product.return_value = None
-        with pytest.raises(NotFoundException):
-            await service_with_mock.validate_delete("123", "999")
-        repository_mock.find_product.assert_called_once_with("123", "999")
+    async def test_create_product_already_exists(self, service_with_mock, repository_mock):
+        catalogo_create = CatalogoModel(seller_id="123", sku="123", name="produto1")
+        # Simula que o índice único rejeitou o insert
+        repository_mock.create.side_effect = ProductAlreadyExistsException()
+        mock_queue = MagicMock()
+        mock_queue.enqueue = AsyncMock()
+
+        with pytest.raises(ProductAlreadyExistsException):
+            await service_with_mock.create(catalogo_create, description_job_queue=mock_queue)
+
+        # Não há consulta antes do insert
+        repository_mock.find_product.assert_not_called()
+        mock_queue.enqueue.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_delete_by_seller_id_and_sku_success(self, service_with_mock, repository_mock):
-        repository_mock.find_product.return_value = CatalogoModel(seller_id="123", sku="123", name="produto1")
+    async def test_delete_by_seller_id_and_sku_success(self, service_with_mock, repository_mock, redis_mock):
         repository_mock.delete_by_sellerid_sku.return_value = True
 
         await service_with_mock.delete_by_sellerid_sku("123", "123")
 
-        repository_mock.find_product.assert_called_once_with("123", "123")
+        # Uma única ida ao banco, sem consulta prévia
+        repository_mock.find_product.assert_not_called()
         repository_mock.delete_by_sellerid_sku.assert_called_once_with("123", "123")
+        redis_mock.delete_many.assert_awaited_once_with(["produto:123:123", "produto_resposta:123:123"])
+        redis_mock.delete.assert_any_await("produto_count:123")
 
     @pytest.mark.asyncio
     async def test_delete_by_seller_id_and_sku_not_found(self, service_with_mock, repository_mock):
-        repository_mock.find_product.return_value = None
+        repository_mock.delete_by_sellerid_sku.return_value = False
 
         with pytest.raises(ProductNotExistException):
             await service_with_mock.delete_by_sellerid_sku("123", "999")
 
-        repository_mock.find_product.assert_called_once_with("123", "999")
-        repository_mock.delete_by_sellerid_sku.assert_not_called()
+        repository_mock.find_product.assert_not_called()
+        repository_mock.delete_by_sellerid_sku.assert_called_once_with("123", "999")
 
     @pytest.mark.asyncio
     async def test_save(self, service_with_mock, repository_mock):
@@ -170,9 +256,10 @@ class TestCatalogoService:
         assert result[1].sku == "sku2"
         repository_mock.find.assert_awaited_once_with(
             filters={"seller_id": "seller1"},
-            limit=paginator.limit if paginator else 50,
+            limit=paginator.limit + 1 if paginator else 50,
             offset=paginator.offset if paginator else 0,
-            sort=paginator.get_sort_order() if paginator else None
+            sort={"sku": 1},
+            collation=None
         )
 
     @pytest.mark.asyncio
@@ -186,7 +273,8 @@ class TestCatalogoService:
             filters={"seller_id": "seller1"},
             limit=50,
             offset=0,
-            sort=None
+            sort={"sku": 1},
+            collation=None
         )
 
     @pytest.mark.asyncio
@@ -202,10 +290,11 @@ class TestCatalogoService:
         assert result[0].name == "product1"
         assert result[1].name == "product2"
         repository_mock.find.assert_awaited_once_with(
-            filters={"seller_id": "seller1", "name": {"$regex": "product", "$options": "i"}},
-            limit=10,
+            filters={"seller_id": "seller1", "name_search": {"$regex": "^product"}},
+            limit=11,
             offset=0,
-            sort=paginator.get_sort_order() if paginator else None
+            sort={"sku": 1},
+            collation=None
         )
 
     @pytest.mark.asyncio
@@ -217,21 +306,228 @@ class TestCatalogoService:
             await service_with_mock.find_by_filter("seller1", paginator, name_like="nonexistent")
 
         repository_mock.find.assert_awaited_once_with(
-            filters={"seller_id": "seller1", "name": {"$regex": "nonexistent", "$options": "i"}},
-            limit=10,
+            filters={"seller_id": "seller1", "name_search": {"$regex": "^nonexistent"}},
+            limit=11,
             offset=0,
-            sort=paginator.get_sort_order() if paginator else None
+            sort={"sku": 1},
+            collation=None
         )
     
     @pytest.mark.asyncio
-    async def test_validate_product_exist_handles_exception(self, service_with_mock, repository_mock):
+    async def test_find_by_filter_with_cursor(self, service_with_mock, repository_mock):
+        catalogo1 = CatalogoModel(seller_id="seller1", sku="sku3", name="Product3")
+        repository_mock.find = AsyncMock(return_value=[catalogo1])
+        paginator = Paginator(limit=10, offset=30, sort="name:desc", request_path="/fake-path")
+        paginator.cursor = service_with_mock.build_cursor(
+            CatalogoModel(seller_id="seller1", sku="sku2", name="Produto Dois"), paginator
+        )
+
+        await service_with_mock.find_by_filter("seller1", paginator)
+
+        repository_mock.find.assert_awaited_once_with(
+            filters={
+                "seller_id": "seller1",
+                "$or": [
+                    {"name_search": {"$lt": "produto dois"}},
+                    {"name_search": "produto dois", "sku": {"$lt": "sku2"}},
+                ],
+            },
+            limit=11,
+            offset=0,
+            sort={"name_search": -1, "sku": -1},
+            collation=None
+        )
+
+    @pytest.mark.asyncio
+    async def test_find_by_filter_with_invalid_cursor(self, service_with_mock, repository_mock):
+        paginator = Paginator(limit=10, request_path="/fake-path", cursor="nao-e-um-cursor")
+
+        with pytest.raises(BadRequestException):
+            await service_with_mock.find_by_filter("seller1", paginator)
+
+        repository_mock.find.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_by_filter_saves_listing_in_cache(self, service_with_mock, repository_mock, redis_mock):
+        repository_mock.find.return_value = [CatalogoModel(seller_id="seller1", sku="sku1", name="Product")]
+        redis_mock.get_str.side_effect = ["3", None]
+
+        paginator = Paginator(limit=10, offset=0, request_path="/fake-path")
+        await service_with_mock.find_by_filter("seller1", paginator=paginator)
+
+        redis_mock.get_str.assert_any_await("lista_versao:seller1")
+        cache_key = redis_mock.set_str.await_args[0][0]
+        assert cache_key.startswith("lista:seller1:3:")
+        assert redis_mock.set_str.await_args[1]["expires_in_seconds"] == 60
+
+    @pytest.mark.asyncio
+    async def test_find_by_filter_uses_listing_cache(self, service_with_mock, repository_mock, redis_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        # O BSON guarda as datas com precisão de milissegundos, como o MongoDB
+        catalogo.created_at = catalogo.created_at.replace(microsecond=123000)
+        repository_mock.find.return_value = [catalogo]
+        stored = {}
+
+        async def set_str(key, value, expires_in_seconds=None):
+            stored[key] = value
+
+        async def get_str(key):
+            return stored.get(key)
+
+        redis_mock.set_str.side_effect = set_str
+        redis_mock.get_str.side_effect = get_str
+        paginator = Paginator(limit=10, offset=0, request_path="/fake-path")
+
+        first = await service_with_mock.find_by_filter("seller1", paginator=paginator)
+        second = await service_with_mock.find_by_filter("seller1", paginator=paginator)
+
+        assert second == first
+        repository_mock.find.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_patch_bumps_listing_version(self, service_with_mock, repository_mock, redis_mock):
+        repository_mock.patch_by_sellerid_sku = AsyncMock(
+            return_value=CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        )
+
+        await service_with_mock.patch_by_sellerid_sku("seller1", "sku1", {"description": "nova"})
+
+        redis_mock.incr.assert_awaited_once_with("lista_versao:seller1")
+
+    @pytest.mark.asyncio
+    async def test_patch_description_clears_description_status(self, service_with_mock, repository_mock):
+        repository_mock.patch_by_sellerid_sku = AsyncMock(
+            return_value=CatalogoModel(seller_id="seller1", sku="sku1", name="Product", description="nova")
+        )
+        patch = {"description": "nova"}
 
-        repository_mock.find_product = AsyncMock(side_effect=Exception("Erro inesperado"))
+        await service_with_mock.patch_by_sellerid_sku("seller1", "sku1", patch)
 
-        await service_with_mock.validate_product_exist("qualquer", "coisa")
+        repository_mock.patch_by_sellerid_sku.assert_awaited_once_with(
+            "seller1", "sku1", {"description": "nova", "description_status": None}
+        )
+        assert patch == {"description": "nova"}
+
+    @pytest.mark.asyncio
+    async def test_update_with_description_clears_description_status(self, service_with_mock, repository_mock):
+        catalogo = CatalogoModel(
+            seller_id="seller1", sku="sku1", name="Product", description="manual",
+            description_status=DescriptionStatus.PENDING,
+        )
+        repository_mock.update_by_sellerid_sku = AsyncMock(return_value=catalogo)
+
+        await service_with_mock.update_by_sellerid_sku("seller1", "sku1", catalogo)
+
+        assert repository_mock.update_by_sellerid_sku.await_args.args[2].description_status is None
+        assert repository_mock.update_by_sellerid_sku.await_args.kwargs["exclude"] is None
+
+    @pytest.mark.asyncio
+    async def test_count_by_filter_estimated_uses_cache(self, service_with_mock, repository_mock, redis_mock):
+        redis_mock.hget_json.return_value = 42
+        repository_mock.count = AsyncMock()
+
+        total = await service_with_mock.count_by_filter("Seller1", name_like="tv")
+
+        assert total == 42
+        repository_mock.count.assert_not_called()
+        assert redis_mock.hget_json.await_args[0][0] == "produto_count:seller1"
+
+    @pytest.mark.asyncio
+    async def test_count_by_filter_estimated_cache_miss(self, service_with_mock, repository_mock, redis_mock):
+        redis_mock.hget_json.return_value = None
+        repository_mock.count = AsyncMock(return_value=7)
+
+        total = await service_with_mock.count_by_filter("seller1")
+
+        assert total == 7
+        repository_mock.count.assert_awaited_once_with({"seller_id": "seller1"})
+        redis_mock.hset_json.assert_awaited_once()
+        assert redis_mock.hset_json.await_args[0][2] == 7
+
+    @pytest.mark.asyncio
+    async def test_count_by_filter_exact_skips_cache(self, service_with_mock, repository_mock, redis_mock):
+        repository_mock.count = AsyncMock(return_value=3)
+
+        total = await service_with_mock.count_by_filter("seller1", count_mode=CountMode.EXACT)
+
+        assert total == 3
+        redis_mock.hget_json.assert_not_called()
+        redis_mock.hset_json.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_by_filter_with_fields_uses_projection(self, service_with_mock, repository_mock):
+        repository_mock.find_projected = AsyncMock(return_value=[{"sku": "sku1", "name": "product1"}])
+        paginator = Paginator(limit=10, request_path="/fake-path")
+
+        result = await service_with_mock.find_by_filter("seller1", paginator, fields=["name"])
+
+        assert result == [{"sku": "sku1", "name": "product1"}]
+        repository_mock.find.assert_not_called()
+        repository_mock.find_projected.assert_awaited_once_with(
+            filters={"seller_id": "seller1"},
+            projection={"_id": 0, "name": 1, "sku": 1},
+            limit=11,
+            offset=0,
+            sort={"sku": 1},
+            collation=None
+        )
+
+    def test_parse_fields(self):
+        assert CatalogoService.parse_fields(None) is None
+        assert CatalogoService.parse_fields("sku, name,sku") == ["sku", "name"]
+
+    def test_parse_fields_invalid(self):
+        with pytest.raises(InvalidFieldsException):
+            CatalogoService.parse_fields("sku,senha")
+
+    def test_build_list_sort(self):
+        assert CatalogoService.build_list_sort(None) == {"sku": 1}
+        assert CatalogoService.build_list_sort({"name": 1}) == {"name_search": 1, "sku": 1}
+        assert CatalogoService.build_list_sort({"created_at": -1}) == {"created_at": -1, "sku": -1}
+        assert CatalogoService.build_list_sort({"sku": -1}) == {"sku": -1}
+
+    def test_build_list_sort_rejects_field_without_index(self):
+        with pytest.raises(InvalidSortFieldException):
+            CatalogoService.build_list_sort({"description": 1})
+
+    def test_build_list_sort_rejects_combined_fields(self):
+        with pytest.raises(MultipleSortFieldsException) as exc_info:
+            CatalogoService.build_list_sort({"name": 1, "created_at": 1})
+
+        assert "só um campo de ordenação" in exc_info.value.details[0]["message"]
+
+    def test_build_list_sort_rejects_mixed_directions(self):
+        with pytest.raises(MixedSortDirectionsException):
+            CatalogoService.build_list_sort({"name": 1, "sku": -1})
+
+    @pytest.mark.asyncio
+    async def test_find_by_filter_invalid_sort(self, service_with_mock, repository_mock):
+        paginator = Paginator(limit=10, request_path="/fake-path", sort="created_by:desc")
+
+        with pytest.raises(InvalidSortFieldException):
+            await service_with_mock.find_by_filter("seller1", paginator)
+
+        repository_mock.find.assert_not_called()
+
+    def test_build_name_filter_prefix_escapes_input(self):
+        name_filter = CatalogoService.build_name_filter("Câmera (4K).*", NameSearchMode.PREFIX)
+
+        assert name_filter == {"name_search": {"$regex": r"^camera\ \(4k\)\.\*"}}
+
+    def test_build_name_filter_contains(self):
+        name_filter = CatalogoService.build_name_filter("TV+", NameSearchMode.CONTAINS)
+
+        assert name_filter == {"name_search": {"$regex": r"tv\+"}}
+
+    def test_build_name_filter_word(self):
+        name_filter = CatalogoService.build_name_filter("  Smart TV ", NameSearchMode.WORD)
+
+        assert name_filter == {"$text": {"$search": "smart tv"}}
+
+    def test_build_name_filter_empty(self):
+        assert CatalogoService.build_name_filter(None) == {}
+        assert CatalogoService.build_name_filter("   ") == {}
 
-        repository_mock.find_product.assert_called_once_with("qualquer", "coisa")
-        
     @pytest.mark.asyncio
     async def test_validate_len_product_name_valid(self, service_with_mock):
         valid_names = ["Produto", "Produto com nome longo"]
@@ -271,76 +567,522 @@ class TestCatalogoService:
                 await service_with_mock.validate_len_seller_id(invalid_seller_ids)
 
     @pytest.mark.asyncio
-    async def test_validate_patch_success(self, service_with_mock, repository_mock):
-        seller_id = "seller1"
-        sku = "sku1"
-        patch_model = {"name": "Updated Product"}
-        # Simula que o produto existe
-        repository_mock.find_product.return_value = CatalogoModel(seller_id=seller_id, sku=sku, name="Old Product")
+    async def test_patch_by_sellerid_sku_success(self, service_with_mock, repository_mock, redis_mock):
+        patched = CatalogoModel(seller_id="seller1", sku="sku1", name="Updated Product")
+        repository_mock.patch_by_sellerid_sku = AsyncMock(return_value=patched)
 
-        result = await service_with_mock.validate_patch(seller_id, sku, patch_model)
+        result = await service_with_mock.patch_by_sellerid_sku("seller1", "sku1", {"name": "Updated Product"})
 
-        assert result == patch_model
-        repository_mock.find_product.assert_called_once_with(seller_id, sku)
+        assert result == patched
+        repository_mock.find_product.assert_not_called()
+        repository_mock.find_by_seller_id.assert_not_called()
+        repository_mock.patch_by_sellerid_sku.assert_awaited_once_with("seller1", "sku1", {"name": "Updated Product"})
+        redis_mock.delete_many.assert_awaited_once_with(["produto:seller1:sku1", "produto_resposta:seller1:sku1"])
+        # O nome mudou: as contagens do seller são invalidadas
+        redis_mock.delete.assert_any_await("produto_count:seller1")
 
     @pytest.mark.asyncio
-    async def test_validate_patch_not_found(self, service_with_mock, repository_mock):
-        seller_id = "seller1"
-        sku = "sku1"
-        patch_model = {"name": "Updated Product"}
-        # Simula que o produto NÃO existe
-        repository_mock.find_product.return_value = None
+    async def test_patch_by_sellerid_sku_not_found(self, service_with_mock, repository_mock, redis_mock):
+        repository_mock.patch_by_sellerid_sku = AsyncMock(return_value=None)
 
         with pytest.raises(ProductNotExistException):
-            await service_with_mock.validate_patch(seller_id, sku, patch_model)
-        repository_mock.find_product.assert_called_once_with(seller_id, sku)
-
+            await service_with_mock.patch_by_sellerid_sku("seller1", "sku1", {"name": "Updated Product"})
+        redis_mock.delete.assert_not_called()
+        redis_mock.delete_many.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_validate_update_success(self, service_with_mock, repository_mock):
-        seller_id = "seller1"
-        sku = "sku1"
-        catalogo = CatalogoModel(seller_id=seller_id, sku=sku, name="Updated Product")
-        # Simula que o produto existe
-        repository_mock.find_product.return_value = catalogo
+    async def test_update_by_sellerid_sku_success(self, service_with_mock, repository_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Updated Product")
+        repository_mock.update_by_sellerid_sku = AsyncMock(return_value=catalogo)
 
-        result = await service_with_mock.validate_update(seller_id, sku, catalogo)
+        result = await service_with_mock.update_by_sellerid_sku("seller1", "sku1", catalogo)
 
         assert result == catalogo
-        repository_mock.find_product.assert_called_once_with(seller_id, sku)
+        repository_mock.find_product.assert_not_called()
+        repository_mock.update_by_sellerid_sku.assert_awaited_once_with(
+            "seller1", "sku1", catalogo, exclude={"description", "description_status"}
+        )
 
     @pytest.mark.asyncio
-    async def test_validate_update_not_found(self, service_with_mock, repository_mock):
-        seller_id = "seller1"
-        sku = "sku1"
-        catalogo = CatalogoModel(seller_id=seller_id, sku=sku, name="Updated Product")
-        # Simula que o produto NÃO existe
-        repository_mock.find_product.return_value = None
+    async def test_update_by_sellerid_sku_not_found(self, service_with_mock, repository_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Updated Product")
+        repository_mock.update_by_sellerid_sku = AsyncMock(return_value=None)
 
         with pytest.raises(ProductNotExistException):
-            await service_with_mock.validate_update(seller_id, sku, catalogo)
-        repository_mock.find_product.assert_called_once_with(seller_id, sku)
+            await service_with_mock.update_by_sellerid_sku("seller1", "sku1", catalogo)
 
     @pytest.mark.asyncio
-    async def test_validate_patch_handles_exception(self, service_with_mock, repository_mock):
-        seller_id = "seller1"
-        sku = "sku1"
-        patch_model = {"name": "Updated Product"}
-        # Simula que find_product lança uma exceção
-        repository_mock.find_product = AsyncMock(side_effect=Exception("Erro inesperado"))
+    async def test_bulk_create_success(self, service_with_mock, repository_mock):
+        catalogos = [
+            CatalogoModel(seller_id="magalu", sku="sku1", name="produto 1"),
+            CatalogoModel(seller_id="magalu", sku="sku2", name="produto 2"),
+        ]
+        repository_mock.find_existing_sellerid_skus = AsyncMock(return_value=set())
+        repository_mock.bulk_create = AsyncMock(return_value={})
+        mock_queue = MagicMock()
+        mock_queue.enqueue_many = AsyncMock()
+
+        results = await service_with_mock.bulk_create(catalogos, description_job_queue=mock_queue)
+
+        assert [result.created for result in results] == [True, True]
+        assert all(catalogo.description_status == DescriptionStatus.PENDING for catalogo in catalogos)
+        repository_mock.find_existing_sellerid_skus.assert_awaited_once()
+        repository_mock.bulk_create.assert_awaited_once_with(catalogos)
+        mock_queue.enqueue_many.assert_awaited_once_with([("magalu", "sku1"), ("magalu", "sku2")])
 
-        with pytest.raises(ProductNotExistException):
-            await service_with_mock.validate_patch(seller_id, sku, patch_model)
-        repository_mock.find_product.assert_called_once_with(seller_id, sku)
+    @pytest.mark.asyncio
+    async def test_bulk_create_reports_errors_per_item(self, service_with_mock, repository_mock):
+        catalogos = [
+            CatalogoModel(seller_id="magalu", sku="sku1", name="produto 1"),
+            CatalogoModel(seller_id="magalu", sku="sku1", name="produto repetido"),
+            CatalogoModel(seller_id="magalu", sku="sku2", name="produto existente"),
+            CatalogoModel(seller_id="magalu", sku="sku3", name="produto 3"),
+            CatalogoModel(seller_id="magalu", sku="sku4", name="produto 4"),
+        ]
+        # Nome com apenas espaços não passa na validação de tamanho
+        catalogos[4].name = "  "
+        repository_mock.find_existing_sellerid_skus = AsyncMock(return_value={("magalu", "sku2")})
+        # sku3 falha no bulk_write por chave duplicada (cadastro concorrente)
+        repository_mock.bulk_create = AsyncMock(return_value={1: 11000})
+        mock_queue = MagicMock()
+        mock_queue.enqueue_many = AsyncMock()
+
+        results = await service_with_mock.bulk_create(catalogos, description_job_queue=mock_queue)
+
+        assert [result.index for result in results] == [0, 1, 2, 3, 4]
+        assert [result.created for result in results] == [True, False, False, False, False]
+        assert results[1].slug == "409-produto-ja-existe"
+        assert results[2].slug == "409-produto-ja-existe"
+        assert results[3].slug == "409-produto-ja-existe"
+        assert results[4].slug == "404-tamanho-nome-produto-não-permitido"
+        repository_mock.bulk_create.assert_awaited_once_with([catalogos[0], catalogos[3]])
+        mock_queue.enqueue_many.assert_awaited_once_with([("magalu", "sku1")])
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_local_cache_hit(self, repository_mock, redis_mock):
+        local_cache = LocalCache(max_size=10, ttl_seconds=60)
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        local_cache.set("produto:seller1:sku1", catalogo)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, local_cache=local_cache)
+
+        result = await service.find_by_sellerid_sku("seller1", "sku1")
+
+        assert result is catalogo
+        redis_mock.get_json.assert_not_called()
+        repository_mock.find_by_sellerid_sku.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_fills_local_cache(self, repository_mock, redis_mock):
+        local_cache = LocalCache(max_size=10, ttl_seconds=60)
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=catalogo)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, local_cache=local_cache)
+
+        await service.find_by_sellerid_sku("seller1", "sku1")
+
+        assert local_cache.get("produto:seller1:sku1") == catalogo
+
+    @pytest.mark.asyncio
+    async def test_delete_publishes_cache_invalidation(self, repository_mock, redis_mock):
+        invalidation_bus = AsyncMock()
+        repository_mock.delete_by_sellerid_sku.return_value = True
+        service = CatalogoService(
+            repository=repository_mock, redis_adapter=redis_mock, invalidation_bus=invalidation_bus
+        )
+
+        await service.delete_by_sellerid_sku("seller1", "sku1")
+
+        invalidation_bus.invalidate.assert_awaited_once_with("produto:seller1:sku1", "produto_resposta:seller1:sku1")
+
+    @pytest.mark.asyncio
+    async def test_product_response_cache_roundtrip(self, repository_mock, redis_mock):
+        local_cache = LocalCache(max_size=10, ttl_seconds=60)
+        redis_mock.get_bytes.return_value = None
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, local_cache=local_cache)
+
+        assert await service.find_product_response_in_cache("seller1", "sku1") is None
+        await service.save_product_response_in_cache("seller1", "sku1", b'{"sku":"sku1"}')
+
+        key, content = redis_mock.set_bytes.await_args[0]
+        assert (key, content) == ("produto_resposta:seller1:sku1", b'{"sku":"sku1"}')
+        # A próxima leitura sai do cache local, sem ir ao Redis
+        assert await service.find_product_response_in_cache("seller1", "sku1") == b'{"sku":"sku1"}'
+        redis_mock.get_bytes.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_product_for_response_from_database_is_cacheable(self, repository_mock, redis_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=catalogo)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock)
+
+        result, cacheable = await service.find_product_for_response("seller1", "sku1")
+
+        assert result == catalogo
+        assert cacheable is True
+
+    @pytest.mark.asyncio
+    async def test_find_product_for_response_fresh_entry_is_cacheable(self, repository_mock, redis_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        redis_mock.get_json.return_value = {
+            "soft_expires_at": time.time() + 60,
+            "data": catalogo.model_dump(mode="json"),
+        }
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock)
+
+        _, cacheable = await service.find_product_for_response("seller1", "sku1")
+
+        assert cacheable is True
+
+    @pytest.mark.asyncio
+    async def test_find_product_for_response_stale_entry_is_not_cacheable(self, repository_mock, redis_mock):
+        stale = CatalogoModel(seller_id="seller1", sku="sku1", name="Antigo")
+        redis_mock.get_json.return_value = {"soft_expires_at": time.time() - 1, "data": stale.model_dump(mode="json")}
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=stale)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock)
+
+        result, cacheable = await service.find_product_for_response("seller1", "sku1")
+
+        assert result.name == "Antigo"
+        assert cacheable is False
+        await asyncio.gather(*service._background_tasks)
+
+    @pytest.mark.asyncio
+    async def test_find_product_for_response_local_cache_hit_is_not_cacheable(self, repository_mock, redis_mock):
+        local_cache = LocalCache(max_size=10, ttl_seconds=60)
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        local_cache.set("produto:seller1:sku1", catalogo)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, local_cache=local_cache)
+
+        result, cacheable = await service.find_product_for_response("seller1", "sku1")
+
+        assert result is catalogo
+        assert cacheable is False
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_concurrent_misses_query_once(self, service_with_mock, repository_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        release = asyncio.Event()
+
+        async def find_by_sellerid_sku(seller_id, sku):
+            await release.wait()
+            return catalogo
+
+        repository_mock.find_by_sellerid_sku = AsyncMock(side_effect=find_by_sellerid_sku)
+
+        pending = [
+            asyncio.create_task(service_with_mock.find_by_sellerid_sku("seller1", "sku1")) for _ in range(10)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert all(result == catalogo for result in results)
+        repository_mock.find_by_sellerid_sku.assert_awaited_once_with("seller1", "sku1")
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_waits_for_other_process_lock(self, repository_mock, redis_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        lock = AsyncMock()
+        lock.acquire.return_value = False
+        redis_mock.lock = MagicMock(return_value=lock)
+        # Primeira leitura: cache vazio; enquanto aguarda o lock, outro processo preenche o cache
+        redis_mock.get_json.side_effect = [None, catalogo.model_dump(mode="json")]
+        service = CatalogoService(
+            repository=repository_mock, redis_adapter=redis_mock, cache_lock_enabled=True, cache_lock_timeout_seconds=1
+        )
+
+        result = await service.find_by_sellerid_sku("seller1", "sku1")
+
+        assert result.sku == "sku1"
+        redis_mock.lock.assert_called_once_with("lock:produto:seller1:sku1", timeout=1)
+        repository_mock.find_by_sellerid_sku.assert_not_called()
+        lock.release.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_lock_owner_loads_and_releases(self, repository_mock, redis_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        lock = AsyncMock()
+        lock.acquire.return_value = True
+        redis_mock.lock = MagicMock(return_value=lock)
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=catalogo)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, cache_lock_enabled=True)
+
+        result = await service.find_by_sellerid_sku("seller1", "sku1")
+
+        assert result == catalogo
+        redis_mock.set_json.assert_awaited_once()
+        lock.release.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_saves_envelope_with_soft_and_hard_ttl(self, repository_mock, redis_mock):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=catalogo)
+        service = CatalogoService(
+            repository=repository_mock,
+            redis_adapter=redis_mock,
+            cache_soft_ttl_seconds=100,
+            cache_hard_ttl_seconds=200,
+            cache_ttl_jitter=0.1,
+        )
+
+        await service.find_by_sellerid_sku("seller1", "sku1")
+
+        key, entry = redis_mock.set_json.await_args[0]
+        assert key == "produto:seller1:sku1"
+        assert entry["data"]["sku"] == "sku1"
+        assert 180 <= redis_mock.set_json.await_args[1]["expires_in_seconds"] <= 220
+        assert entry["soft_expires_at"] > time.time() + 80
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_serves_stale_and_refreshes(self, repository_mock, redis_mock):
+        stale = CatalogoModel(seller_id="seller1", sku="sku1", name="Antigo")
+        fresh = CatalogoModel(seller_id="seller1", sku="sku1", name="Novo")
+        redis_mock.get_json.return_value = {"soft_expires_at": time.time() - 1, "data": stale.model_dump(mode="json")}
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=fresh)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock)
+
+        result = await service.find_by_sellerid_sku("seller1", "sku1")
+        result_again = await service.find_by_sellerid_sku("seller1", "sku1")
+
+        assert result.name == "Antigo"
+        assert result_again.name == "Antigo"
+        await asyncio.gather(*service._background_tasks)
+        repository_mock.find_by_sellerid_sku.assert_awaited_once_with("seller1", "sku1")
+        assert redis_mock.set_json.await_args[0][1]["data"]["name"] == "Novo"
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_fresh_entry_does_not_refresh(
+        self, service_with_mock, repository_mock, redis_mock
+    ):
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        redis_mock.get_json.return_value = {
+            "soft_expires_at": time.time() + 60,
+            "data": catalogo.model_dump(mode="json"),
+        }
+
+        result = await service_with_mock.find_by_sellerid_sku("seller1", "sku1")
+
+        assert result == catalogo
+        assert not service_with_mock._background_tasks
+        repository_mock.find_by_sellerid_sku.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_validate_update_handles_exception(self, service_with_mock, repository_mock):
-        seller_id = "seller1"
-        sku = "sku1"
-        catalogo = CatalogoModel(seller_id=seller_id, sku=sku, name="Updated Product")
-        # Simula que find_product lança uma exceção
-        repository_mock.find_product = AsyncMock(side_effect=Exception("Erro inesperado"))
+    async def test_find_by_sellerid_sku_miss_saves_not_found_marker(
+        self, service_with_mock, repository_mock, redis_mock
+    ):
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=None)
+
+        result = await service_with_mock.find_by_sellerid_sku("seller1", "sku1", raises_exception=False)
+
+        assert result is None
+        redis_mock.set_json.assert_awaited_once_with("produto:seller1:sku1", {"not_found": True}, expires_in_seconds=30)
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_not_found_marker_skips_database(
+        self, service_with_mock, repository_mock, redis_mock
+    ):
+        redis_mock.get_json.return_value = {"not_found": True}
+        repository_mock.find_by_sellerid_sku = AsyncMock()
 
         with pytest.raises(ProductNotExistException):
-            await service_with_mock.validate_update(seller_id, sku, catalogo)
-        repository_mock.find_product.assert_called_once_with(seller_id, sku)
\ No newline at end of file
+            await service_with_mock.find_by_sellerid_sku("seller1", "sku1")
+
+        repository_mock.find_by_sellerid_sku.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_database_error_is_not_cached(
+        self, service_with_mock, repository_mock, redis_mock
+    ):
+        repository_mock.find_by_sellerid_sku = AsyncMock(side_effect=Exception("Mongo fora"))
+
+        result = await service_with_mock.find_by_sellerid_sku("seller1", "sku1", raises_exception=False)
+
+        assert result is None
+        redis_mock.set_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_many_by_sellerid_skus_reads_cache_and_loads_misses(
+        self, service_with_mock, repository_mock, redis_mock
+    ):
+        cached = CatalogoModel(seller_id="seller1", sku="sku1", name="Cache")
+        loaded = CatalogoModel(seller_id="seller1", sku="sku2", name="Banco")
+        redis_mock.mget_json.return_value = [
+            {"soft_expires_at": time.time() + 60, "data": cached.model_dump(mode="json")},
+            None,
+            {"not_found": True},
+            None,
+        ]
+        repository_mock.find_by_sellerid_skus = AsyncMock(return_value=[loaded])
+
+        found = await service_with_mock.find_many_by_sellerid_skus(
+            [("seller1", "sku1"), ("seller1", "sku2"), ("seller1", "sku3"), ("seller1", "sku4"), ("seller1", "sku1")]
+        )
+
+        assert found == {("seller1", "sku1"): cached, ("seller1", "sku2"): loaded}
+        redis_mock.mget_json.assert_awaited_once_with(
+            ["produto:seller1:sku1", "produto:seller1:sku2", "produto:seller1:sku3", "produto:seller1:sku4"]
+        )
+        repository_mock.find_by_sellerid_skus.assert_awaited_once_with([("seller1", "sku2"), ("seller1", "sku4")])
+        to_cache = redis_mock.mset_json.await_args[0][0]
+        assert [key for key, _, _ in to_cache] == ["produto:seller1:sku2", "produto:seller1:sku4"]
+        assert to_cache[1][1:] == ({"not_found": True}, 30)
+
+    @pytest.mark.asyncio
+    async def test_find_many_by_sellerid_skus_all_cached_skips_database(
+        self, service_with_mock, repository_mock, redis_mock
+    ):
+        cached = CatalogoModel(seller_id="seller1", sku="sku1", name="Cache")
+        redis_mock.mget_json.return_value = [cached.model_dump(mode="json")]
+        repository_mock.find_by_sellerid_skus = AsyncMock()
+
+        found = await service_with_mock.find_many_by_sellerid_skus([("seller1", "sku1")])
+
+        assert found == {("seller1", "sku1"): cached}
+        repository_mock.find_by_sellerid_skus.assert_not_called()
+        redis_mock.mset_json.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_patch_write_through_caches_returned_document(self, repository_mock, redis_mock):
+        patched = CatalogoModel(seller_id="seller1", sku="sku1", name="Novo")
+        patched.updated_at = patched.created_at
+        repository_mock.patch_by_sellerid_sku = AsyncMock(return_value=patched)
+        invalidation_bus = AsyncMock()
+        service = CatalogoService(
+            repository=repository_mock,
+            redis_adapter=redis_mock,
+            invalidation_bus=invalidation_bus,
+            cache_write_through=True,
+        )
+
+        await service.patch_by_sellerid_sku("seller1", "sku1", {"name": "Novo"})
+
+        key, entry, version = redis_mock.set_json_if_newer.await_args[0]
+        assert key == "produto:seller1:sku1"
+        assert entry["data"]["name"] == "Novo"
+        assert version == int(patched.updated_at.timestamp() * 1000)
+        redis_mock.delete.assert_any_await("produto_resposta:seller1:sku1")
+        redis_mock.delete_many.assert_not_called()
+        invalidation_bus.invalidate.assert_awaited_once_with("produto:seller1:sku1", "produto_resposta:seller1:sku1")
+
+    @pytest.mark.asyncio
+    async def test_create_write_through_overwrites_not_found_marker(self, repository_mock, redis_mock):
+        created = CatalogoModel(seller_id="magalu", sku="magatv", name="tv")
+        created.updated_at = created.created_at
+        repository_mock.create.return_value = created
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, cache_write_through=True)
+        mock_queue = MagicMock()
+        mock_queue.enqueue = AsyncMock()
+
+        await service.create(created, description_job_queue=mock_queue)
+
+        assert redis_mock.set_json_if_newer.await_args[0][0] == "produto:magalu:magatv"
+        redis_mock.delete_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_delete_write_through_writes_versioned_tombstone(self, repository_mock, redis_mock):
+        repository_mock.delete_by_sellerid_sku = AsyncMock(return_value=True)
+        invalidation_bus = AsyncMock()
+        service = CatalogoService(
+            repository=repository_mock,
+            redis_adapter=redis_mock,
+            invalidation_bus=invalidation_bus,
+            cache_write_through=True,
+        )
+        before = int(time.time() * 1000)
+
+        await service.delete_by_sellerid_sku("seller1", "sku1")
+
+        key, entry, version = redis_mock.set_json_if_newer.await_args[0]
+        assert key == "produto:seller1:sku1"
+        assert entry == {"not_found": True, "version": version}
+        assert version >= before
+        redis_mock.delete.assert_any_await("produto_resposta:seller1:sku1")
+        redis_mock.delete_many.assert_not_called()
+        invalidation_bus.invalidate.assert_awaited_once_with("produto:seller1:sku1", "produto_resposta:seller1:sku1")
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_tombstone_is_not_found(self, repository_mock, redis_mock):
+        redis_mock.get_json.return_value = {"not_found": True, "version": 1}
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, cache_write_through=True)
+
+        assert await service.find_by_sellerid_sku("seller1", "sku1", raises_exception=False) is None
+        repository_mock.find_by_sellerid_sku.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_late_not_found_marker_does_not_overwrite_created_product(self, repository_mock):
+        redis = VersionedRedisStub()
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis, cache_write_through=True)
+        created = CatalogoModel(seller_id="seller1", sku="sku1", name="Novo")
+
+        async def find_while_product_is_created(seller_id, sku):
+            # O produto é cadastrado (e gravado no cache) depois que o banco respondeu "inexistente"
+            created.created_at = created.updated_at = datetime.now(timezone.utc) + timedelta(milliseconds=5)
+            await service.cache_written_product(seller_id, sku, created)
+            return None
+
+        repository_mock.find_by_sellerid_sku = AsyncMock(side_effect=find_while_product_is_created)
+
+        assert await service.find_by_sellerid_sku("seller1", "sku1", raises_exception=False) is None
+
+        repository_mock.find_by_sellerid_sku = AsyncMock()
+        found = await service.find_by_sellerid_sku("seller1", "sku1")
+        assert found.name == "Novo"
+        repository_mock.find_by_sellerid_sku.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_many_late_not_found_marker_does_not_overwrite_created_product(self, repository_mock):
+        redis = VersionedRedisStub()
+        redis.mget_json = AsyncMock(return_value=[None])
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis, cache_write_through=True)
+        created = CatalogoModel(seller_id="seller1", sku="sku1", name="Novo")
+
+        async def find_while_product_is_created(seller_skus):
+            created.created_at = created.updated_at = datetime.now(timezone.utc) + timedelta(milliseconds=5)
+            await service.cache_written_product("seller1", "sku1", created)
+            return []
+
+        repository_mock.find_by_sellerid_skus = AsyncMock(side_effect=find_while_product_is_created)
+
+        assert await service.find_many_by_sellerid_skus([("seller1", "sku1")]) == {}
+
+        assert redis.values["produto:seller1:sku1"]["data"]["name"] == "Novo"
+
+    @pytest.mark.asyncio
+    async def test_not_found_marker_without_write_through_has_no_version(self, repository_mock, redis_mock):
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=None)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock)
+
+        await service.find_by_sellerid_sku("seller1", "sku1", raises_exception=False)
+
+        redis_mock.set_json.assert_awaited_once_with("produto:seller1:sku1", {"not_found": True}, expires_in_seconds=30)
+        redis_mock.set_json_if_newer.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_write_through_failure_evicts_product(self, repository_mock, redis_mock):
+        updated = CatalogoModel(seller_id="seller1", sku="sku1", name="Novo")
+        updated.updated_at = updated.created_at
+        repository_mock.update_by_sellerid_sku = AsyncMock(return_value=updated)
+        redis_mock.set_json_if_newer.side_effect = Exception("Redis fora")
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, cache_write_through=True)
+
+        await service.update_by_sellerid_sku("seller1", "sku1", updated)
+
+        redis_mock.delete_many.assert_awaited_once_with(["produto:seller1:sku1", "produto_resposta:seller1:sku1"])
+
+    @pytest.mark.asyncio
+    async def test_find_by_sellerid_sku_records_cache_metrics(self, repository_mock, redis_mock):
+        cache_metrics = CacheMetrics()
+        catalogo = CatalogoModel(seller_id="seller1", sku="sku1", name="Product")
+        repository_mock.find_by_sellerid_sku = AsyncMock(return_value=catalogo)
+        service = CatalogoService(repository=repository_mock, redis_adapter=redis_mock, cache_metrics=cache_metrics)
+
+        await service.find_by_sellerid_sku("seller1", "sku1")
+        redis_mock.get_json.return_value = {"not_found": True}
+        await service.find_by_sellerid_sku("seller1", "sku2", raises_exception=False)
+        redis_mock.get_json.return_value = catalogo.model_dump(mode="json")
+        await service.find_by_sellerid_sku("seller1", "sku1")
+
+        assert cache_metrics.misses.get("produto") == 1
+        assert cache_metrics.negative_hits.get("produto") == 1
+        assert cache_metrics.hits.get("produto") == 1
+        assert cache_metrics.load_seconds.get_count("produto") == 1